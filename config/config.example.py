@@ -17,7 +17,10 @@ MODEL_CONFIG = {
         "gpt-4o",        # 最强大的多模态模型
         "gpt-4-turbo",   # 强大的文本模型
         "gpt-3.5-turbo"  # 经济实惠的模型
-    ]
+    ],
+    # 账户的速率限额，发送请求前按此限速，避免触发429错误
+    "requests_per_minute": 500,  # 每分钟请求数
+    "tokens_per_minute": 30000  # 每分钟token数
 }
 
 # RSS源配置（可选，如需修改默认RSS源可在此处配置）
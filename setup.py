@@ -14,7 +14,6 @@ setup(
     install_requires=[
         "feedparser>=6.0.10",
         "requests>=2.31.0",
-        "beautifulsoup4>=4.12.2",
         "openai>=1.55.3",
         "schedule>=1.2.1",
         "python-dateutil>=2.8.2",
@@ -23,6 +22,9 @@ setup(
         "httpx<0.28",
         "tqdm>=4.65.0",
         "colorama>=0.4.6",
+        "aiohttp>=3.9.0",
+        "aiofiles>=23.1.0",
+        "selectolax>=0.3.21",
     ],
     classifiers=[
         "Development Status :: 4 - Beta",
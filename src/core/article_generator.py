@@ -11,22 +11,60 @@ import os
 import logging
 import json
 import time
-from typing import Dict, Any, Optional, List
+import asyncio
+import hashlib
+import functools
+import re
+import string
+from collections import deque
+from typing import Dict, Any, Optional, List, Callable, AsyncIterator, Tuple, Deque, Set
+import aiofiles
+import httpx
 import openai
-from openai import OpenAI
-from tqdm import tqdm
+from openai import AsyncOpenAI
 import colorama
 from colorama import Fore, Style
 import random  # 添加random模块导入
+import sys
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.storage.article_storage import (
+    get_cached_title, get_cached_titles, save_cached_title, save_cached_titles,
+    get_cached_article_async, save_cached_article_async
+)
+
+# 尝试导入tiktoken，用于在发送请求前准确估算提示的token数量
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+# 检查是否安装了h2，安装后与OpenAI之间的连接使用HTTP/2，并发请求共用同一个连接
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
 
 # 初始化colorama
 colorama.init()
 
-# 记录最近使用的风格索引，使用一个列表来存储
-# 默认记录最近3种风格，如果风格总数少于3，则记录所有风格
-RECENT_USED_STYLES: List[int] = []
 # 最大记录的历史风格数量
 MAX_STYLE_HISTORY = 3
+# 记录最近使用的风格索引，最近使用的在最前面，超过MAX_STYLE_HISTORY时自动丢弃最早的记录
+RECENT_USED_STYLES: Deque[int] = deque(maxlen=MAX_STYLE_HISTORY)
+# RECENT_USED_STYLES的集合形式，用于选择风格时排除最近使用的风格
+_RECENT_STYLE_SET: Set[int] = set()
+
+# 优化标题时需要去除的中英文引号，以及模型可能附带的前缀
+_TITLE_QUOTE_TABLE = str.maketrans('', '', '"\'\u201c\u201d\u2018\u2019')
+_TITLE_PREFIX_PATTERN = re.compile(r'^(优化标题|优化后的标题)[:：]\s*')
+
+# 进程内的标题优化缓存，键为原标题和模型的哈希值
+_TITLE_CACHE: Dict[str, str] = {}
 
 # 导入配置
 try:
@@ -35,39 +73,181 @@ try:
     logger.info("已从config.py加载API密钥和模型配置")
     # 获取默认模型
     DEFAULT_MODEL = MODEL_CONFIG.get("default_model", "gpt-4o")
+    # 账户的每分钟请求数和每分钟token数限额
+    REQUESTS_PER_MINUTE = MODEL_CONFIG.get("requests_per_minute", 500)
+    TOKENS_PER_MINUTE = MODEL_CONFIG.get("tokens_per_minute", 30000)
 except ImportError:
     logger = logging.getLogger(__name__)
     logger.warning("未找到config.py文件，尝试从环境变量加载API密钥")
     OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
     DEFAULT_MODEL = "gpt-4o"  # 默认模型
+    REQUESTS_PER_MINUTE = 500  # 每分钟请求数限额
+    TOKENS_PER_MINUTE = 30000  # 每分钟token数限额
     if not OPENAI_API_KEY:
         logger.warning("未设置OPENAI_API_KEY环境变量，请创建config.py文件或设置环境变量")
 
-# 创建OpenAI客户端
-# 修复proxies参数问题
-try:
-    client = OpenAI(api_key=OPENAI_API_KEY)
-except TypeError as e:
-    if "unexpected keyword argument 'proxies'" in str(e):
-        logger.warning("检测到OpenAI库版本与proxies参数不兼容，尝试不使用代理初始化客户端")
-        # 尝试不使用代理初始化
-        client = OpenAI(api_key=OPENAI_API_KEY)
-    else:
-        raise
+# OpenAI请求共用的连接池大小，保持足够的长连接，避免并发生成时反复建立TLS连接
+OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """创建OpenAI客户端使用的HTTP连接池，安装了h2时启用HTTP/2"""
+    return openai.DefaultAsyncHttpxClient(http2=HAS_HTTP2, limits=OPENAI_HTTP_LIMITS)
+
+
+# OpenAI异步客户端在首次使用时创建，记录创建时的进程和事件循环
+_client: Optional[AsyncOpenAI] = None
+_client_pid: Optional[int] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_client() -> AsyncOpenAI:
+    """
+    获取OpenAI异步客户端，必须在事件循环中调用
+    
+    客户端在首次使用时才创建，导入模块时不会初始化连接池。fork出的子进程或新的事件循环
+    会各自创建新的客户端，不会复用其他进程或已关闭事件循环中的连接。
+    客户端的连接池应在创建它的事件循环结束前通过close_client关闭，run_async会自动完成这一步。
+    
+    Returns:
+        当前进程和事件循环使用的AsyncOpenAI客户端
+    """
+    global _client, _client_pid, _client_loop
+    pid = os.getpid()
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_pid != pid or _client_loop is not loop:
+        if _client is not None and _client_pid == pid:
+            logger.warning("上一个事件循环中的OpenAI客户端未关闭，请使用run_async运行异步任务")
+        _client = AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=_create_http_client())
+        _client_pid = pid
+        _client_loop = loop
+    return _client
+
+
+async def close_client() -> None:
+    """关闭当前事件循环创建的OpenAI客户端及其连接池，之后再次使用时重新创建"""
+    global _client, _client_pid, _client_loop
+    if _client is not None and _client_pid == os.getpid() and _client_loop is asyncio.get_running_loop():
+        client = _client
+        _client = _client_pid = _client_loop = None
+        await client.close()
+
+
+def run_async(coro: Any) -> Any:
+    """
+    在新的事件循环中运行协程，结束前关闭该事件循环中创建的OpenAI客户端
+    
+    同步接口和命令行入口都通过此函数运行异步任务，避免每次asyncio.run遗留未关闭的连接。
+    
+    Args:
+        coro: 要运行的协程
+        
+    Returns:
+        协程的返回值
+    """
+    async def run() -> Any:
+        try:
+            return await coro
+        finally:
+            await close_client()
+    
+    return asyncio.run(run())
+
+
+# 重试前最长等待时间（秒）
+RETRY_MAX_WAIT = 30
+
+# 文章生成的系统提示
+ARTICLE_SYSTEM_PROMPT = "你是一位专业的AI领域科技记者，擅长撰写社交媒体平台的爆款文章。你的文章充满情绪化表达、悬念设置和互动元素，能引发大量阅读、点赞和分享。你善于将复杂的AI技术用通俗易懂的方式解释。"
+
+# 文章生成的请求参数
+ARTICLE_COMPLETION_PARAMS = {
+    "temperature": 0.8,  # 控制创造性
+    "max_tokens": 2000,  # 最大输出长度
+    "top_p": 0.95,
+    "frequency_penalty": 0.5,  # 减少重复
+    "presence_penalty": 0.5,  # 鼓励多样性
+}
+
+# 各模型的上下文窗口大小（token），未列出的模型按DEFAULT_CONTEXT_WINDOW处理
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-4o": 128000,
+    "gpt-4o-mini": 128000,
+    "gpt-4-turbo": 128000,
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+}
+DEFAULT_CONTEXT_WINDOW = 128000
+# 计算输出长度上限时为消息格式开销和估算误差预留的token数量
+CONTEXT_WINDOW_MARGIN = 64
 
 # 文章生成提示模板 - 基础模板
+# 固定的风格要求放在前面、每条新闻不同的内容放在最后，
+# 使同一风格的请求前缀完全相同，可以命中OpenAI的自动提示缓存
 ARTICLE_PROMPT_TEMPLATE_BASE = """
-你是一位专业的AI领域科技记者，需要根据以下新闻信息撰写一篇文章。
+你是一位专业的AI领域科技记者，需要根据文末的新闻信息撰写一篇文章。
+
+{style_instructions}
+
+请直接输出完整的文章内容，不需要包含任何额外的说明。确保文章风格符合要求，能够吸引大量阅读和分享。
 
 新闻标题: {title}
 新闻摘要: {summary}
 新闻链接: {link}
 发布日期: {published_date}
+"""
 
-{style_instructions}
+# 标题优化的系统提示
+TITLE_SYSTEM_PROMPT = "你是一位今日头条平台的爆款标题专家，擅长创作能引发大量点击和分享的标题。"
 
-请直接输出完整的文章内容，不需要包含任何额外的说明。确保文章风格符合要求，能够吸引大量阅读和分享。
-"""
+# 标题优化规则，单个和批量优化标题共用
+TITLE_RULES = """1. 使用以下任一开头：
+   - 震惊！
+   - 重磅！
+   - 突发！
+   - 独家！
+   - 紧急扩散！
+   - 刚刚！
+
+2. 或使用以下标题公式：
+   - 数字清单：如"3个信号暗示AI已超越人类智能"
+   - 悬念设问：如"AI真的能取代人类工作吗？答案让人意外"
+   - 对比反差：如"曾被看衰的AI技术，如今竟能做到这一步"
+   - 情感刺激：如"看完这个AI演示，所有人都惊呆了"
+
+3. 标题要素：
+   - 使用夸张但不失真的表达
+   - 加入情绪化词汇
+   - 制造信息差或悬念
+   - 暗示稀缺或独家信息
+   - 强调时效性和紧迫感
+
+4. 长度控制在15-25字之间，确保吸引眼球但不过于冗长"""
+
+# 标题优化提示模板
+TITLE_PROMPT_TEMPLATE = "请将以下AI新闻标题改写成今日头条平台的爆款标题，遵循以下规则：\n\n" + TITLE_RULES + """
+
+原标题: {title}
+
+请直接给出优化后的爆款标题，不要包含任何解释。"""
+
+# 批量优化标题的提示模板，要求模型按顺序返回JSON数组
+TITLE_BULK_PROMPT_TEMPLATE = "请将以下{count}个AI新闻标题分别改写成今日头条平台的爆款标题，每个标题都遵循以下规则：\n\n" + TITLE_RULES + """
+
+原标题:
+{titles}
+
+请以JSON对象返回结果，格式为{{"titles": ["优化后的标题1", "优化后的标题2"]}}，按原标题的顺序给出{count}个优化后的标题，不要包含任何解释。"""
+
+# 批量优化标题时每个请求包含的最大标题数量
+TITLE_BULK_SIZE = 20
+
+# 标题优化的请求参数
+TITLE_COMPLETION_PARAMS = {
+    "temperature": 0.8,
+    "max_tokens": 50,
+    "top_p": 0.95,
+}
 
 # 定义多种文章风格
 ARTICLE_STYLES = [
@@ -218,10 +398,157 @@ ARTICLE_STYLES = [
 """
 ]
 
+class OpenAIRateLimiter:
+    """
+    OpenAI请求的令牌桶限速器，同时限制每分钟请求数和每分钟token数
+    
+    发送请求前按估算的token数量预约额度，额度不足时等待补充，使请求速度保持在账户限额以内，
+    而不是等到返回429后再退避重试；请求完成后按实际用量修正预约的token数量。
+    """
+    
+    def __init__(self, requests_per_minute: float = REQUESTS_PER_MINUTE,
+                 tokens_per_minute: float = TOKENS_PER_MINUTE):
+        """
+        初始化限速器
+        
+        Args:
+            requests_per_minute: 每分钟允许的请求数量
+            tokens_per_minute: 每分钟允许的token数量（提示和生成内容合计）
+        """
+        self.request_rate = requests_per_minute / 60
+        self.token_rate = tokens_per_minute / 60
+        self.request_burst = float(requests_per_minute)
+        self.token_burst = float(tokens_per_minute)
+        self._requests = self.request_burst
+        self._tokens = self.token_burst
+        self._updated = time.monotonic()
+    
+    def _refill(self) -> None:
+        """按经过的时间补充两个令牌桶"""
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._requests = min(self.request_burst, self._requests + elapsed * self.request_rate)
+        self._tokens = min(self.token_burst, self._tokens + elapsed * self.token_rate)
+        self._updated = now
+    
+    async def acquire(self, tokens: int) -> None:
+        """
+        预约一次请求和指定数量的token，必要时等待
+        
+        Args:
+            tokens: 本次请求预计消耗的token数量
+        """
+        self._refill()
+        # 额度可以为负数，表示已经被排队的请求预约，后来的请求需要等待更久
+        self._requests -= 1
+        self._tokens -= tokens
+        wait = max(-self._requests / self.request_rate, -self._tokens / self.token_rate)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def reconcile(self, estimated: int, actual: Optional[int]) -> None:
+        """
+        请求完成后按实际用量修正预约的token数量
+        
+        Args:
+            estimated: 预约时估算的token数量
+            actual: 响应中报告的实际token数量，未报告时不做修正
+        """
+        if actual is not None:
+            self._refill()
+            self._tokens = min(self.token_burst, self._tokens + estimated - actual)
+
+
+# 所有OpenAI请求共用的限速器
+rate_limiter = OpenAIRateLimiter()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str) -> "tiktoken.Encoding":
+    """获取模型使用的分词器，每个模型只加载一次"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def _estimate_tokens(messages: List[Dict[str, str]], model: str) -> int:
+    """
+    估算消息列表的token数量
+    
+    安装了tiktoken时使用模型的分词器计算，否则按UTF-8字节数粗略估算（中文约每个字一个token）。
+    
+    Args:
+        messages: OpenAI chat接口使用的消息列表
+        model: 要使用的模型名称
+        
+    Returns:
+        估算的token数量，包含每条消息的格式开销
+    """
+    if HAS_TIKTOKEN:
+        encoding = _get_encoding(model)
+        return sum(len(encoding.encode(message["content"])) + 4 for message in messages)
+    return sum(len(message["content"].encode("utf-8")) // 3 + 4 for message in messages)
+
+
+def _article_max_tokens(model: str, prompt_tokens: int) -> int:
+    """
+    计算文章生成请求的最大输出长度
+    
+    不超过ARTICLE_COMPLETION_PARAMS中的max_tokens，同时保证提示加输出不超出模型的上下文窗口。
+    
+    Args:
+        model: 要使用的模型名称
+        prompt_tokens: _estimate_tokens估算的提示token数量
+        
+    Returns:
+        本次请求使用的max_tokens
+    """
+    context_window = MODEL_CONTEXT_WINDOWS.get(model, DEFAULT_CONTEXT_WINDOW)
+    return max(min(ARTICLE_COMPLETION_PARAMS["max_tokens"], context_window - prompt_tokens - CONTEXT_WINDOW_MARGIN), 1)
+
+
+def _compile_article_prompt(style_instructions: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    将一种风格的文章提示模板预先拆分为固定文本和新闻字段
+    
+    风格要求直接并入固定文本，生成文章时只需依次拼接固定文本和新闻字段，不必每次重新解析模板。
+    
+    Args:
+        style_instructions: 风格要求
+        
+    Returns:
+        (固定文本, 紧随其后的新闻字段名)列表，最后一项的字段名为None
+    """
+    parts = []
+    literal = ""
+    for text, field, _, _ in string.Formatter().parse(ARTICLE_PROMPT_TEMPLATE_BASE):
+        literal += text
+        if field == "style_instructions":
+            literal += style_instructions
+        elif field is not None:
+            parts.append((literal, field))
+            literal = ""
+    parts.append((literal, None))
+    return parts
+
+
+# 每种风格预先拆分好的文章提示模板，与ARTICLE_STYLES一一对应
+ARTICLE_PROMPT_PARTS = [_compile_article_prompt(style) for style in ARTICLE_STYLES]
+
+# 系统提示、提示模板和所有风格要求的摘要，作为文章缓存键的一部分
+_ARTICLE_PROMPT_DIGEST = hashlib.blake2b(
+    "\n".join([ARTICLE_SYSTEM_PROMPT, ARTICLE_PROMPT_TEMPLATE_BASE, *ARTICLE_STYLES]).encode("utf-8"),
+    digest_size=16
+).digest()
+
+
 def print_status(message, status="信息", color=Fore.BLUE):
     """
     打印带颜色的状态信息
     
+    本模块中的调用都放在if verbose判断之内，关闭详细输出时既不拼接消息也不写终端。
+    
     Args:
         message: 要显示的消息
         status: 状态文本
@@ -232,32 +559,18 @@ def print_status(message, status="信息", color=Fore.BLUE):
     print(f"[{timestamp}] {status_text} {message}")
 
 
-def generate_article(news: Dict[str, Any], model: str = None, max_retries: int = 3, verbose: bool = False, 
-                    specific_style: int = None) -> Optional[str]:
+def _select_style(specific_style: Optional[int] = None, verbose: bool = False) -> int:
     """
-    使用OpenAI模型生成文章
+    选择本次生成使用的文章风格，并更新最近使用的风格历史
     
     Args:
-        news: 新闻信息，包含title, summary, link, published_date
-        model: 要使用的模型名称，如果为None则使用默认模型
-        max_retries: 最大重试次数
-        verbose: 是否显示详细进度
         specific_style: 指定使用的风格索引（从1开始），如果为None则自动选择
+        verbose: 是否显示详细进度
         
     Returns:
-        生成的文章内容，如果生成失败则返回None
+        风格索引（从0开始）
     """
-    global RECENT_USED_STYLES  # 声明使用全局变量
-    
-    if not OPENAI_API_KEY:
-        if verbose:
-            print_status("未设置API密钥，请在config.py中设置OPENAI_API_KEY", "错误", Fore.RED)
-        logger.error("未设置API密钥，请在config.py中设置OPENAI_API_KEY")
-        return None
-    
-    # 如果未指定模型，使用默认模型
-    if model is None:
-        model = DEFAULT_MODEL
+    global RECENT_USED_STYLES, _RECENT_STYLE_SET  # 声明使用全局变量
     
     total_styles = len(ARTICLE_STYLES)
     
@@ -276,102 +589,279 @@ def generate_article(news: Dict[str, Any], model: str = None, max_retries: int =
         else:
             if verbose:
                 print_status(f"使用指定的文章风格 {specific_style}", "风格", Fore.CYAN)
-            logger.info(f"使用指定的文章风格 {specific_style}")
+            logger.info("使用指定的文章风格 %d", specific_style)
     
     # 如果没有指定特定风格或指定的风格无效，则自动选择
     if specific_style is None:
-        # 确定历史记录长度不超过风格总数-1（至少要留一个可选）
-        history_size = min(MAX_STYLE_HISTORY, total_styles - 1) if total_styles > 1 else 0
-        
-        # 获取所有可用的风格索引
-        available_styles = list(range(total_styles))
-        
-        # 如果有历史记录且风格数量大于1，则排除最近使用的风格
-        if RECENT_USED_STYLES and total_styles > 1:
-            # 从可用风格中移除最近使用的风格
-            for style_idx in RECENT_USED_STYLES:
-                if style_idx in available_styles:
-                    available_styles.remove(style_idx)
-        
-        # 如果所有风格都被使用过（极端情况），则使用除最近一次外的任意风格
-        if not available_styles and total_styles > 1:
+        # 如果风格数量大于1，则排除最近使用的风格
+        if total_styles > 1:
+            available_styles = [i for i in range(total_styles) if i not in _RECENT_STYLE_SET]
+            # 如果所有风格都被使用过（极端情况），则使用除最近一次外的任意风格
+            if not available_styles:
+                available_styles = [i for i in range(total_styles) if i != RECENT_USED_STYLES[0]]
+        else:
             available_styles = list(range(total_styles))
-            if RECENT_USED_STYLES:
-                most_recent_style = RECENT_USED_STYLES[0]
-                available_styles.remove(most_recent_style)
         
         # 从剩余的风格中随机选择一个
         style_index = random.choice(available_styles)
         
         if verbose:
             print_status(f"自动选择文章风格 {style_index + 1}（避免最近使用的风格）", "风格", Fore.CYAN)
-        logger.info(f"自动选择文章风格 {style_index + 1}（避免最近使用的风格）")
-    
-    # 更新最近使用的风格历史
-    RECENT_USED_STYLES.insert(0, style_index)  # 在列表开头插入新使用的风格
-    # 保持历史记录不超过指定长度
-    if len(RECENT_USED_STYLES) > MAX_STYLE_HISTORY:
-        RECENT_USED_STYLES = RECENT_USED_STYLES[:MAX_STYLE_HISTORY]
+        logger.info("自动选择文章风格 %d（避免最近使用的风格）", style_index + 1)
     
-    style_instructions = ARTICLE_STYLES[style_index]
+    # 更新最近使用的风格历史，MAX_STYLE_HISTORY在运行时被修改过时按新的长度重建
+    if RECENT_USED_STYLES.maxlen != MAX_STYLE_HISTORY:
+        RECENT_USED_STYLES = deque(RECENT_USED_STYLES, maxlen=max(MAX_STYLE_HISTORY, 0))
+    RECENT_USED_STYLES.appendleft(style_index)  # 在开头插入新使用的风格
+    _RECENT_STYLE_SET = set(RECENT_USED_STYLES)
     
-    if verbose and RECENT_USED_STYLES:
+    # 只在需要输出时才拼接历史记录字符串
+    if RECENT_USED_STYLES and (verbose or logger.isEnabledFor(logging.INFO)):
         recent_styles_str = ", ".join([str(idx + 1) for idx in RECENT_USED_STYLES])
-        print_status(f"最近使用的风格: {recent_styles_str}", "历史", Fore.CYAN)
+        if verbose:
+            print_status(f"最近使用的风格: {recent_styles_str}", "历史", Fore.CYAN)
+        logger.info("最近使用的风格历史: %s", recent_styles_str)
     
-    if RECENT_USED_STYLES:
-        recent_styles_str = ", ".join([str(idx + 1) for idx in RECENT_USED_STYLES])
-        logger.info(f"最近使用的风格历史: {recent_styles_str}")
-    
-    # 准备提示内容
-    prompt = ARTICLE_PROMPT_TEMPLATE_BASE.format(
-        title=news.get("title", ""),
-        summary=news.get("summary", ""),
-        link=news.get("link", ""),
-        published_date=news.get("published_date", ""),
-        style_instructions=style_instructions
+    return style_index
+
+
+def _build_article_messages(news: Dict[str, Any], style_index: int) -> List[Dict[str, str]]:
+    """
+    构建文章生成请求的消息列表
+    
+    Args:
+        news: 新闻信息，包含title, summary, link, published_date
+        style_index: 风格索引（从0开始）
+        
+    Returns:
+        OpenAI chat接口使用的消息列表
+    """
+    # 准备提示内容，新闻中缺少的字段按空字符串处理
+    prompt = "".join(
+        text + (str(news.get(field, "")) if field else "")
+        for text, field in ARTICLE_PROMPT_PARTS[style_index]
     )
     
+    return [
+        {"role": "system", "content": ARTICLE_SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def _retry_wait_time(error: Exception, attempt: int) -> float:
+    """
+    计算重试前的等待时间
+    
+    被限流时优先使用服务端建议的等待时间，否则使用带完全抖动（full jitter）的指数退避，
+    避免大量请求在同一时刻重试。
+    
+    Args:
+        error: 调用OpenAI API时抛出的异常
+        attempt: 当前尝试次数（从0开始）
+        
+    Returns:
+        等待秒数
+    """
+    retry_after = _retry_after_seconds(error)
+    if retry_after is not None:
+        return min(retry_after, RETRY_MAX_WAIT)
+    return random.uniform(0, min(RETRY_MAX_WAIT, 2 ** attempt))
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    从限流错误的响应头中读取服务端建议的等待时间
+    
+    Args:
+        error: 调用OpenAI API时抛出的异常
+        
+    Returns:
+        等待秒数，如果响应头中没有相关信息则返回None
+    """
+    if not isinstance(error, openai.RateLimitError):
+        return None
+    
+    headers = error.response.headers
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except ValueError:
+        pass
+    return None
+
+
+def generate_article(news: Dict[str, Any], model: str = None, max_retries: int = 3, verbose: bool = False, 
+                    specific_style: int = None) -> Optional[str]:
+    """
+    使用OpenAI模型生成文章
+    
+    generate_article_async的同步版本，在新的事件循环中运行，不能在已运行的事件循环中调用。
+    
+    Args:
+        news: 新闻信息，包含title, summary, link, published_date
+        model: 要使用的模型名称，如果为None则使用默认模型
+        max_retries: 最大重试次数
+        verbose: 是否显示详细进度
+        specific_style: 指定使用的风格索引（从1开始），如果为None则自动选择
+        
+    Returns:
+        生成的文章内容，如果生成失败则返回None
+    """
+    return run_async(generate_article_async(news, model=model, max_retries=max_retries, verbose=verbose,
+                                              specific_style=specific_style))
+
+
+async def _stream_deltas(model: str, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+    """
+    以流式方式请求文章内容，逐段给出到达的内容
+    
+    Args:
+        model: 要使用的模型名称
+        messages: 消息列表
+        
+    Yields:
+        每个数据块中新生成的非空内容
+    """
+    # 按提示长度加上最大输出长度预约限速额度
+    prompt_tokens = _estimate_tokens(messages, model)
+    max_tokens = _article_max_tokens(model, prompt_tokens)
+    estimated_tokens = prompt_tokens + max_tokens
+    await rate_limiter.acquire(estimated_tokens)
+    
+    response = await _get_client().chat.completions.create(
+        model=model,
+        messages=messages,
+        stream=True,
+        stream_options={"include_usage": True},  # 最后一个数据块报告实际token用量
+        **dict(ARTICLE_COMPLETION_PARAMS, max_tokens=max_tokens)
+    )
+    
+    usage = None
+    async for chunk in response:
+        if chunk.choices:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+        if chunk.usage:
+            usage = chunk.usage
+    
+    rate_limiter.reconcile(estimated_tokens, usage.total_tokens if usage else None)
+
+
+async def _stream_completion(model: str, messages: List[Dict[str, str]],
+                             stream_path: Optional[str] = None,
+                             preview_length: int = 0) -> str:
+    """
+    以流式方式请求文章内容，边接收边写入文件（可选）
+    
+    Args:
+        model: 要使用的模型名称
+        messages: 消息列表
+        stream_path: 实时写入生成内容的文件路径，如果为None则只在内存中拼接
+        preview_length: 大于0时，收到这么多字符后立即显示一次文章预览
+        
+    Returns:
+        完整的生成内容
+    """
+    buf = []
+    received = 0
+    f = await aiofiles.open(stream_path, "w", encoding="utf-8") if stream_path else None
+    try:
+        async for delta in _stream_deltas(model, messages):
+            if f is not None:
+                await f.write(delta)
+            buf.append(delta)
+            
+            # 预览在内容到达时显示，不必等待整篇文章生成完毕
+            if received < preview_length <= received + len(delta):
+                print_status(f"文章预览: {''.join(buf)[:preview_length]}...", "预览", Fore.CYAN)
+            received += len(delta)
+    finally:
+        if f is not None:
+            await f.close()
+    
+    content = "".join(buf)
+    # 内容不足预览长度时在生成完毕后显示全部内容
+    if 0 < received < preview_length:
+        print_status(f"文章预览: {content}...", "预览", Fore.CYAN)
+    return content
+
+
+async def generate_article_stream(news: Dict[str, Any], model: str = None,
+                                  specific_style: int = None) -> AsyncIterator[str]:
+    """
+    以流式方式生成文章，内容到达时逐段给出，调用方可以边接收边处理
+    
+    内容一旦给出就无法撤回，因此出错时不会重试，异常直接抛给调用方。
+    
+    Args:
+        news: 新闻信息，包含title, summary, link, published_date
+        model: 要使用的模型名称，如果为None则使用默认模型
+        specific_style: 指定使用的风格索引（从1开始），如果为None则自动选择
+        
+    Yields:
+        新生成的文章内容片段
+    """
+    style_index = _select_style(specific_style)
+    async for delta in _stream_deltas(model or DEFAULT_MODEL, _build_article_messages(news, style_index)):
+        yield delta
+
+
+async def generate_article_async(news: Dict[str, Any], model: str = None, max_retries: int = 3,
+                                 verbose: bool = False, specific_style: int = None,
+                                 stream_path: Optional[str] = None) -> Optional[str]:
+    """
+    使用OpenAI模型异步生成文章，参数和返回值与generate_article相同
+    
+    以流式方式接收生成内容，等待API响应和重试间隔时不会阻塞事件循环，可以与其他生成任务并发执行。
+    如果指定了stream_path，生成的内容会在到达时实时写入该文件。
+    """
+    if not OPENAI_API_KEY:
+        if verbose:
+            print_status("未设置API密钥，请在config.py中设置OPENAI_API_KEY", "错误", Fore.RED)
+        logger.error("未设置API密钥，请在config.py中设置OPENAI_API_KEY")
+        return None
+    
+    # 如果未指定模型，使用默认模型
+    if model is None:
+        model = DEFAULT_MODEL
+    
+    # 同一新闻之前已经用相同模型和风格要求生成过时直接使用缓存结果，
+    # 在随机选择风格之前查找，自动选择风格的请求不会因为选中了不同的风格而错过缓存
+    cache_key = _article_cache_key(model, news, specific_style)
+    article_content = await get_cached_article_async(cache_key)
+    if article_content:
+        if stream_path:
+            async with aiofiles.open(stream_path, "w", encoding="utf-8") as f:
+                await f.write(article_content)
+        if verbose:
+            print_status(f"使用缓存的文章: {news.get('title')}", "缓存", Fore.CYAN)
+        logger.info("使用缓存的文章: %s", news.get('title'))
+        return article_content
+    
+    style_index = _select_style(specific_style, verbose)
+    messages = _build_article_messages(news, style_index)
+    
     # 重试机制
     for attempt in range(max_retries):
         try:
             if verbose:
-                print_status(f"正在使用模型 {model} 生成文章 (尝试 {attempt + 1}/{max_retries})", "生成", Fore.YELLOW)
-                print_status(f"文章标题: {news.get('title')}", "标题", Fore.CYAN)
-            
-            logger.info(f"正在使用模型 {model} 生成文章: {news.get('title')} (尝试 {attempt + 1}/{max_retries})")
-            
-            # 显示生成进度
-            if verbose:
-                print_status("正在向OpenAI发送请求...", "请求", Fore.BLUE)
+                print_status(f"正在使用模型 {model} 生成文章 (尝试 {attempt + 1}/{max_retries}): {news.get('title')}", "生成", Fore.YELLOW)
+            logger.info("正在使用模型 %s 生成文章: %s (尝试 %d/%d)", model, news.get('title'), attempt + 1, max_retries)
             
             # 调用OpenAI API
             start_time = time.time()
-            response = client.chat.completions.create(
-                model=model,  # 使用指定的模型
-                messages=[
-                    {"role": "system", "content": "你是一位专业的AI领域科技记者，擅长撰写社交媒体平台的爆款文章。你的文章充满情绪化表达、悬念设置和互动元素，能引发大量阅读、点赞和分享。你善于将复杂的AI技术用通俗易懂的方式解释。"},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.8,  # 控制创造性
-                max_tokens=2000,  # 最大输出长度
-                top_p=0.95,
-                frequency_penalty=0.5,  # 减少重复
-                presence_penalty=0.5,  # 鼓励多样性
-            )
+            article_content = (await _stream_completion(model, messages, stream_path,
+                                                        preview_length=200 if verbose else 0)).strip()
             elapsed_time = time.time() - start_time
             
-            # 提取生成的文章内容
-            article_content = response.choices[0].message.content.strip()
-            
             if article_content:
                 if verbose:
                     print_status(f"文章生成成功: {len(article_content)} 字符，耗时: {elapsed_time:.2f}秒", "成功", Fore.GREEN)
-                    # 显示文章预览
-                    preview_length = min(200, len(article_content))
-                    print_status(f"文章预览: {article_content[:preview_length]}...", "预览", Fore.CYAN)
-                
-                logger.info(f"文章生成成功: {len(article_content)} 字符，耗时: {elapsed_time:.2f}秒")
+                logger.info("文章生成成功: %d 字符，耗时: %.2f秒", len(article_content), elapsed_time)
+                await save_cached_article_async(cache_key, article_content)
                 return article_content
             else:
                 if verbose:
@@ -385,19 +875,9 @@ def generate_article(news: Dict[str, Any], model: str = None, max_retries: int =
             
             # 如果不是最后一次尝试，则等待后重试
             if attempt < max_retries - 1:
-                wait_time = 2 ** attempt  # 指数退避
-                if verbose:
-                    print_status(f"等待 {wait_time} 秒后重试...", "重试", Fore.YELLOW)
-                    
-                    # 显示等待进度条
-                    with tqdm(total=wait_time, desc="等待重试", ncols=100, 
-                              bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}s") as pbar:
-                        for _ in range(wait_time):
-                            time.sleep(1)
-                            pbar.update(1)
-                else:
-                    logger.info(f"等待 {wait_time} 秒后重试...")
-                    time.sleep(wait_time)
+                wait_time = _retry_wait_time(e, attempt)  # 带抖动的指数退避
+                logger.info("等待 %.1f 秒后重试...", wait_time)
+                await asyncio.sleep(wait_time)
     
     if verbose:
         print_status(f"在 {max_retries} 次尝试后仍未能生成文章", "失败", Fore.RED)
@@ -405,10 +885,278 @@ def generate_article(news: Dict[str, Any], model: str = None, max_retries: int =
     return None
 
 
+async def generate_articles_batch(news_list: List[Dict[str, Any]], model: str = None, concurrency: int = 8,
+                                  verbose: bool = False, specific_style: int = None,
+                                  progress_callback: Optional[Callable[[], None]] = None,
+                                  result_callback: Optional[Callable[[Dict[str, Any], Optional[str]], None]] = None
+                                  ) -> List[Optional[str]]:
+    """
+    并发生成多篇文章
+    
+    Args:
+        news_list: 新闻列表
+        model: 要使用的模型名称，如果为None则使用默认模型
+        concurrency: 同时进行的最大请求数量
+        verbose: 是否显示详细进度
+        specific_style: 指定使用的风格索引（从1开始），如果为None则自动选择
+        progress_callback: 每篇文章处理完成后调用的回调函数（可选）
+        result_callback: 每篇文章处理完成后立即以(新闻, 文章内容)调用的回调函数，生成失败时文章内容为None（可选）
+        
+    Returns:
+        文章内容列表，与news_list一一对应，生成失败的位置为None
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run(news: Dict[str, Any]) -> Optional[str]:
+        async with semaphore:
+            content = None
+            try:
+                content = await generate_article_async(news, model=model, verbose=verbose,
+                                                       specific_style=specific_style)
+                return content
+            finally:
+                if result_callback:
+                    result_callback(news, content)
+                if progress_callback:
+                    progress_callback()
+    
+    results = await asyncio.gather(*(run(news) for news in news_list), return_exceptions=True)
+    
+    articles = []
+    for news, result in zip(news_list, results):
+        if isinstance(result, Exception):
+            logger.error(f"生成文章时出错: {news.get('title')}: {str(result)}")
+            articles.append(None)
+        else:
+            articles.append(result)
+    return articles
+
+
+async def generate_articles_batch_offline(news_list: List[Dict[str, Any]], model: str = None,
+                                          verbose: bool = False, specific_style: int = None,
+                                          poll_interval: float = 60,
+                                          progress_callback: Optional[Callable[[], None]] = None,
+                                          result_callback: Optional[Callable[[Dict[str, Any], Optional[str]], None]] = None
+                                          ) -> List[Optional[str]]:
+    """
+    通过OpenAI Batch API离线生成多篇文章，参数和返回值与generate_articles_batch相同
+
+    所有请求写成一个JSONL文件一次提交，不占用实时接口的速率限制，费用约为实时接口的一半，
+    但最长可能需要24小时才能完成，适合夜间或补录等不要求时效的批量任务。
+    已经缓存过的文章直接使用缓存结果，不会再次提交。
+
+    Args:
+        news_list: 新闻列表
+        model: 要使用的模型名称，如果为None则使用默认模型
+        verbose: 是否显示详细进度
+        specific_style: 指定使用的风格索引（从1开始），如果为None则自动选择
+        poll_interval: 查询批处理任务状态的间隔（秒）
+        progress_callback: 每篇文章处理完成后调用的回调函数（可选）
+        result_callback: 每篇文章处理完成后立即以(新闻, 文章内容)调用的回调函数，生成失败时文章内容为None（可选）
+
+    Returns:
+        文章内容列表，与news_list一一对应，生成失败的位置为None
+    """
+    if model is None:
+        model = DEFAULT_MODEL
+
+    articles: List[Optional[str]] = [None] * len(news_list)
+    cache_keys: Dict[int, str] = {}
+    lines = []
+
+    def finish(index: int) -> None:
+        if result_callback:
+            result_callback(news_list[index], articles[index])
+        if progress_callback:
+            progress_callback()
+
+    for i, news in enumerate(news_list):
+        cache_key = _article_cache_key(model, news, specific_style)
+        articles[i] = await get_cached_article_async(cache_key)
+        if articles[i]:
+            logger.info("使用缓存的文章: %s", news.get('title'))
+            finish(i)
+            continue
+        messages = _build_article_messages(news, _select_style(specific_style, verbose))
+        # 新闻链接可能重复，使用序号作为请求ID
+        cache_keys[i] = cache_key
+        lines.append(json.dumps({
+            "custom_id": str(i),
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {"model": model, "messages": messages, **ARTICLE_COMPLETION_PARAMS,
+                     "max_tokens": _article_max_tokens(model, _estimate_tokens(messages, model))},
+        }, ensure_ascii=False))
+
+    if not lines:
+        return articles
+
+    if not OPENAI_API_KEY:
+        logger.error("未设置API密钥，请在config.py中设置OPENAI_API_KEY")
+        for i in cache_keys:
+            finish(i)
+        return articles
+
+    try:
+        input_file = await _get_client().files.create(
+            file=("articles.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await _get_client().batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        if verbose:
+            print_status(f"已提交批处理任务 {batch.id}，共 {len(lines)} 篇文章", "批处理", Fore.CYAN)
+        logger.info(f"已提交批处理任务 {batch.id}，共 {len(lines)} 篇文章")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await _get_client().batches.retrieve(batch.id)
+            logger.info(f"批处理任务 {batch.id} 状态: {batch.status}")
+
+        if batch.status == "failed":
+            # 输入文件未通过校验，任务没有执行任何请求，也不会产生结果文件
+            errors = batch.errors.data if batch.errors and batch.errors.data else []
+            for error in errors:
+                logger.error(f"批处理任务 {batch.id} 校验失败 (第 {error.line} 行): {error.code}: {error.message}")
+            if not errors:
+                logger.error(f"批处理任务 {batch.id} 失败")
+        elif batch.status in ("expired", "cancelled"):
+            # 过期或取消的任务仍会给出已完成部分的结果，其余请求没有结果
+            logger.error(f"批处理任务 {batch.id} 未能完成: {batch.status}，"
+                         f"已完成 {batch.request_counts.completed if batch.request_counts else 0} / {len(lines)} 篇文章")
+
+        # 成功的请求写入结果文件，失败的请求写入错误文件
+        for result in await _read_batch_file(batch.output_file_id) + await _read_batch_file(batch.error_file_id):
+            index = int(result["custom_id"])
+            response = result.get("response") or {}
+            body = response.get("body") or {}
+            if response.get("status_code") != 200:
+                error = result.get("error") or body.get("error")
+                logger.error(f"生成文章时出错 (custom_id={result['custom_id']}): "
+                             f"{news_list[index].get('title')}: {error}")
+                continue
+            content = (body["choices"][0]["message"]["content"] or "").strip()
+            if content:
+                articles[index] = content
+                await save_cached_article_async(cache_keys[index], content)
+
+        if batch.status != "failed":
+            missing = [i for i in cache_keys if articles[i] is None]
+            if missing:
+                logger.error(f"批处理任务 {batch.id} 中有 {len(missing)} 篇文章未能生成")
+    except Exception as e:
+        if verbose:
+            print_status(f"批处理生成文章时出错: {str(e)}", "错误", Fore.RED)
+        logger.error(f"批处理生成文章时出错: {str(e)}")
+
+    for i in cache_keys:
+        finish(i)
+    return articles
+
+
+async def _read_batch_file(file_id: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    下载批处理任务的结果文件或错误文件，并逐行解析
+    
+    Args:
+        file_id: 文件ID，为None时返回空列表
+        
+    Returns:
+        每行对应的结果字典列表
+    """
+    if not file_id:
+        return []
+    content = await _get_client().files.content(file_id)
+    return [json.loads(line) for line in content.text.splitlines() if line.strip()]
+
+
+def _article_cache_key(model: str, news: Dict[str, Any], specific_style: Optional[int] = None) -> str:
+    """
+    计算文章生成结果缓存的键
+    
+    键由模型、新闻内容和请求的风格组成，自动选择风格时不包含随机选中的风格，
+    同一新闻重新运行时可以直接复用之前生成的文章。提示模板修改后_ARTICLE_PROMPT_DIGEST随之变化，旧缓存自动失效。
+    
+    Args:
+        model: 使用的模型名称
+        news: 新闻信息，包含title, summary, link, published_date
+        specific_style: 指定使用的风格索引（从1开始），无效或为None时视为自动选择
+        
+    Returns:
+        十六进制哈希字符串
+    """
+    if specific_style is None or not 1 <= specific_style <= len(ARTICLE_STYLES):
+        specific_style = "auto"
+    key = hashlib.blake2b(_ARTICLE_PROMPT_DIGEST, digest_size=16)
+    key.update(f"\n{model}\n{specific_style}".encode("utf-8"))
+    for field in ("title", "summary", "link", "published_date"):
+        key.update(f"\n{news.get(field, '')}".encode("utf-8"))
+    return key.hexdigest()
+
+
+def _title_cache_key(title: str, model: str) -> str:
+    """
+    计算标题优化缓存的键
+    
+    Args:
+        title: 原始标题
+        model: 使用的模型名称
+        
+    Returns:
+        十六进制哈希字符串
+    """
+    return hashlib.blake2b(f"{model}\n{title}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+async def _lookup_title_cache(cache_key: str) -> Optional[str]:
+    """
+    查找缓存的优化标题，先查进程内缓存，再在后台线程中查数据库缓存，不阻塞事件循环
+    
+    Args:
+        cache_key: _title_cache_key计算的缓存键
+        
+    Returns:
+        缓存的优化标题，没有缓存时返回None
+    """
+    optimized_title = _TITLE_CACHE.get(cache_key)
+    if optimized_title is None:
+        optimized_title = await asyncio.to_thread(get_cached_title, cache_key)
+        if optimized_title is not None:
+            _TITLE_CACHE[cache_key] = optimized_title
+    return optimized_title
+
+
+def _clean_optimized_title(text: str) -> str:
+    """移除模型返回的标题中可能带有的引号和前缀"""
+    return _TITLE_PREFIX_PATTERN.sub('', text.strip().translate(_TITLE_QUOTE_TABLE))
+
+
 def optimize_title(title: str, model: str = None, verbose: bool = False) -> str:
     """
     优化文章标题，使其更吸引人
     
+    optimize_title_async的同步版本，在新的事件循环中运行，不能在已运行的事件循环中调用。
+    
+    Args:
+        title: 原始标题
+        model: 要使用的模型名称，如果为None则使用默认模型
+        verbose: 是否显示详细进度
+        
+    Returns:
+        优化后的标题
+    """
+    return run_async(optimize_title_async(title, model=model, verbose=verbose))
+
+
+async def optimize_title_async(title: str, model: str = None, verbose: bool = False) -> str:
+    """
+    异步优化文章标题，使其更吸引人
+    
+    等待API响应时不会阻塞事件循环，可以与文章生成等其他请求并发执行。
+    
     Args:
         title: 原始标题
         model: 要使用的模型名称，如果为None则使用默认模型
@@ -427,12 +1175,21 @@ def optimize_title(title: str, model: str = None, verbose: bool = False) -> str:
     if model is None:
         model = DEFAULT_MODEL
     
+    # 同一标题优先使用缓存结果
+    cache_key = _title_cache_key(title, model)
+    optimized_title = await _lookup_title_cache(cache_key)
+    if optimized_title is not None:
+        if verbose:
+            print_status(f"使用缓存的优化标题: {optimized_title}", "缓存", Fore.CYAN)
+        logger.info("使用缓存的优化标题: %s", optimized_title)
+        return optimized_title
+    
     try:
         if verbose:
             print_status(f"正在使用模型 {model} 优化标题", "优化", Fore.BLUE)
             print_status(f"原标题: {title}", "原标题", Fore.CYAN)
         
-        logger.info(f"正在使用模型 {model} 优化标题: {title}")
+        logger.info("正在使用模型 %s 优化标题: %s", model, title)
         
         # 显示优化进度
         if verbose:
@@ -440,58 +1197,33 @@ def optimize_title(title: str, model: str = None, verbose: bool = False) -> str:
         
         # 调用OpenAI API
         start_time = time.time()
-        response = client.chat.completions.create(
+        messages = [
+            {"role": "system", "content": TITLE_SYSTEM_PROMPT},
+            {"role": "user", "content": TITLE_PROMPT_TEMPLATE.format(title=title)}
+        ]
+        estimated_tokens = _estimate_tokens(messages, model) + TITLE_COMPLETION_PARAMS["max_tokens"]
+        await rate_limiter.acquire(estimated_tokens)
+        response = await _get_client().chat.completions.create(
             model=model,
-            messages=[
-                {"role": "system", "content": "你是一位今日头条平台的爆款标题专家，擅长创作能引发大量点击和分享的标题。"},
-                {"role": "user", "content": f"""请将以下AI新闻标题改写成今日头条平台的爆款标题，遵循以下规则：
-
-1. 使用以下任一开头：
-   - 震惊！
-   - 重磅！
-   - 突发！
-   - 独家！
-   - 紧急扩散！
-   - 刚刚！
-
-2. 或使用以下标题公式：
-   - 数字清单：如"3个信号暗示AI已超越人类智能"
-   - 悬念设问：如"AI真的能取代人类工作吗？答案让人意外"
-   - 对比反差：如"曾被看衰的AI技术，如今竟能做到这一步"
-   - 情感刺激：如"看完这个AI演示，所有人都惊呆了"
-
-3. 标题要素：
-   - 使用夸张但不失真的表达
-   - 加入情绪化词汇
-   - 制造信息差或悬念
-   - 暗示稀缺或独家信息
-   - 强调时效性和紧迫感
-
-4. 长度控制在15-25字之间，确保吸引眼球但不过于冗长
-
-原标题: {title}
-
-请直接给出优化后的爆款标题，不要包含任何解释。"""}
-            ],
-            temperature=0.8,
-            max_tokens=50,
-            top_p=0.95,
+            messages=messages,
+            **TITLE_COMPLETION_PARAMS
         )
+        rate_limiter.reconcile(estimated_tokens, response.usage.total_tokens if response.usage else None)
         elapsed_time = time.time() - start_time
         
         # 提取优化后的标题
-        optimized_title = response.choices[0].message.content.strip()
-        
-        # 移除可能的引号和前缀
-        optimized_title = optimized_title.replace('"', '').replace('"', '')
-        optimized_title = optimized_title.replace('"', '').replace("'", "")
-        optimized_title = optimized_title.replace("优化标题：", "").replace("优化后的标题：", "")
+        optimized_title = _clean_optimized_title(response.choices[0].message.content)
         
         if verbose:
             print_status(f"标题优化成功，耗时: {elapsed_time:.2f}秒", "成功", Fore.GREEN)
             print_status(f"优化后标题: {optimized_title}", "新标题", Fore.GREEN)
         
-        logger.info(f"标题优化成功: {optimized_title}，耗时: {elapsed_time:.2f}秒")
+        logger.info("标题优化成功: %s，耗时: %.2f秒", optimized_title, elapsed_time)
+        
+        # 只缓存成功的结果，失败时下次仍会重新请求
+        if optimized_title:
+            _TITLE_CACHE[cache_key] = optimized_title
+            await asyncio.to_thread(save_cached_title, cache_key, optimized_title)
         return optimized_title
     
     except Exception as e:
@@ -501,6 +1233,117 @@ def optimize_title(title: str, model: str = None, verbose: bool = False) -> str:
         return title
 
 
+def optimize_titles_bulk(titles: List[str], model: str = None, verbose: bool = False) -> List[str]:
+    """
+    批量优化文章标题
+    
+    optimize_titles_bulk_async的同步版本，在新的事件循环中运行，不能在已运行的事件循环中调用。
+    
+    Args:
+        titles: 原始标题列表
+        model: 要使用的模型名称，如果为None则使用默认模型
+        verbose: 是否显示详细进度
+        
+    Returns:
+        优化后的标题列表，与titles一一对应
+    """
+    return run_async(optimize_titles_bulk_async(titles, model=model, verbose=verbose))
+
+
+async def optimize_titles_bulk_async(titles: List[str], model: str = None, verbose: bool = False) -> List[str]:
+    """
+    异步批量优化文章标题，处理多个标题时应使用此函数，而不是逐个调用optimize_title
+    
+    每个请求最多包含TITLE_BULK_SIZE个标题，要求模型以JSON数组按顺序返回，
+    多个标题共用一次请求的开销和系统提示。已缓存的标题不会再次请求，
+    某个请求失败或返回的标题数量不符时，对应的标题保持原样。
+    
+    Args:
+        titles: 原始标题列表
+        model: 要使用的模型名称，如果为None则使用默认模型
+        verbose: 是否显示详细进度
+        
+    Returns:
+        优化后的标题列表，与titles一一对应
+    """
+    if not OPENAI_API_KEY:
+        if verbose:
+            print_status("未设置API密钥，无法优化标题", "警告", Fore.YELLOW)
+        logger.warning("未设置API密钥，无法优化标题")
+        return list(titles)
+    
+    # 如果未指定模型，使用默认模型
+    if model is None:
+        model = DEFAULT_MODEL
+    
+    # 进程内缓存中没有的标题在后台线程中一次查询数据库缓存
+    keys = {title: _title_cache_key(title, model) for title in titles}
+    missing = [key for key in keys.values() if key not in _TITLE_CACHE]
+    if missing:
+        _TITLE_CACHE.update(await asyncio.to_thread(get_cached_titles, missing))
+    
+    optimized_titles = list(titles)
+    pending: Dict[str, List[int]] = {}
+    for i, title in enumerate(titles):
+        cached = _TITLE_CACHE.get(keys[title])
+        if cached is not None:
+            optimized_titles[i] = cached
+        else:
+            # 重复的标题只请求一次
+            pending.setdefault(title, []).append(i)
+    
+    if not pending:
+        return optimized_titles
+    
+    async def run(chunk: List[str]) -> None:
+        numbered = "\n".join(f"{i}. {title}" for i, title in enumerate(chunk, 1))
+        messages = [
+            {"role": "system", "content": TITLE_SYSTEM_PROMPT},
+            {"role": "user", "content": TITLE_BULK_PROMPT_TEMPLATE.format(count=len(chunk), titles=numbered)}
+        ]
+        max_tokens = TITLE_COMPLETION_PARAMS["max_tokens"] * len(chunk) + 20
+        estimated_tokens = _estimate_tokens(messages, model) + max_tokens
+        try:
+            await rate_limiter.acquire(estimated_tokens)
+            response = await _get_client().chat.completions.create(
+                model=model,
+                messages=messages,
+                response_format={"type": "json_object"},
+                **dict(TITLE_COMPLETION_PARAMS, max_tokens=max_tokens)
+            )
+            rate_limiter.reconcile(estimated_tokens, response.usage.total_tokens if response.usage else None)
+            results = json.loads(response.choices[0].message.content)["titles"]
+            if len(results) != len(chunk):
+                raise ValueError(f"返回了 {len(results)} 个标题，应为 {len(chunk)} 个")
+        except Exception as e:
+            if verbose:
+                print_status(f"批量优化标题时出错: {str(e)}", "错误", Fore.RED)
+            logger.error(f"批量优化标题时出错: {str(e)}")
+            return
+        
+        for title, result in zip(chunk, results):
+            optimized_title = _clean_optimized_title(str(result))
+            # 只缓存成功的结果，失败时下次仍会重新请求
+            if not optimized_title:
+                continue
+            cache_key = _title_cache_key(title, model)
+            _TITLE_CACHE[cache_key] = optimized_title
+            cache_items.append((cache_key, optimized_title))
+            for i in pending[title]:
+                optimized_titles[i] = optimized_title
+    
+    unique_titles = list(pending)
+    if verbose:
+        print_status(f"正在使用模型 {model} 批量优化 {len(unique_titles)} 个标题", "优化", Fore.BLUE)
+    logger.info(f"正在使用模型 {model} 批量优化 {len(unique_titles)} 个标题")
+    cache_items: List[Tuple[str, str]] = []
+    await asyncio.gather(*(run(unique_titles[i:i + TITLE_BULK_SIZE])
+                           for i in range(0, len(unique_titles), TITLE_BULK_SIZE)))
+    # 所有请求完成后在后台线程中一次写入数据库缓存，不阻塞事件循环
+    await asyncio.to_thread(save_cached_titles, cache_items)
+    return optimized_titles
+
+
 def get_available_models():
     """
     获取可用的模型列表
@@ -534,6 +1377,8 @@ if __name__ == "__main__":
                         help=f"指定使用的文章风格 (1-{len(ARTICLE_STYLES)}), 不指定则自动选择")
     parser.add_argument("--history-size", type=int, default=MAX_STYLE_HISTORY,
                         help=f"记录的历史风格数量 (默认: {MAX_STYLE_HISTORY})")
+    parser.add_argument("--batch", action="store_true",
+                        help="通过OpenAI Batch API离线生成文章，费用更低但最长需要24小时")
     args = parser.parse_args()
     
     # 设置历史记录大小
@@ -585,7 +1430,12 @@ if __name__ == "__main__":
     
     # 测试生成文章
     print_status("开始测试文章生成", "测试", Fore.BLUE)
-    article = generate_article(test_news, model=args.model, verbose=args.verbose, specific_style=args.style)
+    if args.batch:
+        article = run_async(generate_articles_batch_offline(
+            [test_news], model=args.model, verbose=args.verbose, specific_style=args.style
+        ))[0]
+    else:
+        article = generate_article(test_news, model=args.model, verbose=args.verbose, specific_style=args.style)
     
     if article:
         print_status("文章生成成功", "成功", Fore.GREEN)
@@ -7,17 +7,58 @@
 从多个AI资讯来源获取最新新闻，包括RSS源和网页爬虫。
 """
 
+import asyncio
+import atexit
+import functools
+import html
+import io
+import itertools
 import logging
 import json
-import time
+import os
 import random
+import re
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+import aiohttp
 import feedparser
-import requests
-from datetime import datetime
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date
+from email.utils import parsedate_to_datetime
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from dateutil import parser as date_parser
 
+# 优先使用lxml的C实现流式解析RSS，没有安装时使用标准库
+try:
+    from lxml import etree as _lxml_etree
+    XML_ITERPARSE = functools.partial(_lxml_etree.iterparse, resolve_entities=False, no_network=True)
+    XML_PARSE_ERRORS = (_lxml_etree.XMLSyntaxError, ET.ParseError)
+    HAS_LXML = True
+except ImportError:
+    XML_ITERPARSE = ET.iterparse
+    XML_PARSE_ERRORS = (ET.ParseError,)
+    HAS_LXML = False
+
+# 尝试导入aiohttp-client-cache，用于在磁盘上缓存HTTP响应
+try:
+    from aiohttp_client_cache import CachedSession
+    # SQLite后端依赖aiosqlite，直接从子模块导入，缺少依赖时同样视为不可用
+    from aiohttp_client_cache.backends.sqlite import SQLiteBackend
+    HAS_HTTP_CACHE = True
+except ImportError:
+    HAS_HTTP_CACHE = False
+
+# 尝试导入orjson，序列化大量新闻时比标准库json快得多
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # 配置日志
 logger = logging.getLogger(__name__)
 
@@ -195,6 +236,60 @@ WEB_SOURCES = [
     }
 ]
 
+# 同时进行的最大请求数量
+MAX_CONCURRENT_REQUESTS = 64
+
+# 同一站点同时打开的最大连接数量
+MAX_REQUESTS_PER_HOST = 4
+
+# 新闻摘要的最大长度
+SUMMARY_MAX_LENGTH = 300
+
+# 空闲连接保持的秒数，健康检查和正式获取之间、同一CDN上的多个源之间可以复用TCP/TLS连接
+KEEPALIVE_TIMEOUT = 30
+
+# 常见日期格式的快速匹配：ISO-8601（2025-06-09T08:00:00Z）和RFC-822（Tue, 10 Jun 2025 12:00:00 GMT）
+ISO_DATE_PATTERN = re.compile(r'\s*(\d{4})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])(?![\d])')
+RFC822_DATE_PATTERN = re.compile(
+    r'\s*(?:[a-z]{3},?\s+)?(\d{1,2})\s+(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(\d{4})\b',
+    re.IGNORECASE
+)
+MONTH_NUMBERS = {
+    "jan": "01", "feb": "02", "mar": "03", "apr": "04", "may": "05", "jun": "06",
+    "jul": "07", "aug": "08", "sep": "09", "oct": "10", "nov": "11", "dec": "12"
+}
+
+# 去除摘要中HTML标签的正则：脚本和样式连同内容一起去除，标签名必须紧跟在<之后
+_SCRIPT_STYLE_PATTERN = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_HTML_TAG_PATTERN = re.compile(r'</?[a-zA-Z!][^<>]*>')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 快速解析RSS/Atom时识别的命名空间：RSS 2.0（无命名空间）、RSS 1.0和Atom
+FEED_NAMESPACES = ("", "http://purl.org/rss/1.0/", "http://www.w3.org/2005/Atom")
+CONTENT_NAMESPACE = "http://purl.org/rss/1.0/modules/content/"
+DC_NAMESPACE = "http://purl.org/dc/elements/1.1/"
+
+# 项目根目录
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+
+# RSS源的ETag、Last-Modified和上次解析出的新闻，内容未变化时服务器返回304，直接复用缓存
+FEED_CACHE_PATH = os.path.join(ROOT_DIR, "data", "cache", "feed_meta.json")
+_feed_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+# HTTP响应缓存（需要安装aiohttp-client-cache），缓存时间内重复运行不再访问网络
+HTTP_CACHE_PATH = os.path.join(ROOT_DIR, "data", "cache", "http_cache.sqlite")
+HTTP_CACHE_EXPIRE = 600
+
+# 每个站点每秒允许的请求数量和突发请求数量，不同站点之间互不影响
+HOST_RATE_LIMIT = 5
+HOST_BURST = 5
+
+# 按站点（域名和端口）划分的限速器
+_host_limiters: Dict[str, "HostRateLimiter"] = {}
+
+# 解析RSS和HTML的线程池，解析与其他新闻源的下载同时进行，不阻塞事件循环
+PARSER_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="news_parser")
+
 # 用户代理列表，避免被网站封锁
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -207,36 +302,573 @@ USER_AGENTS = [
 ]
 
 
+class HostRateLimiter:
+    """
+    单个站点的令牌桶限速器
+    
+    令牌按固定速率补充，令牌不足时请求预约后续令牌并等待相应时间；
+    站点返回429或503并带有Retry-After时，在指定时间内暂停对该站点的所有请求。
+    """
+    
+    def __init__(self, rate: float = HOST_RATE_LIMIT, burst: int = HOST_BURST):
+        """
+        初始化限速器
+        
+        Args:
+            rate: 每秒补充的令牌数量
+            burst: 令牌桶容量，即允许的突发请求数量
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+    
+    async def acquire(self) -> None:
+        """获取一个令牌，必要时等待"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        # 令牌可以为负数，表示已经被排队的请求预约，后来的请求需要等待更久
+        self._tokens -= 1
+        wait = max(-self._tokens / self.rate, self._blocked_until - now)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    def observe(self, response: aiohttp.ClientResponse) -> None:
+        """
+        根据响应头调整限速，站点要求稍后重试时暂停对该站点的请求
+        
+        Args:
+            response: HTTP响应
+        """
+        if response.status not in (429, 503):
+            return
+        delay = _retry_after_seconds(response.headers.get('Retry-After'))
+        if delay:
+            logger.warning(f"{response.url.host} 要求 {delay:.0f} 秒后重试，暂停对该站点的请求")
+            self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """
+    解析Retry-After响应头
+    
+    Args:
+        value: 秒数或HTTP日期格式的响应头
+        
+    Returns:
+        需要等待的秒数，无法解析时返回None
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max((retry_at - datetime.now(retry_at.tzinfo)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_host_limiter(url: str) -> HostRateLimiter:
+    """
+    获取URL所在站点的限速器
+    
+    Args:
+        url: 请求地址
+        
+    Returns:
+        该站点共用的限速器
+    """
+    host = urlsplit(url).netloc
+    limiter = _host_limiters.get(host)
+    if limiter is None:
+        limiter = _host_limiters[host] = HostRateLimiter()
+    return limiter
+
+
+# 启动时打乱一次顺序后轮流使用用户代理，所有请求都在事件循环线程中发出，不需要加锁
+_user_agent_cycle = itertools.cycle(random.sample(USER_AGENTS, len(USER_AGENTS)))
+
+
 def get_random_user_agent() -> str:
-    """返回随机用户代理字符串"""
-    return random.choice(USER_AGENTS)
+    """返回用户代理字符串（按随机顺序轮流使用）"""
+    return next(_user_agent_cycle)
 
 
-def parse_date(date_str: str) -> str:
+def _is_valid_date(year: str, month: str, day: str) -> bool:
     """
-    解析日期字符串为标准格式 (YYYY-MM-DD)
+    检查正则提取的年月日是否是真实存在的日期
+    
+    Args:
+        year: 年
+        month: 月
+        day: 日
+        
+    Returns:
+        日期存在时返回True
+    """
+    try:
+        date(int(year), int(month), int(day))
+        return True
+    except ValueError:
+        return False
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[str]:
+    """
+    解析日期字符串为标准格式 (YYYY-MM-DD)，结果按字符串缓存
+    
+    同一RSS源的条目以及多次刷新之间经常出现完全相同的日期字符串，缓存后只需解析一次。
     
     Args:
         date_str: 日期字符串
         
     Returns:
-        标准格式的日期字符串
+        标准格式的日期字符串，解析失败时返回None
     """
+    # 大多数RSS日期是ISO-8601或RFC-822格式，直接用正则提取年月日；
+    # 正则不检查每月天数，2025-02-31这类不存在的日期交给下面的dateutil处理
+    match = ISO_DATE_PATTERN.match(date_str)
+    if match:
+        year, month, day = match.groups()
+        if _is_valid_date(year, month, day):
+            return f"{year}-{month}-{day}"
+    else:
+        match = RFC822_DATE_PATTERN.match(date_str)
+        if match:
+            year, month, day = match.group(3), MONTH_NUMBERS[match.group(2).lower()], f"{int(match.group(1)):02d}"
+            if _is_valid_date(year, month, day):
+                return f"{year}-{month}-{day}"
+    
+    # 其他格式交给dateutil猜测
     try:
         dt = date_parser.parse(date_str)
         return dt.strftime("%Y-%m-%d")
     except Exception as e:
         logger.warning(f"日期解析失败: {date_str}, 错误: {str(e)}")
-        return datetime.now().strftime("%Y-%m-%d")  # 默认使用当前日期
+        return None
 
 
-def fetch_from_rss(source: Dict[str, str]) -> List[Dict[str, Any]]:
+def parse_date(date_str: str) -> str:
     """
-    从RSS源获取新闻
+    解析日期字符串为标准格式 (YYYY-MM-DD)
     
     Args:
-        source: RSS源信息，包含name和url
+        date_str: 日期字符串
+        
+    Returns:
+        标准格式的日期字符串，解析失败时返回当前日期
+    """
+    return _parse_date_cached(date_str) or datetime.now().strftime("%Y-%m-%d")  # 默认使用当前日期
+
+
+def create_session() -> aiohttp.ClientSession:
+    """
+    创建所有新闻源共用的HTTP会话
+    
+    一次运行中的所有请求共用同一个连接池，连接在请求之间保持打开，
+    访问同一站点时不需要重新进行TCP和TLS握手。
+    
+    安装了aiohttp-client-cache时，响应会缓存到磁盘上的SQLite数据库，
+    HTTP_CACHE_EXPIRE秒内再次运行（包括其他进程）请求相同地址时直接使用缓存。
+    
+    Returns:
+        aiohttp会话，需要在事件循环中使用并在结束后关闭
+    """
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS, limit_per_host=MAX_REQUESTS_PER_HOST,
+                                     keepalive_timeout=KEEPALIVE_TIMEOUT, ttl_dns_cache=300)
+    if HAS_HTTP_CACHE:
+        os.makedirs(os.path.dirname(HTTP_CACHE_PATH), exist_ok=True)
+        cache = SQLiteBackend(cache_name=HTTP_CACHE_PATH, expire_after=HTTP_CACHE_EXPIRE,
+                              allowed_codes=(200, 203, 300, 301))
+        return CachedSession(cache=cache, connector=connector)
+    return aiohttp.ClientSession(connector=connector)
+
+
+def _truncate(text: str, limit: int) -> str:
+    """截断过长的文本并添加省略号"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _make_news_item(title: str, summary: str, link: str, published_date: str,
+                    source: Dict[str, Any]) -> Dict[str, str]:
+    """
+    创建新闻项
+    
+    新闻项保持为普通字典：后续的筛选、文章生成和RSS缓存都按键访问新闻字段。
+    
+    Args:
+        title: 新闻标题
+        summary: 新闻摘要，超过SUMMARY_MAX_LENGTH时截断
+        link: 新闻链接
+        published_date: 发布日期
+        source: 新闻源信息
+        
+    Returns:
+        新闻项字典
+    """
+    return {
+        "title": title,
+        "summary": _truncate(summary, SUMMARY_MAX_LENGTH),
+        "link": link,
+        "published_date": published_date,
+        "source": source["name"],
+        "category": source["category"]
+    }
+
+
+def _html_to_text(markup: str) -> str:
+    """去除HTML标签，返回纯文本（与BeautifulSoup的get_text一样不包含脚本和样式）"""
+    tree = LexborHTMLParser(markup)
+    tree.strip_tags(["script", "style"])
+    return tree.root.text().strip()
+
+
+def _strip_html(markup: str) -> str:
+    """
+    去除摘要中的HTML标签并合并空白字符
+    
+    RSS摘要通常是很短的规范HTML，用正则去除标签比构建DOM快得多；
+    去除标签后仍有尖括号（标签不完整或正文中有未转义的<、>）时改用HTML解析器。
+    
+    Args:
+        markup: 可能包含HTML标签的文本
+        
+    Returns:
+        纯文本
+    """
+    if '<' in markup:
+        stripped = _HTML_TAG_PATTERN.sub(' ', _SCRIPT_STYLE_PATTERN.sub(' ', markup))
+        if '<' in stripped or '>' in stripped:
+            text = _html_to_text(markup)
+        else:
+            text = html.unescape(stripped)
+    else:
+        text = html.unescape(markup)
+    return _WHITESPACE_PATTERN.sub(' ', text).strip()
+
+
+def _parse_rss_entries(feed: Any, source: Dict[str, str],
+                       undated: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+    """
+    从解析后的RSS内容中提取新闻
+    
+    Args:
+        feed: feedparser解析结果
+        source: RSS源信息
+        undated: 如果提供，记录没有可解析发布日期、使用当天日期的新闻在结果中的位置
+    
+    Returns:
+        新闻列表
+    """
+    news_list = []
+    # 没有发布日期的条目使用当天日期，每个源只计算一次
+    today = datetime.now().strftime("%Y-%m-%d")
+    
+    for entry in feed.entries:
+        try:
+            # 提取标题
+            title = entry.get("title", "").strip()
+            
+            # 提取摘要
+            summary = ""
+            if hasattr(entry, "summary"):
+                summary = entry.summary
+            elif hasattr(entry, "description"):
+                summary = entry.description
+            elif hasattr(entry, "content"):
+                # 有些RSS源使用content字段
+                for content in entry.content:
+                    if content.get('type') == 'text/html':
+                        summary = content.value
+                        break
+            
+            # 清理HTML标签
+            if summary:
+                try:
+                    summary = _strip_html(summary)
+                except Exception as e:
+                    logger.warning(f"清理HTML标签失败: {str(e)}")
+                    # 如果HTML解析失败，尝试简单的HTML标签移除
+                    summary = summary.replace('<', ' <').replace('>', '> ')
+            
+            # 提取链接
+            link = entry.get("link", "")
+            
+            # 提取发布日期
+            published_date = None
+            if hasattr(entry, "published"):
+                published_date = _parse_date_cached(entry.published)
+            elif hasattr(entry, "updated"):
+                published_date = _parse_date_cached(entry.updated)
+            elif hasattr(entry, "pubDate"):
+                published_date = _parse_date_cached(entry.pubDate)
+            
+            # 创建新闻项
+            if title and link:
+                if not published_date:
+                    published_date = today
+                    if undated is not None:
+                        undated.append(len(news_list))
+                news_list.append(_make_news_item(title, summary, link, published_date, source))
+        except Exception as e:
+            logger.warning(f"处理 {source['name']} 的条目时出错: {str(e)}")
+            continue
+    
+    return news_list
+
+
+def _split_tag(tag: Any) -> Tuple[str, str]:
+    """将{命名空间}标签名拆分为(命名空间, 标签名)，注释等非元素节点返回空标签名"""
+    if not isinstance(tag, str):
+        return "", ""
+    if tag.startswith("{"):
+        namespace, _, local = tag[1:].partition("}")
+        return namespace, local
+    return "", tag
+
+
+class _UnsupportedFeed(Exception):
+    """快速解析不支持的RSS内容，需要交给feedparser处理"""
+
+
+def _element_text(element: Any) -> str:
+    """返回元素内的全部文本，Atom中type为xhtml的内嵌标签无法按文本提取"""
+    if element.get("type") == "xhtml":
+        raise _UnsupportedFeed("xhtml")
+    return "".join(element.itertext())
+
+
+def _fast_parse_entry(item: Any) -> feedparser.FeedParserDict:
+    """
+    从RSS的item或Atom的entry元素中提取需要的字段
+    
+    字段名与feedparser的结果保持一致，后续处理不需要区分解析方式。
+    
+    Args:
+        item: item或entry元素
+        
+    Returns:
+        条目字典
+    """
+    entry = feedparser.FeedParserDict()
+    guid = None
+    
+    for child in item:
+        namespace, local = _split_tag(child.tag)
+        if namespace in FEED_NAMESPACES:
+            if local == "title":
+                entry["title"] = _element_text(child)
+            elif local == "link":
+                # Atom链接在href属性中，优先使用rel为alternate的链接
+                href = child.get("href")
+                if href is None:
+                    entry.setdefault("link", (child.text or "").strip())
+                elif child.get("rel", "alternate") == "alternate":
+                    entry.setdefault("link", href.strip())
+            elif local in ("description", "summary"):
+                entry["summary"] = _element_text(child)
+            elif local == "content":
+                entry["content"] = [feedparser.FeedParserDict(type="text/html", value=_element_text(child))]
+            elif local in ("pubDate", "published", "issued"):
+                entry["published"] = (child.text or "").strip()
+            elif local in ("updated", "modified"):
+                entry["updated"] = (child.text or "").strip()
+            elif local == "guid" and child.get("isPermaLink", "true") == "true":
+                guid = (child.text or "").strip()
+        elif namespace == CONTENT_NAMESPACE and local == "encoded":
+            entry["content"] = [feedparser.FeedParserDict(type="text/html", value=child.text or "")]
+        elif namespace == DC_NAMESPACE and local == "date":
+            entry.setdefault("updated", (child.text or "").strip())
+    
+    # 没有link时，永久链接形式的guid就是文章地址
+    if not entry.get("link") and guid:
+        entry["link"] = guid
+    return entry
+
+
+def _fast_parse_feed(body: bytes) -> Optional[feedparser.FeedParserDict]:
+    """
+    使用流式XML解析器提取RSS/Atom条目，比feedparser快得多
+    
+    每处理完一个条目就清空对应的元素，大型RSS源也只占用少量内存。
+    
+    Args:
+        body: RSS内容
+        
+    Returns:
+        与feedparser结果结构相同的字典，内容不是合法的RSS/Atom或包含不支持的写法时返回None
+    """
+    entries = []
+    root_tag = None
+    try:
+        for event, element in XML_ITERPARSE(io.BytesIO(body), events=("start", "end")):
+            if root_tag is None:
+                root_tag = _split_tag(element.tag)[1]
+                if root_tag not in ("rss", "feed", "RDF"):
+                    return None
+                continue
+            if event != "end":
+                continue
+            namespace, local = _split_tag(element.tag)
+            if local in ("item", "entry") and namespace in FEED_NAMESPACES:
+                entries.append(_fast_parse_entry(element))
+                element.clear()
+    except (_UnsupportedFeed, *XML_PARSE_ERRORS):
+        return None
+    
+    return feedparser.FeedParserDict(entries=entries, bozo=False)
+
+
+def _parse_feed(body: bytes) -> feedparser.FeedParserDict:
+    """
+    解析RSS内容，不符合规范的内容交给feedparser处理
+    
+    Args:
+        body: RSS内容
+        
+    Returns:
+        解析结果
+    """
+    feed = _fast_parse_feed(body)
+    if feed is None:
+        feed = feedparser.parse(body)
+    return feed
+
+
+def json_dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    将数据序列化为UTF-8编码的JSON，安装了orjson时使用orjson
+    
+    Args:
+        data: 要序列化的数据
+        indent: 是否使用两个空格缩进
+        
+    Returns:
+        JSON字节串
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def json_loads(data: bytes) -> Any:
+    """解析JSON字节串，安装了orjson时使用orjson"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_feed_cache() -> Dict[str, Dict[str, Any]]:
+    """
+    加载RSS源的缓存（ETag、Last-Modified和上次解析出的新闻），首次调用时从磁盘读取
+    
+    Returns:
+        以RSS地址为键的缓存字典
+    """
+    global _feed_cache
+    if _feed_cache is None:
+        _feed_cache = {}
+        try:
+            with open(FEED_CACHE_PATH, 'rb') as f:
+                _feed_cache = json_loads(f.read())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"读取RSS缓存失败: {str(e)}")
+        atexit.register(_save_feed_cache)
+    return _feed_cache
+
+
+def _save_feed_cache() -> None:
+    """
+    进程退出时将RSS缓存写入磁盘
+    
+    先写入同目录下的临时文件，再通过os.replace原子地替换，多个进程同时退出时
+    缓存文件只会是其中某个进程写入的完整内容，不会被截断或交错写坏。
+    """
+    if not _feed_cache:
+        return
+    tmp_path = None
+    try:
+        cache_dir = os.path.dirname(FEED_CACHE_PATH)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix="feed_meta.", suffix=".tmp", dir=cache_dir)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(json_dumps(_feed_cache))
+        os.replace(tmp_path, FEED_CACHE_PATH)
+    except Exception as e:
+        logger.warning(f"保存RSS缓存失败: {str(e)}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+async def _get_feed(session: aiohttp.ClientSession, url: str, source: Dict[str, str]) -> Any:
+    """
+    下载并解析RSS内容，请求时带上上次的ETag和Last-Modified
+    
+    Args:
+        session: HTTP会话
+        url: RSS地址
+        source: RSS源信息
+    
+    Returns:
+        feedparser解析结果，href、etag和modified字段记录本次请求的地址和响应头；
+        内容未变化（304）时返回status为304的空结果
+    """
+    headers = {'User-Agent': get_random_user_agent()}
+    cached = _load_feed_cache().get(url)
+    if cached:
+        if cached.get("etag"):
+            headers['If-None-Match'] = cached["etag"]
+        if cached.get("modified"):
+            headers['If-Modified-Since'] = cached["modified"]
+    
+    limiter = get_host_limiter(url)
+    await limiter.acquire()
+    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=10)) as response:
+        limiter.observe(response)
+        if response.status == 304:
+            logger.debug("%s RSS源内容未变化，使用缓存", source['name'])
+            return feedparser.FeedParserDict(status=304, href=url, entries=[], bozo=False)
+        
+        response.raise_for_status()  # 如果状态码不是200，会抛出异常
         
+        logger.debug("%s RSS源可访问，状态码: %d", source['name'], response.status)
+        
+        # 检查内容类型是否为XML
+        content_type = response.headers.get('Content-Type', '').lower()
+        if 'xml' not in content_type and 'rss' not in content_type and 'application/atom+xml' not in content_type:
+            logger.warning(f"{source['name']} 返回的内容类型不是XML: {content_type}")
+            # 尝试强制解析，但记录警告
+        
+        body = await response.read()
+        etag = response.headers.get('ETag')
+        modified = response.headers.get('Last-Modified')
+    
+    # 直接解析下载到的内容，避免feedparser自己再发起阻塞请求
+    loop = asyncio.get_running_loop()
+    feed = await loop.run_in_executor(PARSER_POOL, _parse_feed, body)
+    feed['status'] = response.status
+    feed['href'] = url
+    feed['etag'] = etag
+    feed['modified'] = modified
+    return feed
+
+
+async def fetch_from_rss_async(session: aiohttp.ClientSession, source: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    从RSS源异步获取新闻
+    
+    Args:
+        session: HTTP会话
+        source: RSS源信息，包含name和url
+    
     Returns:
         新闻列表，每条新闻包含title, summary, link, published_date
     """
@@ -245,63 +877,53 @@ def fetch_from_rss(source: Dict[str, str]) -> List[Dict[str, Any]]:
     try:
         logger.info(f"正在从 {source['name']} 获取RSS新闻")
         
-        # 添加用户代理和超时设置
-        headers = {'User-Agent': get_random_user_agent()}
-        
         # 尝试使用主URL获取RSS
         try:
-            # 先尝试直接请求RSS URL，检查是否可访问
-            response = requests.get(source["url"], headers=headers, timeout=10)
-            response.raise_for_status()  # 如果状态码不是200，会抛出异常
-            
-            logger.debug(f"{source['name']} RSS源可访问，状态码: {response.status_code}")
-            
-            # 检查内容类型是否为XML
-            content_type = response.headers.get('Content-Type', '').lower()
-            if 'xml' not in content_type and 'rss' not in content_type and 'application/atom+xml' not in content_type:
-                logger.warning(f"{source['name']} 返回的内容类型不是XML: {content_type}")
-                # 尝试强制解析，但记录警告
+            feed = await _get_feed(session, source["url"], source)
             
-            # 使用响应内容而不是URL来解析，避免重复请求
-            feed = feedparser.parse(response.content)
-            
-            # 检查是否成功解析到条目
-            if not feed.entries and 'backup_url' in source:
+            # 检查是否成功解析到条目（内容未变化时不需要尝试备用URL）
+            if feed.status != 304 and not feed.entries and 'backup_url' in source:
                 logger.warning(f"{source['name']} 主URL未返回条目，尝试备用URL")
-                backup_response = requests.get(source["backup_url"], headers=headers, timeout=10)
-                backup_response.raise_for_status()
-                feed = feedparser.parse(backup_response.content)
+                feed = await _get_feed(session, source["backup_url"], source)
         
-        except requests.exceptions.HTTPError as e:
+        except aiohttp.ClientResponseError as e:
             # HTTP错误（如404, 500等）
             if 'backup_url' in source:
                 logger.warning(f"{source['name']} 主URL HTTP错误: {str(e)}，尝试备用URL")
                 try:
-                    backup_response = requests.get(source["backup_url"], headers=headers, timeout=10)
-                    backup_response.raise_for_status()
-                    feed = feedparser.parse(backup_response.content)
+                    feed = await _get_feed(session, source["backup_url"], source)
                 except Exception as be:
                     logger.error(f"{source['name']} 备用URL也失败: {str(be)}")
                     return []
             else:
                 logger.error(f"{source['name']} HTTP错误: {str(e)}")
                 return []
-                
-        except requests.exceptions.ConnectionError as e:
-            # 连接错误
-            logger.error(f"{source['name']} 连接错误: {str(e)}")
-            return []
-            
-        except requests.exceptions.Timeout as e:
+        
+        except asyncio.TimeoutError as e:
             # 超时错误
             logger.error(f"{source['name']} 请求超时: {str(e)}")
             return []
-            
-        except requests.exceptions.RequestException as e:
+        
+        except aiohttp.ClientConnectionError as e:
+            # 连接错误
+            logger.error(f"{source['name']} 连接错误: {str(e)}")
+            return []
+        
+        except aiohttp.ClientError as e:
             # 其他请求错误
             logger.error(f"{source['name']} 请求错误: {str(e)}")
             return []
         
+        # 内容未变化，直接返回上次解析出的新闻，没有发布日期的新闻重新使用当天日期
+        if feed.status == 304:
+            cached = _load_feed_cache()[feed.href]
+            news_list = [dict(item) for item in cached["news"]]
+            today = datetime.now().strftime("%Y-%m-%d")
+            for index in cached.get("undated", ()):
+                news_list[index]["published_date"] = today
+            logger.info(f"{source['name']} 内容未变化，使用缓存的 {len(news_list)} 条新闻")
+            return news_list
+        
         # 检查feed是否有错误
         if hasattr(feed, 'bozo') and feed.bozo:
             logger.warning(f"{source['name']} RSS解析警告: {getattr(feed, 'bozo_exception', 'Unknown error')}")
@@ -311,84 +933,120 @@ def fetch_from_rss(source: Dict[str, str]) -> List[Dict[str, Any]]:
                 return []
         
         # 记录获取到的条目数量
-        logger.debug(f"{source['name']} 获取到 {len(feed.entries)} 条原始条目")
-        
-        for entry in feed.entries:
-            try:
-                # 提取标题
-                title = entry.get("title", "").strip()
-                
-                # 提取摘要
-                summary = ""
-                if hasattr(entry, "summary"):
-                    summary = entry.summary
-                elif hasattr(entry, "description"):
-                    summary = entry.description
-                elif hasattr(entry, "content"):
-                    # 有些RSS源使用content字段
-                    for content in entry.content:
-                        if content.get('type') == 'text/html':
-                            summary = content.value
-                            break
-                
-                # 清理HTML标签
-                if summary:
-                    try:
-                        soup = BeautifulSoup(summary, "html.parser")
-                        summary = soup.get_text().strip()
-                    except Exception as e:
-                        logger.warning(f"清理HTML标签失败: {str(e)}")
-                        # 如果BeautifulSoup失败，尝试简单的HTML标签移除
-                        summary = summary.replace('<', ' <').replace('>', '> ')
-                
-                # 提取链接
-                link = entry.get("link", "")
-                
-                # 提取发布日期
-                published_date = datetime.now().strftime("%Y-%m-%d")
-                if hasattr(entry, "published"):
-                    published_date = parse_date(entry.published)
-                elif hasattr(entry, "updated"):
-                    published_date = parse_date(entry.updated)
-                elif hasattr(entry, "pubDate"):
-                    published_date = parse_date(entry.pubDate)
-                
-                # 创建新闻项
-                if title and link:
-                    news_item = {
-                        "title": title,
-                        "summary": summary[:300] + "..." if len(summary) > 300 else summary,
-                        "link": link,
-                        "published_date": published_date,
-                        "source": source["name"],
-                        "category": source["category"]
-                    }
-                    news_list.append(news_item)
-            except Exception as e:
-                logger.warning(f"处理 {source['name']} 的条目时出错: {str(e)}")
-                continue
+        # 调试日志使用%格式，未开启DEBUG级别时不会格式化字符串
+        logger.debug("%s 获取到 %d 条原始条目", source['name'], len(feed.entries))
         
-        logger.info(f"从 {source['name']} 获取到 {len(news_list)} 条新闻")
+        # 整个条目循环放在一次线程池调用中，分摊线程切换的开销
+        loop = asyncio.get_running_loop()
+        undated: List[int] = []
+        news_list = await loop.run_in_executor(PARSER_POOL, _parse_rss_entries, feed, source, undated)
+        
+        # 记录缓存验证信息，下次请求时服务器可以直接返回304
+        if feed.etag or feed.modified:
+            _load_feed_cache()[feed.href] = {
+                "etag": feed.etag,
+                "modified": feed.modified,
+                "news": [dict(item) for item in news_list],
+                "undated": undated
+            }
         
+        logger.info(f"从 {source['name']} 获取到 {len(news_list)} 条新闻")
+    
     except Exception as e:
         logger.error(f"从 {source['name']} 获取RSS新闻失败: {str(e)}")
     
     return news_list
 
 
-def fetch_from_web(source: Dict[str, Any]) -> List[Dict[str, Any]]:
+def _select_first(node: LexborNode, selector: str) -> Optional[LexborNode]:
+    """查找节点内第一个匹配的后代元素（不包含节点本身，与BeautifulSoup的select_one行为一致）"""
+    for element in node.css(selector):
+        if element.mem_id != node.mem_id:
+            return element
+    return None
+
+
+def _parse_web_articles(html: str, source: Dict[str, Any]) -> List[Dict[str, Any]]:
     """
-    从网页爬取新闻
+    从网页HTML中提取新闻
     
     Args:
+        html: 网页HTML
+        source: 网页源信息
+    
+    Returns:
+        新闻列表
+    """
+    news_list = []
+    tree = LexborHTMLParser(html)
+    today = datetime.now().strftime("%Y-%m-%d")
+    # 从源URL中提取站点地址，用于补全相对链接
+    url_parts = urlsplit(source["url"])
+    base_url = f"{url_parts.scheme}://{url_parts.netloc}"
+    
+    # 所有网站使用同一套解析逻辑，差异只在各自的选择器配置中
+    selector = source["selector"]
+    articles = tree.css(selector.get("article", "article"))
+    
+    if not articles:
+        logger.warning(f"{source['name']} 未找到文章元素，选择器可能需要更新")
+        return []
+    
+    for article in articles[:10]:  # 限制为前10篇文章
+        try:
+            # 提取标题
+            title_elem = _select_first(article, selector.get("title", "h2"))
+            title = title_elem.text().strip() if title_elem else ""
+            
+            # 提取链接
+            link_elem = _select_first(article, selector.get("link", "a"))
+            link = (link_elem.attributes.get("href") or "") if link_elem else ""
+            
+            # 确保链接是完整的URL
+            if link and not link.startswith(("http://", "https://")):
+                link = base_url + (link if link.startswith("/") else "/" + link)
+            
+            # 提取摘要
+            summary_elem = _select_first(article, selector.get("summary", "p"))
+            summary = summary_elem.text().strip() if summary_elem else ""
+            
+            # 提取日期
+            date_elem = _select_first(article, selector.get("date", "time"))
+            published_date = today
+            if date_elem:
+                date_text = date_elem.text().strip()
+                if date_text:
+                    published_date = parse_date(date_text)
+            
+            # 创建新闻项
+            if title and link:
+                news_list.append(_make_news_item(title, summary, link, published_date, source))
+        except Exception as e:
+            logger.warning(f"处理 {source['name']} 的文章时出错: {str(e)}")
+            continue
+    
+    return news_list
+
+
+async def fetch_from_web_async(session: aiohttp.ClientSession, source: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    从网页异步爬取新闻
+    
+    Args:
+        session: HTTP会话
         source: 网页源信息，包含name和url
-        
+    
     Returns:
         新闻列表，每条新闻包含title, summary, link, published_date
     """
     news_list = []
     
     try:
+        # 没有配置选择器的网站无法解析，不必下载网页
+        if "selector" not in source:
+            logger.warning(f"{source['name']} 没有配置选择器，跳过")
+            return []
+        
         logger.info(f"正在从 {source['name']} 爬取网页新闻")
         
         headers = {
@@ -404,91 +1062,42 @@ def fetch_from_web(source: Dict[str, Any]) -> List[Dict[str, Any]]:
             max_retries = 3
             retry_delay = 2  # 秒
             
+            limiter = get_host_limiter(source["url"])
             for attempt in range(max_retries):
                 try:
-                    response = requests.get(source["url"], headers=headers, timeout=15)
-                    response.raise_for_status()
+                    await limiter.acquire()
+                    async with session.get(source["url"], headers=headers,
+                                           timeout=aiohttp.ClientTimeout(total=15)) as response:
+                        limiter.observe(response)
+                        response.raise_for_status()
+                        html = await response.text()
                     break  # 成功获取，跳出循环
-                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
                     if attempt < max_retries - 1:
                         logger.warning(f"{source['name']} 请求失败 (尝试 {attempt+1}/{max_retries}): {str(e)}")
-                        time.sleep(retry_delay * (attempt + 1))  # 指数退避
+                        # 退避等待期间不阻塞其他新闻源的请求
+                        await asyncio.sleep(retry_delay * (attempt + 1))
                     else:
                         raise  # 最后一次尝试仍失败，抛出异常
             
             # 检查响应内容是否为空
-            if not response.text:
+            if not html:
                 logger.warning(f"{source['name']} 返回了空内容")
                 return []
             
-            soup = BeautifulSoup(response.text, "html.parser")
-            
-            # 根据不同网站使用不同的解析逻辑
-            if "selector" in source:
-                # 使用自定义选择器
-                selector = source["selector"]
-                articles = soup.select(selector.get("article", "article"))
-                
-                if not articles:
-                    logger.warning(f"{source['name']} 未找到文章元素，选择器可能需要更新")
-                    return []
-                
-                for article in articles[:10]:  # 限制为前10篇文章
-                    try:
-                        # 提取标题
-                        title_elem = article.select_one(selector.get("title", "h2"))
-                        title = title_elem.get_text().strip() if title_elem else ""
-                        
-                        # 提取链接
-                        link_elem = article.select_one(selector.get("link", "a"))
-                        link = link_elem.get("href", "") if link_elem else ""
-                        
-                        # 确保链接是完整的URL
-                        if link and not link.startswith(("http://", "https://")):
-                            # 从源URL中提取域名
-                            domain = "/".join(source["url"].split("/")[:3])
-                            link = domain + (link if link.startswith("/") else "/" + link)
-                        
-                        # 提取摘要
-                        summary_elem = article.select_one(selector.get("summary", "p"))
-                        summary = summary_elem.get_text().strip() if summary_elem else ""
-                        
-                        # 提取日期
-                        date_elem = article.select_one(selector.get("date", "time"))
-                        published_date = datetime.now().strftime("%Y-%m-%d")
-                        if date_elem:
-                            date_text = date_elem.get_text().strip()
-                            if date_text:
-                                published_date = parse_date(date_text)
-                        
-                        # 创建新闻项
-                        if title and link:
-                            news_item = {
-                                "title": title,
-                                "summary": summary[:300] + "..." if len(summary) > 300 else summary,
-                                "link": link,
-                                "published_date": published_date,
-                                "source": source["name"],
-                                "category": source["category"]
-                            }
-                            news_list.append(news_item)
-                    except Exception as e:
-                        logger.warning(f"处理 {source['name']} 的文章时出错: {str(e)}")
-                        continue
-            else:
-                # 特定网站的自定义解析逻辑
-                # ... 其他特定网站的解析逻辑 ...
-                pass
+            # 单个网页的解析只需要几百微秒，在线程池中进行，比进程池的启动和序列化开销小得多
+            loop = asyncio.get_running_loop()
+            news_list = await loop.run_in_executor(PARSER_POOL, _parse_web_articles, html, source)
             
             logger.info(f"从 {source['name']} 爬取到 {len(news_list)} 条新闻")
-            
-        except requests.exceptions.HTTPError as e:
+        
+        except aiohttp.ClientResponseError as e:
             logger.error(f"{source['name']} HTTP错误: {str(e)}")
-        except requests.exceptions.ConnectionError as e:
-            logger.error(f"{source['name']} 连接错误: {str(e)}")
-        except requests.exceptions.Timeout as e:
+        except asyncio.TimeoutError as e:
             logger.error(f"{source['name']} 请求超时: {str(e)}")
-        except requests.exceptions.RequestException as e:
+        except aiohttp.ClientConnectionError as e:
+            logger.error(f"{source['name']} 连接错误: {str(e)}")
+        except aiohttp.ClientError as e:
             logger.error(f"{source['name']} 请求错误: {str(e)}")
         except Exception as e:
             logger.error(f"{source['name']} 爬取网页新闻失败: {str(e)}")
@@ -499,92 +1108,205 @@ def fetch_from_web(source: Dict[str, Any]) -> List[Dict[str, Any]]:
     return news_list
 
 
-def check_source_health(sources: List[Dict[str, Any]], source_type: str = "rss") -> List[Dict[str, Any]]:
+async def _run_with_session(fetch: Callable, source: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """使用临时会话执行单个新闻源的异步获取"""
+    async with create_session() as session:
+        return await fetch(session, source)
+
+
+def fetch_from_rss(source: Dict[str, str]) -> List[Dict[str, Any]]:
     """
-    检查新闻源的健康状态，标记或更新失效的源
+    从RSS源获取新闻（同步版本，单独测试某个源时使用）
     
     Args:
+        source: RSS源信息，包含name和url
+    
+    Returns:
+        新闻列表，每条新闻包含title, summary, link, published_date
+    """
+    return asyncio.run(_run_with_session(fetch_from_rss_async, source))
+
+
+def fetch_from_web(source: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    从网页爬取新闻（同步版本，单独测试某个源时使用）
+    
+    Args:
+        source: 网页源信息，包含name和url
+    
+    Returns:
+        新闻列表，每条新闻包含title, summary, link, published_date
+    """
+    return asyncio.run(_run_with_session(fetch_from_web_async, source))
+
+
+async def _is_source_healthy(session: aiohttp.ClientSession, source: Dict[str, Any]) -> bool:
+    """
+    检查单个新闻源是否可以访问
+    
+    Args:
+        session: HTTP会话
+        source: 新闻源信息
+    
+    Returns:
+        新闻源是否健康
+    """
+    try:
+        headers = {'User-Agent': get_random_user_agent()}
+        limiter = get_host_limiter(source["url"])
+        await limiter.acquire()
+        async with session.get(source["url"], headers=headers,
+                               timeout=aiohttp.ClientTimeout(total=5)) as response:
+            limiter.observe(response)
+            if response.status >= 400:
+                logger.warning(f"{source['name']} 返回状态码 {response.status}，可能不健康")
+                return False
+            return True
+    except Exception as e:
+        logger.warning(f"{source['name']} 健康检查失败: {str(e)}")
+        return False
+
+
+async def check_source_health_async(session: aiohttp.ClientSession, sources: List[Dict[str, Any]],
+                                    source_type: str = "rss") -> List[Dict[str, Any]]:
+    """
+    并发检查新闻源的健康状态，标记或更新失效的源
+    
+    Args:
+        session: HTTP会话
         sources: 新闻源列表
         source_type: 源类型，"rss"或"web"
-        
+    
     Returns:
         更新后的新闻源列表
     """
-    healthy_sources = []
-    unhealthy_sources = []
-    
-    for source in sources:
-        try:
-            headers = {'User-Agent': get_random_user_agent()}
-            response = requests.get(source["url"], headers=headers, timeout=5)
-            
-            if response.status_code >= 400:
-                logger.warning(f"{source['name']} 返回状态码 {response.status_code}，可能不健康")
-                unhealthy_sources.append(source)
-            else:
-                healthy_sources.append(source)
-                
-        except Exception as e:
-            logger.warning(f"{source['name']} 健康检查失败: {str(e)}")
-            unhealthy_sources.append(source)
+    results = await asyncio.gather(*(_is_source_healthy(session, source) for source in sources))
+    healthy_sources = [source for source, healthy in zip(sources, results) if healthy]
+    unhealthy_sources = [source for source, healthy in zip(sources, results) if not healthy]
     
     # 记录不健康的源
     if unhealthy_sources:
-        logger.warning(f"发现 {len(unhealthy_sources)} 个不健康的{source_type}源: " + 
+        logger.warning(f"发现 {len(unhealthy_sources)} 个不健康的{source_type}源: " +
                       ", ".join([s["name"] for s in unhealthy_sources]))
     
     return healthy_sources
 
 
-def fetch_news(max_sources: int = None, check_health: bool = True) -> List[Dict[str, Any]]:
+def check_source_health(sources: List[Dict[str, Any]], source_type: str = "rss") -> List[Dict[str, Any]]:
     """
-    从所有来源获取新闻
+    检查新闻源的健康状态，标记或更新失效的源
     
     Args:
-        max_sources: 最大源数量，None表示不限制
-        check_health: 是否检查源健康状态
+        sources: 新闻源列表
+        source_type: 源类型，"rss"或"web"
+    
+    Returns:
+        更新后的新闻源列表
+    """
+    async def run() -> List[Dict[str, Any]]:
+        async with create_session() as session:
+            return await check_source_health_async(session, sources, source_type)
+    
+    return asyncio.run(run())
+
+
+def _normalize_link(link: str) -> str:
+    """
+    规范化新闻链接，用于判断不同来源的新闻是否指向同一篇文章
+    
+    去掉utm_*跟踪参数和#片段，域名统一为小写。
+    
+    Args:
+        link: 新闻链接
         
     Returns:
-        新闻列表
+        规范化后的链接
     """
-    all_news = []
+    parts = urlsplit(link.strip())
+    query = parts.query
+    if 'utm_' in query:
+        query = urlencode([(key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+                           if not key.startswith('utm_')])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+
+async def fetch_news_async(max_sources: int = None, check_health: bool = True) -> List[Dict[str, Any]]:
+    """
+    并发地从所有来源获取新闻
     
-    # 检查RSS源健康状态
-    rss_sources = RSS_SOURCES
-    if check_health:
-        rss_sources = check_source_health(RSS_SOURCES, "rss")
+    Args:
+        max_sources: 最大源数量，None表示不限制
+        check_health: 是否记录不健康的源。源的健康状态直接由本次获取的结果判断，
+                      不再为每个源单独发送一次探测请求
     
-    # 限制源数量
-    if max_sources:
-        rss_sources = rss_sources[:max_sources]
+    Returns:
+        新闻列表，顺序与逐个获取时相同（先RSS源，后网页源）
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
     
-    # 从RSS源获取新闻
-    for source in rss_sources:
-        news = fetch_from_rss(source)
-        all_news.extend(news)
-        # 添加短暂延迟，避免请求过于频繁
-        time.sleep(0.5)
+    async def limited(fetch: Callable, session: aiohttp.ClientSession, source: Dict[str, Any]) -> Any:
+        async with semaphore:
+            return await fetch(session, source)
     
-    # 检查网页源健康状态
+    rss_sources = RSS_SOURCES
     web_sources = WEB_SOURCES
-    if check_health:
-        web_sources = check_source_health(WEB_SOURCES, "web")
     
     # 限制源数量
     if max_sources:
+        rss_sources = rss_sources[:max_sources]
         web_sources = web_sources[:max_sources]
     
-    # 从网页源获取新闻
-    for source in web_sources:
-        news = fetch_from_web(source)
-        all_news.extend(news)
-        # 添加短暂延迟，避免请求过于频繁
-        time.sleep(0.5)
+    async with create_session() as session:
+        # 所有新闻源同时获取，总耗时约等于最慢的一个源
+        tasks = [limited(fetch_from_rss_async, session, source) for source in rss_sources]
+        tasks += [limited(fetch_from_web_async, session, source) for source in web_sources]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    
+    all_news = []
+    empty_sources = []
+    # 多个源经常转载同一篇新闻，按规范化后的链接去重，只保留第一次出现的新闻
+    seen_links = set()
+    duplicates = 0
+    for source, result in zip(rss_sources + web_sources, results):
+        if isinstance(result, BaseException):
+            logger.error(f"从 {source['name']} 获取新闻失败: {str(result)}")
+            result = []
+        if not result:
+            empty_sources.append(source)
+        for news in result:
+            link = _normalize_link(news["link"])
+            if link in seen_links:
+                duplicates += 1
+                continue
+            seen_links.add(link)
+            all_news.append(news)
+    
+    if duplicates:
+        logger.info(f"去除了 {duplicates} 条链接重复的新闻")
+    
+    # 获取失败或没有返回新闻的源视为不健康（具体原因已在获取时记录）
+    if check_health and empty_sources:
+        logger.warning(f"发现 {len(empty_sources)} 个不健康的源: " +
+                      ", ".join([s["name"] for s in empty_sources]))
     
     logger.info(f"总共获取到 {len(all_news)} 条新闻")
     return all_news
 
 
+def fetch_news(max_sources: int = None, check_health: bool = True) -> List[Dict[str, Any]]:
+    """
+    从所有来源获取新闻
+    
+    Args:
+        max_sources: 最大源数量，None表示不限制
+        check_health: 是否检查源健康状态
+    
+    Returns:
+        新闻列表
+    """
+    return asyncio.run(fetch_news_async(max_sources, check_health))
+
+
 if __name__ == "__main__":
     # 配置日志
     logging.basicConfig(
@@ -595,5 +1317,5 @@ if __name__ == "__main__":
     # 测试获取新闻
     news = fetch_news()
     
-    # 打印结果
-    print(json.dumps(news, indent=2, ensure_ascii=False)) 
\ No newline at end of file
+    # 打印结果（直接输出UTF-8字节）
+    sys.stdout.buffer.write(json_dumps(news, indent=True) + b"\n") 
\ No newline at end of file
@@ -7,16 +7,25 @@
 对获取的新闻进行筛选，包括去重、关键词匹配和排序。
 """
 
+import functools
 import logging
-import json
+import sys
 from datetime import datetime
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
 import re
+from operator import itemgetter
 from dateutil import parser as date_parser
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
 import numpy as np
-from src.storage.article_storage import check_news_exists  # 导入新函数
+from src.storage.article_storage import check_news_exists_batch
+
+# 尝试导入pyahocorasick，一次扫描即可找出全部关键词，比逐个尝试正则分支快得多
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
 
 # 配置日志
 logger = logging.getLogger(__name__)
@@ -33,9 +42,43 @@ AI_KEYWORDS = [
     "向量数据库", "Vector Database", "嵌入", "Embedding"
 ]
 
+# 只用两段文本拟合TF-IDF时，只在其中一段出现的词的平滑IDF：ln((1+2)/(1+1))+1
+PAIR_IDF_UNIQUE = float(np.log(1.5) + 1)
+
+# 向量器只创建一次并在每次计算时重新拟合，避免重复构建和校验参数
+PAIR_VECTORIZER = TfidfVectorizer()
+TERM_COUNTER = CountVectorizer()
+
 # 编译正则表达式模式
 AI_PATTERN = re.compile("|".join(r"\b{}\b".format(re.escape(kw)) for kw in AI_KEYWORDS), re.IGNORECASE)
 
+# 判断关键词边界时使用与AI_PATTERN中\b相同的单词字符定义
+WORD_CHAR_PATTERN = re.compile(r"\w")
+
+
+def _build_ai_automaton() -> Optional["ahocorasick.Automaton"]:
+    """构建AI关键词的Aho-Corasick自动机，未安装pyahocorasick时返回None"""
+    if not HAS_AHOCORASICK:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, keyword in enumerate(AI_KEYWORDS):
+        lowered = keyword.lower()
+        # 同一关键词重复出现时保留靠前的位置，与正则分支的优先顺序一致
+        if lowered not in automaton:
+            automaton.add_word(lowered, (index, len(lowered)))
+    automaton.make_automaton()
+    return automaton
+
+
+AI_AUTOMATON = _build_ai_automaton()
+
+
+def _is_word_boundary(text: str, position: int) -> bool:
+    """判断text中position处是否为单词边界，规则与正则的\b相同"""
+    before = position > 0 and WORD_CHAR_PATTERN.match(text, position - 1) is not None
+    after = position < len(text) and WORD_CHAR_PATTERN.match(text, position) is not None
+    return before != after
+
 
 def is_ai_related(text: str) -> bool:
     """
@@ -47,7 +90,91 @@ def is_ai_related(text: str) -> bool:
     Returns:
         如果文本包含AI关键词，返回True，否则返回False
     """
-    return bool(AI_PATTERN.search(text))
+    return next(_iter_ai_spans(text), None) is not None
+
+
+def _iter_ai_spans(text: str, lowered: Optional[str] = None) -> Iterator[Tuple[int, int]]:
+    """
+    逐个给出文本中AI关键词的起止位置，结果与AI_PATTERN.finditer相同
+    
+    安装了pyahocorasick时用自动机一次扫描全部关键词，再按正则的规则检查单词边界，
+    并从左到右选出互不重叠的匹配。
+    
+    Args:
+        text: 要检查的文本
+        lowered: 已转为小写的文本，为None时在此处转换
+        
+    Yields:
+        每个匹配的(起始位置, 结束位置)
+    """
+    if lowered is None:
+        lowered = text.lower()
+    # 个别字符转为小写后长度会变化，此时位置无法对应回原文，改用正则
+    if AI_AUTOMATON is None or len(lowered) != len(text):
+        for match in AI_PATTERN.finditer(text):
+            yield match.span()
+        return
+    
+    candidates = []
+    for end, (index, length) in AI_AUTOMATON.iter(lowered):
+        start = end + 1 - length
+        if _is_word_boundary(text, start) and _is_word_boundary(text, end + 1):
+            candidates.append((start, index, end + 1))
+    
+    # 同一位置有多个关键词时，正则选择列表中靠前的关键词
+    position = 0
+    for start, _, end in sorted(candidates):
+        if start >= position:
+            yield start, end
+            position = end
+
+
+def scan_ai(text: str, lowered: Optional[str] = None) -> List[str]:
+    """
+    找出文本中出现的全部AI关键词，结果与AI_PATTERN.findall相同
+    
+    Args:
+        text: 要检查的文本
+        lowered: 已转为小写的文本，为None时在此处转换
+        
+    Returns:
+        匹配到的关键词列表，没有匹配时为空列表
+    """
+    return [text[start:end] for start, end in _iter_ai_spans(text, lowered)]
+
+
+def count_ai(text: str, lowered: Optional[str] = None) -> int:
+    """
+    统计文本中AI关键词出现的次数，只计数，不构建匹配结果列表
+    
+    Args:
+        text: 要检查的文本
+        lowered: 已转为小写的文本，为None时在此处转换
+        
+    Returns:
+        关键词出现的次数
+    """
+    return sum(1 for _ in _iter_ai_spans(text, lowered))
+
+
+def scan_news_ai(news: Dict[str, Any]) -> bool:
+    """
+    统计新闻标题和摘要中的AI关键词数量，结果保存在新闻的_title_ai和_summary_ai中
+    
+    每条新闻的标题和摘要只扫描一次，calculate_news_score直接读取保存的数量。
+    转为小写的标题保存在_title_lc中，供remove_duplicates直接使用。
+    
+    Args:
+        news: 新闻项
+        
+    Returns:
+        如果标题或摘要包含AI关键词，返回True，否则返回False
+    """
+    title, summary = news.get("title", ""), news.get("summary", "")
+    title_lc = news["_title_lc"] = title.lower()
+    title_hits = news["_title_ai"] = count_ai(title, title_lc)
+    summary_hits = news["_summary_ai"] = count_ai(summary)
+    return bool(title_hits or summary_hits)
 
 
 def calculate_similarity(text1: str, text2: str) -> float:
@@ -65,15 +192,92 @@ def calculate_similarity(text1: str, text2: str) -> float:
         return 0.0
     
     try:
-        vectorizer = TfidfVectorizer()
-        tfidf_matrix = vectorizer.fit_transform([text1, text2])
-        similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-        return float(similarity)
+        # TfidfVectorizer输出的向量已按L2范数归一化，余弦相似度就是两个向量的点积
+        tfidf_matrix = PAIR_VECTORIZER.fit_transform([text1, text2])
+        return float(tfidf_matrix[0].multiply(tfidf_matrix[1]).sum())
     except Exception as e:
         logger.warning(f"计算文本相似度时出错: {str(e)}")
         return 0.0
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_published_date(date_str: str) -> Optional[datetime]:
+    """
+    解析新闻的发布日期，结果按字符串缓存
+    
+    新闻获取模块输出的发布日期是ISO格式（YYYY-MM-DD），先用datetime.fromisoformat解析，
+    其他格式再交给dateutil猜测。
+    
+    Args:
+        date_str: 日期字符串
+        
+    Returns:
+        解析得到的日期，解析失败时返回None
+    """
+    try:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        pass
+    
+    try:
+        return date_parser.parse(date_str)
+    except Exception:
+        return None
+
+
+def _days_old(published_date: str, now: datetime) -> float:
+    """计算新闻发布至今的天数，日期无法解析时返回NaN"""
+    try:
+        return float((now - _parse_published_date(published_date)).days)
+    except Exception:
+        return np.nan
+
+
+def calculate_news_scores(news_list: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    批量计算多条新闻的得分
+    
+    先把来源分类、发布天数和关键词数量整理成数组，再一次性完成全部加减分，
+    结果与对每条新闻调用calculate_news_score相同。
+    
+    Args:
+        news_list: 新闻列表
+        
+    Returns:
+        每条新闻的得分，范围为0到100
+    """
+    now = datetime.now()
+    for news in news_list:
+        # 优先使用filter_news中已扫描的关键词
+        if "_title_ai" not in news or "_summary_ai" not in news:
+            scan_news_ai(news)
+    
+    categories = np.array([news.get("category", "") for news in news_list], dtype=object)
+    days_old = np.array([_days_old(news.get("published_date", ""), now) for news in news_list], dtype=float)
+    title_keywords = np.array([news["_title_ai"] for news in news_list], dtype=float)
+    summary_keywords = np.array([news["_summary_ai"] for news in news_list], dtype=float)
+    
+    scores = np.full(len(news_list), 50.0)  # 基础分数
+    
+    # 根据来源调整分数：AI公司的官方博客更可靠，科技新闻网站较可靠
+    scores += np.where(categories == "ai_company", 20, np.where(categories == "tech_news", 10, 0))
+    
+    # 根据发布日期调整分数（越新越好），最近7天的新闻得分更高，更早的最多减30分
+    date_bonus = np.select(
+        [days_old <= 1, days_old <= 3, days_old <= 7],
+        [20, 15, 10],
+        -np.minimum(days_old, 30)
+    )
+    scores += np.where(np.isnan(days_old), 0, date_bonus)
+    
+    # 标题中的关键词最多加15分，摘要中的关键词最多加10分
+    scores += np.minimum(title_keywords * 5, 15)
+    scores += np.minimum(summary_keywords * 2, 10)
+    
+    # 确保分数在0-100范围内
+    return np.clip(scores, 0, 100)
+
+
 def calculate_news_score(news: Dict[str, Any]) -> float:
     """
     计算新闻的得分
@@ -84,93 +288,115 @@ def calculate_news_score(news: Dict[str, Any]) -> float:
     Returns:
         新闻的得分，范围为0到100
     """
-    score = 50.0  # 基础分数
+    return float(calculate_news_scores([news])[0])
+
+
+def _pairwise_similarity(counts: sparse.csr_matrix, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """
+    批量计算多对文本的相似度，结果与对每一对文本调用calculate_similarity相同
     
-    # 根据来源调整分数
-    source_category = news.get("category", "")
-    if source_category == "ai_company":
-        score += 20  # AI公司的官方博客更可靠
-    elif source_category == "tech_news":
-        score += 10  # 科技新闻网站较可靠
+    calculate_similarity只用两段文本拟合TF-IDF，此时平滑后的IDF只有两种取值：
+    两段文本都出现的词为1，只在一段中出现的词为PAIR_IDF_UNIQUE。因此可以直接由
+    全部文本的词频矩阵推导出每一对文本的TF-IDF余弦相似度，不需要逐对构建向量器。
     
-    # 根据发布日期调整分数（越新越好）
-    try:
-        published_date = date_parser.parse(news.get("published_date", ""))
-        days_old = (datetime.now() - published_date).days
+    Args:
+        counts: 全部文本的词频矩阵（每行一段文本）
+        rows: 每一对中第一段文本的行号
+        cols: 每一对中第二段文本的行号
         
-        # 最近7天的新闻得分更高
-        if days_old <= 1:
-            score += 20  # 今天发布
-        elif days_old <= 3:
-            score += 15  # 3天内发布
-        elif days_old <= 7:
-            score += 10  # 一周内发布
-        else:
-            score -= min(days_old, 30)  # 最多减30分
-    except Exception:
-        pass
-    
-    # 根据标题和摘要中的AI关键词数量调整分数
-    title = news.get("title", "")
-    summary = news.get("summary", "")
+    Returns:
+        每一对文本的余弦相似度
+    """
+    first, second = counts[rows], counts[cols]
+    first_squared, second_squared = first.multiply(first), second.multiply(second)
     
-    title_keywords = len(re.findall(AI_PATTERN, title))
-    summary_keywords = len(re.findall(AI_PATTERN, summary))
+    # 共同出现的词IDF为1，分子只包含这些词
+    dot = np.asarray(first.multiply(second).sum(axis=1)).ravel()
+    first_shared = np.asarray(first_squared.multiply(second > 0).sum(axis=1)).ravel()
+    second_shared = np.asarray(second_squared.multiply(first > 0).sum(axis=1)).ravel()
+    first_total = np.asarray(first_squared.sum(axis=1)).ravel()
+    second_total = np.asarray(second_squared.sum(axis=1)).ravel()
     
-    score += min(title_keywords * 5, 15)  # 标题中的关键词，最多加15分
-    score += min(summary_keywords * 2, 10)  # 摘要中的关键词，最多加10分
+    # 只在一段文本中出现的词按IDF的平方加权计入向量长度
+    weight = PAIR_IDF_UNIQUE ** 2
+    first_norm = first_shared + weight * (first_total - first_shared)
+    second_norm = second_shared + weight * (second_total - second_shared)
+    denominator = np.sqrt(first_norm * second_norm)
     
-    # 确保分数在0-100范围内
-    return max(0, min(score, 100))
+    similarity = np.zeros(len(rows))
+    np.divide(dot, denominator, out=similarity, where=denominator > 0)
+    return similarity
+
+
+def _count_terms(texts: List[str]) -> Optional[sparse.csr_matrix]:
+    """统计全部文本的词频，没有任何可用的词时返回None"""
+    try:
+        return TERM_COUNTER.fit_transform(texts).tocsr()
+    except ValueError:
+        return None
 
 
 def remove_duplicates(news_list: List[Dict[str, Any]], similarity_threshold: float = 0.7) -> List[Dict[str, Any]]:
     """
     移除重复的新闻
     
+    全部标题和摘要只统计一次词频，通过一次稀疏矩阵乘法找出有共同词的标题，
+    再批量计算这些新闻对的相似度，不再为每一对新闻单独构建TF-IDF向量器。
+    
     Args:
         news_list: 新闻列表
-        similarity_threshold: 相似度阈值，超过此值的新闻被视为重复
+        similarity_threshold: 相似度阈值，标题和摘要的相似度都超过此值的新闻被视为重复
         
     Returns:
-        去重后的新闻列表
+        去重后的新闻列表，按分数降序排列，分数相同时保持原有顺序
     """
     if not news_list:
         return []
     
-    unique_news = []
-    seen_titles: Set[str] = set()
-    
     # 按分数降序排序，保留高分新闻
     sorted_news = sorted(news_list, key=lambda x: x.get("score", 0), reverse=True)
+    titles = [news["_title_lc"] if "_title_lc" in news else news.get("title", "").lower()
+              for news in sorted_news]
+    summaries = [news.get("summary", "") for news in sorted_news]
     
-    for news in sorted_news:
-        title = news.get("title", "").lower()
-        summary = news.get("summary", "")
+    # 找出标题和摘要都相似的新闻对(i, j)，其中j排在i之前
+    partners: Dict[int, np.ndarray] = {}
+    title_counts = _count_terms(titles)
+    summary_counts = _count_terms(summaries)
+    if title_counts is not None and summary_counts is not None:
+        # 没有共同词的标题相似度为0，只需计算共现矩阵中的非零项
+        shared = sparse.triu(title_counts @ title_counts.T, k=1).tocoo()
+        earlier, later = shared.row, shared.col
+        similar = _pairwise_similarity(title_counts, later, earlier) > similarity_threshold
+        earlier, later = earlier[similar], later[similar]
         
+        # 标题相似时进一步检查摘要相似度
+        similar = _pairwise_similarity(summary_counts, later, earlier) > similarity_threshold
+        earlier, later = earlier[similar], later[similar]
+        
+        order = np.argsort(later, kind="stable")
+        earlier, later = earlier[order], later[order]
+        indices, starts = np.unique(later, return_index=True)
+        for index, group in zip(indices, np.split(earlier, starts[1:])):
+            partners[int(index)] = group
+    
+    unique_news = []
+    seen_titles: Set[str] = set()
+    kept = np.zeros(len(sorted_news), dtype=bool)
+    
+    for i, news in enumerate(sorted_news):
         # 检查标题是否完全相同
-        if title in seen_titles:
+        if titles[i] in seen_titles:
             continue
         
         # 检查与已保留新闻的相似度
-        is_duplicate = False
-        for unique_news_item in unique_news:
-            unique_title = unique_news_item.get("title", "")
-            unique_summary = unique_news_item.get("summary", "")
-            
-            # 计算标题相似度
-            title_similarity = calculate_similarity(title, unique_title.lower())
-            
-            # 如果标题相似度高，进一步检查摘要相似度
-            if title_similarity > similarity_threshold:
-                summary_similarity = calculate_similarity(summary, unique_summary)
-                if summary_similarity > similarity_threshold:
-                    is_duplicate = True
-                    break
+        group = partners.get(i)
+        if group is not None and kept[group].any():
+            continue
         
-        if not is_duplicate:
-            seen_titles.add(title)
-            unique_news.append(news)
+        seen_titles.add(titles[i])
+        kept[i] = True
+        unique_news.append(news)
     
     return unique_news
 
@@ -193,25 +419,19 @@ def filter_news(news_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     # 步骤1: 过滤掉非AI相关的新闻
     ai_related_news = []
     for news in news_list:
-        title = news.get("title", "")
-        summary = news.get("summary", "")
-        combined_text = f"{title} {summary}"
-        
-        if is_ai_related(combined_text):
+        if scan_news_ai(news):
             ai_related_news.append(news)
     
     logger.info(f"AI相关新闻: {len(ai_related_news)} 条")
     
     # 步骤2: 检查数据库中是否已存在
     non_duplicate_news = []
-    for news in ai_related_news:
-        title = news.get("title", "")
-        link = news.get("link", "")
-        
-        if not check_news_exists(title, link):
+    exists = check_news_exists_batch([(news.get("title", ""), news.get("link", "")) for news in ai_related_news])
+    for news, news_exists in zip(ai_related_news, exists):
+        if not news_exists:
             non_duplicate_news.append(news)
         else:
-            logger.debug(f"新闻已存在于数据库中，跳过: {title}")
+            logger.debug(f"新闻已存在于数据库中，跳过: {news.get('title', '')}")
     
     logger.info(f"去除数据库重复后剩余: {len(non_duplicate_news)} 条")
     
@@ -221,15 +441,22 @@ def filter_news(news_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     logger.info(f"去除重复后剩余: {len(unique_news)} 条")
     
     # 步骤4: 按发布日期排序，保留最新的新闻
-    sorted_news = sorted(unique_news, 
-                        key=lambda x: datetime.strptime(x["published_date"], "%Y-%m-%d"),
-                        reverse=True)
+    # 去重结果按分数排列，这里需要按日期重新排序；YYYY-MM-DD格式的日期按字符串比较即为时间先后，不必逐条解析
+    unique_news.sort(key=itemgetter("published_date"), reverse=True)
     
-    logger.info(f"最终筛选结果: {len(sorted_news)} 条新闻")
-    return sorted_news
+    # 小写标题和关键词计数只在筛选过程中使用，返回前从所有输入新闻中移除（返回的新闻是其中的一部分）
+    for news in news_list:
+        news.pop("_title_lc", None)
+        news.pop("_title_ai", None)
+        news.pop("_summary_ai", None)
+    
+    logger.info(f"最终筛选结果: {len(unique_news)} 条新闻")
+    return unique_news
 
 
 if __name__ == "__main__":
+    from src.core.news_fetcher import json_dumps
+    
     # 配置日志
     logging.basicConfig(
         level=logging.INFO,
@@ -268,4 +495,4 @@ if __name__ == "__main__":
     filtered = filter_news(test_news)
     
     # 打印结果
-    print(json.dumps(filtered, indent=2, ensure_ascii=False)) 
\ No newline at end of file
+    sys.stdout.buffer.write(json_dumps(filtered, indent=True) + b"\n") 
\ No newline at end of file
@@ -23,8 +23,11 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 # 导入自定义模块
 from src.core.news_fetcher import fetch_news
 from src.core.news_filter import filter_news
-from src.core.article_generator import generate_article, get_available_models
-from src.storage.article_storage import save_article_to_markdown, save_article_to_db
+from src.core import article_generator
+from src.core.article_generator import (
+    generate_articles_batch, generate_articles_batch_offline, get_available_models, run_async
+)
+from src.storage.article_storage import ArticleWriter, make_file_timestamp
 from src.utils.telegram_notifier import TelegramNotifier  # 导入Telegram通知模块
 
 # 导入配置
@@ -103,6 +106,14 @@ def parse_arguments():
     parser.add_argument("--history-size", type=int, default=None,
                         help="记录的历史风格数量，用于避免连续使用相同风格")
     
+    # 添加并发数参数
+    parser.add_argument("--concurrency", type=int, default=8,
+                        help="同时生成文章的最大请求数量 (默认: 8)")
+    
+    # 添加离线批处理参数
+    parser.add_argument("--batch", action="store_true",
+                        help="通过OpenAI Batch API离线生成文章，费用更低但最长需要24小时")
+    
     return parser.parse_args()
 
 
@@ -122,7 +133,9 @@ def print_status(message, status="进行中", color=Fore.BLUE, verbose=True):
         print(f"[{timestamp}] {status_text} {message}")
 
 
-def main(model: str = None, max_articles: int = None, verbose: bool = False):
+def main(model: str = None, max_articles: int = None, verbose: bool = False,
+         style: int = None, history_size: int = None, concurrency: int = 8,
+         offline_batch: bool = False):
     """
     主程序入口
     
@@ -130,6 +143,10 @@ def main(model: str = None, max_articles: int = None, verbose: bool = False):
         model: 要使用的模型名称
         max_articles: 最大文章数量，如果为None则使用配置文件中的值
         verbose: 是否显示详细进度
+        style: 指定使用的文章风格（从1开始），如果为None则自动选择
+        history_size: 记录的历史风格数量，如果为None则使用默认值
+        concurrency: 同时生成文章的最大请求数量
+        offline_batch: 是否通过OpenAI Batch API离线生成文章
     """
     # 使用配置文件中的值作为默认值
     if max_articles is None:
@@ -156,10 +173,8 @@ def main(model: str = None, max_articles: int = None, verbose: bool = False):
     logger.info("步骤1: 开始获取新闻")
     
     try:
-        with tqdm(total=100, desc="获取新闻", ncols=100, disable=not verbose) as pbar:
-            # 使用健康检查和最大源数量限制
-            news_list = fetch_news(max_sources=20, check_health=True)
-            pbar.update(100)
+        # 使用健康检查和最大源数量限制
+        news_list = fetch_news(max_sources=20, check_health=True)
         
         print_status(f"获取到 {len(news_list)} 条原始新闻", "完成", Fore.GREEN)
         logger.info(f"获取到 {len(news_list)} 条原始新闻")
@@ -178,9 +193,7 @@ def main(model: str = None, max_articles: int = None, verbose: bool = False):
     logger.info("步骤2: 开始筛选新闻")
     
     try:
-        with tqdm(total=100, desc="筛选新闻", ncols=100, disable=not verbose) as pbar:
-            filtered_news = filter_news(news_list)
-            pbar.update(100)
+        filtered_news = filter_news(news_list)
         
         print_status(f"筛选后剩余 {len(filtered_news)} 条新闻", "完成", Fore.GREEN)
         logger.info(f"筛选后剩余 {len(filtered_news)} 条新闻")
@@ -206,101 +219,122 @@ def main(model: str = None, max_articles: int = None, verbose: bool = False):
     if model and model not in models_used:
         models_used.append(model or DEFAULT_MODEL)
     
-    # 生成文章
-    articles = []
-    with tqdm(total=len(filtered_news), desc="文章生成总进度", ncols=100, disable=not verbose) as pbar:
-        for i, news in enumerate(filtered_news):
-            print_status(f"正在处理第 {i+1}/{len(filtered_news)} 条新闻: {news['title']}", "处理中", Fore.YELLOW)
-            logger.info(f"正在处理第 {i+1}/{len(filtered_news)} 条新闻: {news['title']}")
+    # 如果命令行指定了历史记录大小，则设置历史记录大小
+    if history_size is not None:
+        article_generator.MAX_STYLE_HISTORY = history_size
+        if verbose:
+            print_status(f"设置历史风格记录数量为: {history_size}", "配置", Fore.BLUE)
+    
+    current_model = model or DEFAULT_MODEL
+    print_status(f"正在使用模型 {current_model} 并发生成 {len(filtered_news)} 篇文章 (并发数: {concurrency})", "生成", Fore.YELLOW)
+    logger.info(f"正在使用模型 {current_model} 并发生成 {len(filtered_news)} 篇文章 (并发数: {concurrency})")
+    
+    def make_article(news: dict, article_content: str) -> dict:
+        """创建文章对象"""
+        return {
+            "title": news["title"],
+            "content": article_content,
+            "source_url": news["link"],
+            "published_date": news["published_date"],
+            "model_used": current_model,
+            "source_name": news["source"]
+        }
+    
+    def on_result(news: dict, article_content: str) -> None:
+        """每篇文章生成完成后立即交给写入线程保存"""
+        if article_content:
+            writer.put(make_article(news, article_content))
+        else:
+            print_status(f"文章生成失败: {news['title']}", "失败", Fore.RED)
+            logger.error(f"文章生成失败: {news['title']}")
+    
+    # 并发生成所有文章，生成完成的文章由后台线程同时保存（步骤4），同一批文章的文件名使用同一个时间戳
+    # 数据库记录在关闭时一次写入，生成期间（包括离线批处理的等待期间）不持有数据库写锁
+    writer = ArticleWriter(timestamp=make_file_timestamp(), single_transaction=True)
+    try:
+        with tqdm(total=len(filtered_news), desc="文章生成总进度", ncols=100, disable=not verbose) as pbar:
+            if offline_batch:
+                run_async(generate_articles_batch_offline(
+                    filtered_news,
+                    model=model,
+                    verbose=verbose,
+                    specific_style=style,
+                    progress_callback=lambda: pbar.update(1),
+                    result_callback=on_result
+                ))
+            else:
+                run_async(generate_articles_batch(
+                    filtered_news,
+                    model=model,
+                    concurrency=concurrency,
+                    verbose=verbose,
+                    specific_style=style,
+                    progress_callback=lambda: pbar.update(1),
+                    result_callback=on_result
+                ))
+    finally:
+        # 等待所有已生成的文章保存完成
+        results = writer.close()
+    
+    articles = [article for article, _, _ in results]
+    print_status(f"存储 {len(articles)} 篇文章", "步骤4", Fore.BLUE)
+    logger.info(f"步骤4: 存储 {len(articles)} 篇文章")
+    
+    # 记录使用的模型
+    if articles and current_model not in models_used:
+        models_used.append(current_model)
+    
+    # 依次处理保存结果并发送通知
+    for i, (article, saved, article_id) in enumerate(results):
+        print_status(f"正在处理第 {i+1}/{len(articles)} 篇文章: {article['title']}", "处理中", Fore.YELLOW)
+        logger.info(f"正在处理第 {i+1}/{len(articles)} 篇文章: {article['title']}")
+        
+        try:
+            if isinstance(saved, Exception):
+                raise saved
+            md_path, txt_path = saved
+            print_status(f"文章已保存为Markdown: {md_path}", "完成", Fore.GREEN)
+            print_status(f"文章已保存为纯文本: {txt_path}", "完成", Fore.GREEN)
+            logger.info(f"文章已保存为Markdown: {md_path}")
+            logger.info(f"文章已保存为纯文本: {txt_path}")
             
-            try:
-                # 生成文章
-                current_model = model or DEFAULT_MODEL
-                print_status(f"正在使用模型 {current_model} 生成文章 (尝试 1/3)", "生成", Fore.YELLOW)
-                print_status(f"文章标题: {news['title']}", "标题", Fore.CYAN)
-                
-                # 如果命令行指定了风格，则使用指定的风格
-                specific_style = args.style if hasattr(args, 'style') else None
-                
-                # 如果命令行指定了历史记录大小，则设置历史记录大小
-                if hasattr(args, 'history_size') and args.history_size is not None:
-                    from src.core.article_generator import MAX_STYLE_HISTORY
-                    MAX_STYLE_HISTORY = args.history_size
-                    if verbose:
-                        print_status(f"设置历史风格记录数量为: {MAX_STYLE_HISTORY}", "配置", Fore.BLUE)
+            if article_id is not None:
+                print_status(f"文章已保存到数据库，ID: {article_id}", "完成", Fore.GREEN)
+                logger.info(f"文章已保存到数据库，ID: {article_id}")
+            else:
+                print_status(f"保存文章到数据库失败: {article['title']}", "错误", Fore.RED)
+                logger.error(f"保存文章到数据库失败: {article['title']}")
+            
+            # 发送Telegram通知
+            if telegram:
+                article_content = article["content"]
+                # 修改字符数统计方法，使其更准确地反映文章的实际内容长度
+                # 去除空格、换行符等非内容字符，只计算实际文本内容的字符数
+                cleaned_content = ''.join(article_content.split())
+                char_count = len(cleaned_content)
+                print_status(f"发送Telegram通知...", "通知", Fore.CYAN, verbose)
                 
-                article_content = generate_article(news, model=model, verbose=verbose, specific_style=specific_style)
+                # 发送文章生成通知
+                telegram.send_article_notification(
+                    title=article['title'],
+                    source=article['source_name'],
+                    file_path=txt_path,
+                    word_count=char_count,
+                    model_used=current_model,
+                    content=article_content if telegram.include_preview else None
+                )
                 
-                if article_content:
-                    # 创建文章对象
-                    article = {
-                        "title": news["title"],
-                        "content": article_content,
-                        "source_url": news["link"],
-                        "published_date": news["published_date"],
-                        "model_used": current_model,
-                        "source_name": news["source"]
-                    }
-                    articles.append(article)
-                    
-                    # 记录使用的模型
-                    if current_model not in models_used:
-                        models_used.append(current_model)
+                # 如果配置了发送完整文章
+                if telegram.send_full_article:
+                    telegram.send_full_article(
+                        title=article['title'], 
+                        file_path=txt_path
+                    )
                     
-                    # 步骤4: 存储文章
-                    print_status(f"存储文章: {article['title']}", "步骤4", Fore.BLUE)
-                    logger.info(f"步骤4: 存储文章 - {article['title']}")
-                    
-                    try:
-                        # 保存文章到Markdown和纯文本
-                        md_path, txt_path = save_article_to_markdown(article)
-                        print_status(f"文章已保存为Markdown: {md_path}", "完成", Fore.GREEN)
-                        print_status(f"文章已保存为纯文本: {txt_path}", "完成", Fore.GREEN)
-                        logger.info(f"文章已保存为Markdown: {md_path}")
-                        logger.info(f"文章已保存为纯文本: {txt_path}")
-                        
-                        # 保存文章到数据库
-                        article_id = save_article_to_db(article)
-                        print_status(f"文章已保存到数据库，ID: {article_id}", "完成", Fore.GREEN)
-                        logger.info(f"文章已保存到数据库，ID: {article_id}")
-                        
-                        # 发送Telegram通知
-                        if telegram:
-                            # 修改字符数统计方法，使其更准确地反映文章的实际内容长度
-                            # 去除空格、换行符等非内容字符，只计算实际文本内容的字符数
-                            cleaned_content = ''.join(article_content.split())
-                            char_count = len(cleaned_content)
-                            print_status(f"发送Telegram通知...", "通知", Fore.CYAN, verbose)
-                            
-                            # 发送文章生成通知
-                            telegram.send_article_notification(
-                                title=article['title'],
-                                source=news['source'],
-                                file_path=txt_path,
-                                word_count=char_count,
-                                model_used=current_model,
-                                content=article_content if telegram.include_preview else None
-                            )
-                            
-                            # 如果配置了发送完整文章
-                            if telegram.send_full_article:
-                                telegram.send_full_article(
-                                    title=article['title'], 
-                                    file_path=txt_path
-                                )
-                                
-                            print_status(f"Telegram通知已发送", "完成", Fore.GREEN, verbose)
-                    except Exception as e:
-                        print_status(f"保存文章时出错: {str(e)}", "错误", Fore.RED)
-                        logger.error(f"保存文章时出错: {str(e)}")
-                else:
-                    print_status(f"文章生成失败: {news['title']}", "失败", Fore.RED)
-                    logger.error(f"文章生成失败: {news['title']}")
-            except Exception as e:
-                print_status(f"处理新闻时出错: {str(e)}", "错误", Fore.RED)
-                logger.error(f"处理新闻时出错: {str(e)}")
-            
-            pbar.update(1)
+                print_status(f"Telegram通知已发送", "完成", Fore.GREEN, verbose)
+        except Exception as e:
+            print_status(f"保存文章时出错: {str(e)}", "错误", Fore.RED)
+            logger.error(f"保存文章时出错: {str(e)}")
     
     # 总结
     elapsed_time = time.time() - start_time
@@ -324,10 +358,6 @@ def main(model: str = None, max_articles: int = None, verbose: bool = False):
 
 
 if __name__ == "__main__":
-    # 确保存储目录存在
-    os.makedirs("data/articles", exist_ok=True)
-    os.makedirs("data/database", exist_ok=True)
-    
     # 确保日志目录存在
     os.makedirs("logs", exist_ok=True)
     
@@ -361,7 +391,11 @@ if __name__ == "__main__":
         main(
             model=args.model,
             max_articles=args.max_articles,
-            verbose=args.verbose
+            verbose=args.verbose,
+            style=args.style,
+            history_size=args.history_size,
+            concurrency=args.concurrency,
+            offline_batch=args.batch
         )
     except KeyboardInterrupt:
         print("\n程序被用户中断")
@@ -13,6 +13,7 @@ import time
 import logging
 import schedule
 import subprocess
+import threading
 import argparse
 from datetime import datetime
 import colorama
@@ -154,11 +155,14 @@ def run_task(model=None, verbose=False):
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
-            universal_newlines=True
+            text=True
         )
         
+        # 后台线程同时读取错误输出，避免错误输出填满管道缓冲区导致子进程阻塞
+        stderr_lines = []
+        stderr_reader = threading.Thread(target=lambda: stderr_lines.extend(process.stderr), daemon=True)
+        stderr_reader.start()
+        
         # 实时显示输出
         print_status("任务正在执行中，以下是实时输出:", "输出", Fore.CYAN)
         print("-" * 60)
@@ -169,6 +173,8 @@ def run_task(model=None, verbose=False):
         
         # 等待进程完成
         process.wait()
+        stderr_reader.join()
+        stderr_output = "".join(stderr_lines)
         
         # 检查返回码
         if process.returncode == 0:
@@ -192,9 +198,6 @@ def run_task(model=None, verbose=False):
             print_status(f"任务执行失败，返回码: {process.returncode}", "失败", Fore.RED)
             logger.error(f"任务执行失败: 返回码 {process.returncode}")
             
-            # 显示错误输出
-            stderr_output = process.stderr.read()
-            
             # 发送Telegram通知：任务失败
             if telegram:
                 error_message = (
@@ -314,11 +317,12 @@ def generate_cron_config(model=None, verbose=False):
     """
     生成cron配置
     
+    cron只在计划时间启动一次主程序，运行结束后进程退出，不需要定时器进程常驻内存。
+    
     Args:
         model: 要使用的模型名称
         verbose: 是否显示详细进度
     """
-    script_path = os.path.abspath(__file__)
     python_path = sys.executable
     
     # 解析配置的时间
@@ -333,7 +337,7 @@ def generate_cron_config(model=None, verbose=False):
     # 添加模型参数
     model_param = f"--model {model}" if model else ""
     verbose_param = "--verbose" if verbose else ""
-    cron_line = f"{cron_time} {python_path} {script_path} {model_param} {verbose_param} > /tmp/ai_news_cron.log 2>&1"
+    cron_line = f"{cron_time} cd {ROOT_DIR} && {python_path} {MAIN_SCRIPT} {model_param} {verbose_param} > /tmp/ai_news_cron.log 2>&1"
     
     print("\n" + "=" * 60)
     print(f"{Fore.CYAN}Cron配置{Style.RESET_ALL}")
@@ -346,9 +350,40 @@ def generate_cron_config(model=None, verbose=False):
         print(f"使用模型: {Fore.GREEN}{model}{Style.RESET_ALL}")
     if verbose:
         print(f"显示详细进度: {Fore.GREEN}是{Style.RESET_ALL}")
+    print(f"使用systemd的系统也可以使用 {os.path.join(ROOT_DIR, 'deploy', 'systemd')} 中的定时器单元")
     print("=" * 60)
 
 
+def print_next_run():
+    """
+    显示下一次运行时间以及距离下一次运行的剩余时间
+    """
+    next_run = schedule.next_run()
+    if not next_run:
+        return
+    
+    if HAS_PYTZ:
+        # 将下一次运行时间转换为指定时区的时间
+        tz = pytz.timezone(TIMEZONE)
+        next_run_tz = next_run.replace(tzinfo=pytz.UTC).astimezone(tz)
+        
+        # 计算时间差
+        now_tz = datetime.now(tz)
+        time_diff = next_run_tz - now_tz
+        hours, remainder = divmod(time_diff.seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        
+        timezone_info = f"({TIMEZONE}时区)"
+        print_status(f"下一次运行时间: {next_run_tz.strftime('%Y-%m-%d %H:%M:%S')} {timezone_info} (还有 {hours}小时 {minutes}分钟 {seconds}秒)", "计划", Fore.YELLOW)
+    else:
+        # 使用系统本地时间
+        time_diff = next_run - datetime.now()
+        hours, remainder = divmod(time_diff.seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        
+        print_status(f"下一次运行时间: {next_run.strftime('%Y-%m-%d %H:%M:%S')} (系统本地时区) (还有 {hours}小时 {minutes}分钟 {seconds}秒)", "计划", Fore.YELLOW)
+
+
 def main():
     """
     主函数
@@ -387,60 +422,15 @@ def main():
     logger.info("开始定时任务循环，按Ctrl+C退出")
     
     try:
-        # 显示下一次运行时间
-        next_run = schedule.next_run()
-        if next_run:
-            if HAS_PYTZ:
-                # 将下一次运行时间转换为指定时区的时间
-                tz = pytz.timezone(TIMEZONE)
-                next_run_tz = next_run.replace(tzinfo=pytz.UTC).astimezone(tz)
-                
-                # 计算时间差
-                now_tz = datetime.now(tz)
-                time_diff = next_run_tz - now_tz
-                hours, remainder = divmod(time_diff.seconds, 3600)
-                minutes, seconds = divmod(remainder, 60)
-                
-                timezone_info = f"({TIMEZONE}时区)"
-                print_status(f"下一次运行时间: {next_run_tz.strftime('%Y-%m-%d %H:%M:%S')} {timezone_info} (还有 {hours}小时 {minutes}分钟 {seconds}秒)", "计划", Fore.YELLOW)
-            else:
-                # 使用系统本地时间
-                time_diff = next_run - datetime.now()
-                hours, remainder = divmod(time_diff.seconds, 3600)
-                minutes, seconds = divmod(remainder, 60)
-                
-                print_status(f"下一次运行时间: {next_run.strftime('%Y-%m-%d %H:%M:%S')} (系统本地时区) (还有 {hours}小时 {minutes}分钟 {seconds}秒)", "计划", Fore.YELLOW)
-        
-        # 定时任务循环
+        # 定时任务循环：显示下一次运行时间后休眠到该时间，最长一分钟
         while True:
             schedule.run_pending()
+            print_next_run()
             
-            # 每分钟更新一次下一次运行时间
-            if datetime.now().second == 0:
-                next_run = schedule.next_run()
-                if next_run:
-                    if HAS_PYTZ:
-                        # 将下一次运行时间转换为指定时区的时间
-                        tz = pytz.timezone(TIMEZONE)
-                        next_run_tz = next_run.replace(tzinfo=pytz.UTC).astimezone(tz)
-                        
-                        # 计算时间差
-                        now_tz = datetime.now(tz)
-                        time_diff = next_run_tz - now_tz
-                        hours, remainder = divmod(time_diff.seconds, 3600)
-                        minutes, seconds = divmod(remainder, 60)
-                        
-                        timezone_info = f"({TIMEZONE}时区)"
-                        print_status(f"下一次运行时间: {next_run_tz.strftime('%Y-%m-%d %H:%M:%S')} {timezone_info} (还有 {hours}小时 {minutes}分钟 {seconds}秒)", "计划", Fore.YELLOW)
-                    else:
-                        # 使用系统本地时间
-                        time_diff = next_run - datetime.now()
-                        hours, remainder = divmod(time_diff.seconds, 3600)
-                        minutes, seconds = divmod(remainder, 60)
-                        
-                        print_status(f"下一次运行时间: {next_run.strftime('%Y-%m-%d %H:%M:%S')} (系统本地时区) (还有 {hours}小时 {minutes}分钟 {seconds}秒)", "计划", Fore.YELLOW)
-            
-            time.sleep(1)  # 每秒检查一次
+            idle_seconds = schedule.idle_seconds()
+            if idle_seconds is None:
+                idle_seconds = 60
+            time.sleep(min(max(idle_seconds, 1), 60))
     except KeyboardInterrupt:
         print_status("定时任务已手动停止", "停止", Fore.YELLOW)
         logger.info("定时任务已手动停止")
@@ -10,10 +10,21 @@
 import os
 import sqlite3
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional
+import atexit
+import asyncio
+import itertools
+import mmap
+import queue
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, Union
 import re
 import sys
+import aiofiles
+import aiofiles.os
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -27,6 +38,197 @@ ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 # 数据库路径
 DB_PATH = os.path.join(ROOT_DIR, "data", "database", "articles.db")
 
+# 文章生成结果缓存的保留天数和最多保留的文件数量
+ARTICLE_CACHE_MAX_AGE_DAYS = 30
+ARTICLE_CACHE_MAX_FILES = 1000
+
+# 每个连接都需要设置的参数：WAL模式下使用NORMAL同步级别，临时表放在内存，
+# 20MB页缓存，256MB内存映射读取
+DB_CONNECTION_PRAGMAS = '''
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-20000;
+PRAGMA mmap_size=268435456;
+'''
+
+# 数据库初始化脚本：启用WAL模式并创建表和索引（如果不存在）
+# journal_mode会写入数据库文件头，每个数据库文件只需设置一次
+# idx_articles_list覆盖list_articles查询的所有列，按时间倒序列出文章时无需排序和回表
+DB_INIT_SCRIPT = '''
+PRAGMA journal_mode=WAL;
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    source_url TEXT,
+    published_date TEXT,
+    model_used TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_articles_source_url ON articles(source_url);
+CREATE INDEX IF NOT EXISTS idx_articles_list ON articles(created_at DESC, id, title, published_date, model_used);
+CREATE TABLE IF NOT EXISTS title_cache (
+    hash TEXT PRIMARY KEY,
+    optimized TEXT NOT NULL
+);
+'''
+
+# 保存文章使用的SQL语句，所有调用共用同一个字符串以命中预编译语句缓存
+_SQL_INSERT_ARTICLES = '''
+INSERT INTO articles (title, content, source_url, published_date, model_used, created_at)
+VALUES '''
+_SQL_ARTICLE_VALUES = "(?, ?, ?, ?, ?, ?)"
+_SQL_UPSERT_ARTICLE = _SQL_INSERT_ARTICLES + _SQL_ARTICLE_VALUES + '''
+ON CONFLICT(title) DO UPDATE SET
+    content = excluded.content,
+    source_url = excluded.source_url,
+    published_date = excluded.published_date,
+    model_used = excluded.model_used,
+    created_at = excluded.created_at
+RETURNING id
+'''
+# 多行INSERT每条语句最多写入的行数（每行6个参数，远低于SQLite的参数数量上限）
+_INSERT_BATCH_ROWS = 500
+
+# 批量查重时每条语句最多检查的新闻数量（每条新闻2个参数，低于旧版SQLite的999个参数上限）
+_EXISTS_BATCH_ROWS = 400
+# 批量读取标题缓存时每条语句最多查询的缓存键数量（低于旧版SQLite的999个参数上限）
+_TITLE_CACHE_BATCH_KEYS = 900
+
+# 大批量导入模式下，文章数量超过该值时才在导入期间删除并重建标题索引
+BULK_INDEX_THRESHOLD = 1000
+
+# 文件名清理：一次str.translate删除中英文标点和不可见字符，
+# 空白字符不在删除表中，留给正则统一替换为下划线
+_FILENAME_DELETE_CHARS = (
+    '【】《》「」『』（）、，。：；？！'
+    ',.!@#$%^&*(){}[]<>?|/\\~`\'";:+='
+    + ''.join(chr(c) for c in [*range(0x00, 0x20), *range(0x7f, 0xa0)] if not chr(c).isspace())
+)
+_FILENAME_DELETE_TABLE = str.maketrans('', '', _FILENAME_DELETE_CHARS)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 文本清理使用的正则表达式
+_MARKUP_PATTERN = re.compile(r'---+|#{2,3}\s+')
+_BLANK_LINES_PATTERN = re.compile(r'\n\s*\n\s*\n')
+
+# 每个线程复用自己的数据库连接，首次使用时创建
+_local = threading.local()
+# 所有已创建的连接，用于在进程退出时统一关闭
+_connections: List[sqlite3.Connection] = []
+_connections_lock = threading.Lock()
+# 连接代数，关闭所有连接后递增，使各线程缓存的旧连接失效
+_generation = 0
+# 已执行过初始化脚本的数据库文件，值表示title列上是否有唯一索引
+_initialized_paths: Dict[str, bool] = {}
+# 已创建的articles目录，键为项目根目录，避免每次保存文章都调用os.makedirs
+_ARTICLES_DIRS: Dict[str, str] = {}
+# 已创建的文章生成结果缓存目录，键为项目根目录
+_ARTICLE_CACHE_DIRS: Dict[str, str] = {}
+
+
+def _apply_pragmas(conn: sqlite3.Connection) -> None:
+    """为新打开的连接设置性能相关的PRAGMA参数"""
+    conn.executescript(DB_CONNECTION_PRAGMAS)
+
+
+def _ensure_schema(conn: sqlite3.Connection) -> None:
+    """创建表和索引，每个数据库文件只执行一次（调用方需持有_connections_lock）"""
+    if DB_PATH in _initialized_paths:
+        return
+    
+    conn.executescript(DB_INIT_SCRIPT)
+    
+    # 标题唯一索引用于按标题UPSERT；旧数据库中如果已有重复标题则无法创建，退回普通索引
+    try:
+        conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_title_unique ON articles(title)')
+        conn.execute('DROP INDEX IF EXISTS idx_articles_title')
+        _initialized_paths[DB_PATH] = True
+    except sqlite3.IntegrityError:
+        logger.warning("数据库中存在重复标题，无法创建标题唯一索引，保存文章时将不会按标题更新已有文章")
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_articles_title ON articles(title)')
+        _initialized_paths[DB_PATH] = False
+
+
+def _has_unique_title() -> bool:
+    """当前数据库的title列上是否有唯一索引"""
+    _get_connection()
+    return _initialized_paths.get(DB_PATH, False)
+
+
+def _get_connection() -> sqlite3.Connection:
+    """
+    获取当前线程复用的数据库连接
+    
+    每个线程首次调用时创建数据库目录并打开连接，之后直接返回同一个连接，
+    避免每次操作都重新连接；建表语句在整个进程中只执行一次。连接工作在自动提交模式下，
+    需要事务时使用_transaction显式开启。
+    
+    Returns:
+        数据库连接
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None or getattr(_local, "generation", None) != _generation:
+        # 确保database目录存在
+        os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+        # 建表完成前其他线程不能打开连接，否则其缓存的旧表结构会导致语句编译失败
+        with _connections_lock:
+            # 允许在其他线程中关闭连接（进程退出时由主线程统一关闭）
+            conn = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False,
+                                   cached_statements=256)
+            _apply_pragmas(conn)
+            _ensure_schema(conn)
+            _connections.append(conn)
+        _local.conn = conn
+        _local.generation = _generation
+    return conn
+
+
+@contextmanager
+def _transaction(conn: sqlite3.Connection):
+    """
+    在显式事务中执行数据库操作，正常结束时提交，出错时回滚
+    
+    如果连接上已有外层事务，
+    则使用保存点嵌套执行，出错时只回滚本次操作，提交由外层事务负责。
+    
+    Args:
+        conn: 数据库连接
+    """
+    if conn.in_transaction:
+        conn.execute('SAVEPOINT nested_write')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK TO nested_write')
+            conn.execute('RELEASE nested_write')
+            raise
+        else:
+            conn.execute('RELEASE nested_write')
+        return
+    
+    conn.execute('BEGIN')
+    try:
+        yield conn
+    except BaseException:
+        conn.execute('ROLLBACK')
+        raise
+    else:
+        conn.execute('COMMIT')
+
+
+def _close_connection() -> None:
+    """关闭所有线程的数据库连接（在进程退出时调用）"""
+    global _generation
+    with _connections_lock:
+        for conn in _connections:
+            conn.close()
+        _connections.clear()
+        _generation += 1
+
+
+atexit.register(_close_connection)
+
 def format_filename(title: str) -> str:
     """
     格式化标题为合法的文件名
@@ -38,19 +240,15 @@ def format_filename(title: str) -> str:
         格式化后的文件名
     """
     # 替换特殊字符为下划线或空字符
-    # 1. 替换常见中文标点
-    title = re.sub(r'[【】《》「」『』（）、，。：；？！]', '', title)
-    # 2. 替换常见英文标点
-    title = re.sub(r'[,.!@#$%^&*(){}\[\]<>?|/\\~`\'";:+=]', '', title)
-    # 3. 替换空白字符为下划线
-    title = re.sub(r'\s+', '_', title)
-    # 4. 移除任何剩余的不可见字符
-    title = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', title)
-    # 5. 转换为小写并限制长度
+    # 1. 移除常见中英文标点和不可见字符
+    title = title.translate(_FILENAME_DELETE_TABLE)
+    # 2. 替换空白字符为下划线
+    title = _WHITESPACE_PATTERN.sub('_', title)
+    # 3. 转换为小写并限制长度
     title = title.lower()[:50]
-    # 6. 确保文件名不以点或下划线开头
+    # 4. 确保文件名不以点或下划线开头
     title = title.lstrip('._')
-    # 7. 如果文件名为空，使用默认名称
+    # 5. 如果文件名为空，使用默认名称
     if not title:
         title = 'article'
     return title
@@ -66,145 +264,744 @@ def clean_text_content(text: str) -> str:
         清理后的文本
     """
     # 1. 移除特定的Markdown标记符号
-    text = re.sub(r'\*\*', '', text)  # 移除加粗标记 **
-    text = re.sub(r'\*', '', text)  # 移除斜体标记 *
-    text = re.sub(r'---+', '', text)  # 移除分隔线 ---
-    text = re.sub(r'###\s+', '', text)  # 移除三级标题标记
-    text = re.sub(r'##\s+', '', text)  # 移除二级标题标记
+    text = text.replace('*', '')  # 移除加粗和斜体标记 ** 和 *
+    text = _MARKUP_PATTERN.sub('', text)  # 一次扫描移除分隔线和二、三级标题标记
     
     # 2. 规范化空白字符
-    text = re.sub(r'\n\s*\n\s*\n', '\n\n', text)  # 将多个连续空行替换为两个换行
+    text = _BLANK_LINES_PATTERN.sub('\n\n', text)  # 将多个连续空行替换为两个换行
     text = text.strip()  # 移除首尾空白
     
     return text
 
-def save_article_to_markdown(article_data: Dict[str, Any]) -> tuple[str, str]:
+
+def _articles_dir() -> str:
     """
-    将文章保存为Markdown文件和纯文本文件
+    返回articles目录的路径，每个根目录只在第一次调用时创建目录
+    
+    Returns:
+        articles目录的绝对路径
+    """
+    articles_dir = _ARTICLES_DIRS.get(ROOT_DIR)
+    if articles_dir is None:
+        articles_dir = os.path.join(ROOT_DIR, "data", "articles")
+        os.makedirs(articles_dir, exist_ok=True)
+        _ARTICLES_DIRS[ROOT_DIR] = articles_dir
+    return articles_dir
+
+
+def _article_cache_dir() -> str:
+    """
+    返回文章生成结果缓存目录的路径，每个根目录只在第一次调用时创建目录并清理过期的缓存
+    
+    Returns:
+        缓存目录的绝对路径
+    """
+    cache_dir = _ARTICLE_CACHE_DIRS.get(ROOT_DIR)
+    if cache_dir is None:
+        cache_dir = os.path.join(ROOT_DIR, "data", "cache", "articles")
+        os.makedirs(cache_dir, exist_ok=True)
+        _prune_article_cache(cache_dir)
+        _ARTICLE_CACHE_DIRS[ROOT_DIR] = cache_dir
+    return cache_dir
+
+
+def _prune_article_cache(cache_dir: str) -> None:
+    """
+    删除超过ARTICLE_CACHE_MAX_AGE_DAYS天的缓存文件，文件数量仍超过ARTICLE_CACHE_MAX_FILES时删除最旧的文件
     
     Args:
-        article_data: 文章数据，包含title, content, source_url, published_date, model_used(可选)
+        cache_dir: 缓存目录路径
+    """
+    try:
+        entries = []
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.is_file():
+                    entries.append((entry.stat().st_mtime, entry.path))
+        
+        entries.sort(reverse=True)
+        expire_before = time.time() - ARTICLE_CACHE_MAX_AGE_DAYS * 86400
+        stale = [path for i, (mtime, path) in enumerate(entries)
+                 if mtime < expire_before or i >= ARTICLE_CACHE_MAX_FILES]
+        for path in stale:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        if stale:
+            logger.info(f"已清理 {len(stale)} 个过期的文章缓存文件")
+    except Exception as e:
+        logger.error(f"清理文章缓存时出错: {str(e)}")
+
+
+def _article_base_path(title: str, timestamp: str = None) -> str:
+    """
+    生成文章文件不含扩展名的路径，并确保articles目录存在
+    
+    Args:
+        title: 文章标题
+        timestamp: 文件名中的时间戳，如果为None则使用当前时间
         
     Returns:
-        (markdown文件路径, 文本文件路径)的元组
+        不含扩展名的文件路径
     """
-    # 确保articles目录存在
-    articles_dir = os.path.join(ROOT_DIR, "data", "articles")
-    os.makedirs(articles_dir, exist_ok=True)
+    articles_dir = _articles_dir()
     
     # 格式化标题作为文件名
-    safe_title = format_filename(article_data["title"])
+    safe_title = format_filename(title)
     
     # 生成文件名
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    md_filename = f"{timestamp}_{safe_title}.md"
-    txt_filename = f"{timestamp}_{safe_title}.txt"
-    md_path = os.path.join(articles_dir, md_filename)
-    txt_path = os.path.join(articles_dir, txt_filename)
+    if timestamp is None:
+        timestamp = make_file_timestamp()
+    return os.path.join(articles_dir, f"{timestamp}_{safe_title}")
+
+
+def _render_markdown_parts(article_data: Dict[str, Any]) -> tuple[str, str]:
+    """
+    生成Markdown文件中正文前后的内容
     
-    # 准备Markdown内容
+    Args:
+        article_data: 文章数据，包含title, source_url, published_date, model_used(可选)
+        
+    Returns:
+        (正文之前的内容, 正文之后的内容)的元组
+    """
     model_info = f"模型: {article_data.get('model_used', 'unknown')}" if 'model_used' in article_data else ""
     
     # 添加来源信息
     source_name = article_data.get("source_name", "未知来源")
     source_info = f"\n\n---\n\n**来源：{source_name}**"
     
-    markdown_content = f"""# {article_data['title']}
+    header = f"""# {article_data['title']}
 
 📅 {article_data['published_date']}  
 🔗 [阅读原文]({article_data['source_url']})  
 {model_info}
 
-{article_data['content']}{source_info}
 """
+    return header, f"{source_info}\n"
+
+
+def _render_text(article_data: Dict[str, Any], content: str) -> str:
+    """
+    生成纯文本文件的内容
     
-    # 准备纯文本内容
-    text_content = f"""{clean_text_content(article_data['title'])}
+    Args:
+        article_data: 文章数据，包含title, source_url, published_date, model_used(可选)
+        content: 文章正文
+        
+    Returns:
+        纯文本内容
+    """
+    model_info = f"模型: {article_data.get('model_used', 'unknown')}" if 'model_used' in article_data else ""
+    source_name = article_data.get("source_name", "未知来源")
+    
+    return f"""{clean_text_content(article_data['title'])}
 
 发布日期：{article_data['published_date']}
 原文链接：{article_data['source_url']}
 {model_info}
 
-{clean_text_content(article_data['content'])}
+{clean_text_content(content)}
 
 ---
 
 来源：{source_name}
 """
+
+
+def _render_article_files(article_data: Dict[str, Any], timestamp: str = None) -> tuple[str, str, str]:
+    """
+    生成文章文件的路径前缀以及Markdown和纯文本内容
+    
+    Args:
+        article_data: 文章数据，包含title, content, source_url, published_date, model_used(可选)
+        timestamp: 文件名中的时间戳，如果为None则使用当前时间
+        
+    Returns:
+        (不含扩展名的文件路径, markdown内容, 纯文本内容)的元组
+    """
+    base_path = _article_base_path(article_data["title"], timestamp)
+    header, footer = _render_markdown_parts(article_data)
+    markdown_content = f"{header}{article_data['content']}{footer}"
+    text_content = _render_text(article_data, article_data["content"])
+    return base_path, markdown_content, text_content
+
+
+def make_file_timestamp() -> str:
+    """
+    生成文章文件名使用的时间戳，批量保存时可以只调用一次并传给每篇文章
+    
+    Returns:
+        格式为YYYYmmdd_HHMMSS的时间戳
+    """
+    return datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
+# 是否支持一次系统调用写入多段内容（Windows不支持os.writev）
+_HAS_WRITEV = hasattr(os, "writev")
+
+
+def _publish_article_files(base_path: str, md_tmp: str, txt_tmp: str) -> tuple[str, str]:
+    """
+    将已写完的临时文件通过硬链接发布为一对Markdown和纯文本文件，文件名冲突时依次追加_1、_2等序号
     
+    os.link在目标已存在时失败，因此占用文件名和发布完整内容是同一步操作，
+    其他进程不会看到空的占位文件。成功后删除临时文件。
+    
+    Args:
+        base_path: 不含扩展名的文件路径
+        md_tmp: 已写完的Markdown临时文件路径
+        txt_tmp: 已写完的纯文本临时文件路径
+        
+    Returns:
+        (markdown文件路径, 文本文件路径)的元组
+    """
+    for index in itertools.count():
+        path = base_path if index == 0 else f"{base_path}_{index}"
+        md_path, txt_path = f"{path}.md", f"{path}.txt"
+        try:
+            os.link(md_tmp, md_path)
+        except FileExistsError:
+            continue
+        try:
+            os.link(txt_tmp, txt_path)
+        except FileExistsError:
+            # 纯文本文件被占用时撤回已发布的Markdown文件，换下一个序号
+            os.remove(md_path)
+            continue
+        except BaseException:
+            os.remove(md_path)
+            raise
+        os.remove(md_tmp)
+        os.remove(txt_tmp)
+        return md_path, txt_path
+
+
+def _remove_temp_files(*paths: Optional[str]) -> None:
+    """删除残留的临时文件，忽略不存在的文件"""
+    for path in paths:
+        if path and os.path.exists(path):
+            os.remove(path)
+
+
+def _create_temp_file(path: str) -> tuple[int, str]:
+    """
+    在目标文件所在目录下创建唯一的临时文件，同一进程内并发写入同一目标也不会共用临时文件
+    
+    Args:
+        path: 目标文件路径
+        
+    Returns:
+        (文件描述符, 临时文件路径)的元组
+    """
+    directory, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{name}.", suffix=".tmp", dir=directory or ".")
+    # mkstemp创建的文件只有所有者可读写，改为与普通文件相同的权限（Windows上没有fchmod）
+    if hasattr(os, "fchmod"):
+        try:
+            os.fchmod(fd, 0o644)
+        except BaseException:
+            os.close(fd)
+            os.remove(tmp_path)
+            raise
+    return fd, tmp_path
+
+
+def _write_atomic(path: str, *chunks: Union[str, bytes, memoryview]) -> None:
+    """
+    先写入同目录下的临时文件，再通过os.replace原子地替换目标文件，
+    读取方只会看到完整的旧文件或新文件，不会看到写了一半的文件
+    
+    Args:
+        path: 目标文件路径
+        chunks: 要写入的内容
+    """
+    tmp_path = _write_temp(path, *chunks)
     try:
-        # 保存Markdown文件
-        with open(md_path, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
-        logger.info(f"文章已保存为Markdown: {md_path}")
+        os.replace(tmp_path, path)
+    except BaseException:
+        _remove_temp_files(tmp_path)
+        raise
+
+
+def _write_temp(path: str, *chunks: Union[str, bytes, memoryview]) -> str:
+    """
+    将内容完整写入目标文件所在目录下的临时文件
+    
+    Args:
+        path: 目标文件路径
+        chunks: 要写入的内容
         
-        # 保存纯文本文件
-        with open(txt_path, "w", encoding="utf-8") as f:
-            f.write(text_content)
+    Returns:
+        临时文件路径
+    """
+    fd, tmp_path = _create_temp_file(path)
+    try:
+        _write_fd(fd, *chunks)
+    except BaseException:
+        _remove_temp_files(tmp_path)
+        raise
+    return tmp_path
+
+
+def _write_fd(fd: int, *chunks: Union[str, bytes, memoryview]) -> None:
+    """
+    将多段内容依次写入文件描述符并关闭
+    
+    文本以UTF-8编码，bytes和memoryview（例如mmap映射的源文件）直接写入不再复制，
+    支持writev的系统上所有分段通过一次分散写系统调用完成。
+    
+    Args:
+        fd: 文件描述符
+        chunks: 要写入的内容
+    """
+    try:
+        buffers = [memoryview(chunk.encode("utf-8") if isinstance(chunk, str) else chunk) for chunk in chunks]
+        buffers = [buffer for buffer in buffers if buffer.nbytes]
+        while buffers:
+            if _HAS_WRITEV:
+                written = os.writev(fd, buffers)
+            else:
+                written = os.write(fd, buffers[0])
+            # 跳过已完整写入的分段，部分写入的分段从剩余位置继续
+            while buffers and written >= buffers[0].nbytes:
+                written -= buffers[0].nbytes
+                buffers.pop(0)
+            if written:
+                buffers[0] = buffers[0][written:]
+    finally:
+        os.close(fd)
+
+
+def _save_article_files(article_data: Dict[str, Any], content: Union[str, bytes, memoryview],
+                        timestamp: str = None) -> tuple[str, str]:
+    """
+    将文章保存为Markdown文件和纯文本文件
+    
+    Args:
+        article_data: 文章数据，包含title, source_url, published_date, model_used(可选)
+        content: 文章正文，可以是文本或UTF-8编码的字节（字节会直接写入Markdown文件）
+        timestamp: 文件名中的时间戳，如果为None则使用当前时间
+        
+    Returns:
+        (markdown文件路径, 文本文件路径)的元组
+    """
+    base_path = _article_base_path(article_data["title"], timestamp)
+    header, footer = _render_markdown_parts(article_data)
+    text = content if isinstance(content, str) else str(content, "utf-8")
+    text_content = _render_text(article_data, text)
+    
+    md_tmp = txt_tmp = None
+    try:
+        # 两个文件都写完后再发布，不会出现空文件或只有一半内容的文件
+        md_tmp = _write_temp(f"{base_path}.md", header, content, footer)
+        txt_tmp = _write_temp(f"{base_path}.txt", text_content)
+        md_path, txt_path = _publish_article_files(base_path, md_tmp, txt_tmp)
+        logger.info(f"文章已保存为Markdown: {md_path}")
         logger.info(f"文章已保存为纯文本: {txt_path}")
         
         return md_path, txt_path
     except Exception as e:
+        _remove_temp_files(md_tmp, txt_tmp)
         logger.error(f"保存文件时出错: {str(e)}")
         raise
 
 
-def save_article_to_db(article_data: Dict[str, Any]) -> Optional[int]:
+def save_article_to_markdown(article_data: Dict[str, Any], timestamp: str = None) -> tuple[str, str]:
     """
-    将文章保存到SQLite数据库
+    将文章保存为Markdown文件和纯文本文件
+    
+    Args:
+        article_data: 文章数据，包含title, content, source_url, published_date, model_used(可选)，
+                      content可以是文本或UTF-8编码的字节
+        timestamp: 文件名中的时间戳，如果为None则使用当前时间
+        
+    Returns:
+        (markdown文件路径, 文本文件路径)的元组
+    """
+    return _save_article_files(article_data, article_data["content"], timestamp)
+
+
+def save_article_to_markdown_from_file(article_data: Dict[str, Any], content_path: str,
+                                       timestamp: str = None) -> tuple[str, str]:
+    """
+    以文件中的内容作为正文保存文章，源文件通过mmap映射后直接写入Markdown文件
+    
+    Args:
+        article_data: 文章数据，包含title, source_url, published_date, model_used(可选)
+        content_path: UTF-8编码的正文文件路径
+        timestamp: 文件名中的时间戳，如果为None则使用当前时间
+        
+    Returns:
+        (markdown文件路径, 文本文件路径)的元组
+    """
+    with open(content_path, "rb") as f:
+        # 空文件无法映射
+        if os.fstat(f.fileno()).st_size == 0:
+            return _save_article_files(article_data, "", timestamp)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as content:
+                return _save_article_files(article_data, content, timestamp)
+
+
+async def _write_atomic_async(path: str, content: str) -> None:
+    """
+    异步将文本以UTF-8编码写入临时文件，再原子地替换目标文件
+    
+    整个文件内容一次编码、以二进制方式一次写入，不经过文本IO层
+    
+    Args:
+        path: 目标文件路径
+        content: 文件内容
+    """
+    tmp_path = await _write_temp_async(path, content)
+    try:
+        await aiofiles.os.replace(tmp_path, path)
+    except BaseException:
+        _remove_temp_files(tmp_path)
+        raise
+
+
+async def _write_temp_async(path: str, content: str) -> str:
+    """
+    异步将文本以UTF-8编码完整写入目标文件所在目录下的临时文件
+    
+    Args:
+        path: 目标文件路径
+        content: 文件内容
+        
+    Returns:
+        临时文件路径
+    """
+    fd, tmp_path = _create_temp_file(path)
+    try:
+        async with aiofiles.open(fd, "wb") as f:
+            await f.write(content.encode("utf-8"))
+    except BaseException:
+        _remove_temp_files(tmp_path)
+        raise
+    return tmp_path
+
+
+async def save_article_to_markdown_async(article_data: Dict[str, Any], timestamp: str = None) -> tuple[str, str]:
+    """
+    异步将文章保存为Markdown文件和纯文本文件，两个文件同时写入，不阻塞事件循环
     
     Args:
         article_data: 文章数据，包含title, content, source_url, published_date, model_used(可选)
+        timestamp: 文件名中的时间戳，如果为None则使用当前时间
         
     Returns:
-        文章ID，如果保存失败则返回None
+        (markdown文件路径, 文本文件路径)的元组
     """
-    # 确保database目录存在
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    base_path, markdown_content, text_content = _render_article_files(article_data, timestamp)
     
+    md_tmp = txt_tmp = None
     try:
-        # 连接到数据库
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
+        results = await asyncio.gather(
+            _write_temp_async(f"{base_path}.md", markdown_content),
+            _write_temp_async(f"{base_path}.txt", text_content),
+            return_exceptions=True
+        )
+        # 其中一个文件写入失败时，另一个已写完的临时文件也需要删除
+        md_tmp, txt_tmp = (result if isinstance(result, str) else None for result in results)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        md_path, txt_path = _publish_article_files(base_path, md_tmp, txt_tmp)
+        logger.info(f"文章已保存为Markdown: {md_path}")
+        logger.info(f"文章已保存为纯文本: {txt_path}")
         
-        # 创建表（如果不存在）
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS articles (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            content TEXT NOT NULL,
-            source_url TEXT,
-            published_date TEXT,
-            model_used TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        return md_path, txt_path
+    except Exception as e:
+        _remove_temp_files(md_tmp, txt_tmp)
+        logger.error(f"保存文件时出错: {str(e)}")
+        raise
+
+
+def _insert_rows(conn: sqlite3.Connection, rows: List[tuple]) -> List[int]:
+    """
+    使用多行INSERT语句插入文章（调用方需已开启事务）
+    
+    Args:
+        conn: 数据库连接
+        rows: 文章数据行
+        
+    Returns:
+        新插入文章的ID列表
+    """
+    for start in range(0, len(rows), _INSERT_BATCH_ROWS):
+        chunk = rows[start:start + _INSERT_BATCH_ROWS]
+        conn.execute(
+            _SQL_INSERT_ARTICLES + ", ".join([_SQL_ARTICLE_VALUES] * len(chunk)),
+            [value for row in chunk for value in row]
         )
-        ''')
+    last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+    
+    # 同一事务内插入的文章ID是连续的
+    return list(range(last_id - len(rows) + 1, last_id + 1))
+
+
+def _bulk_upsert_rows(conn: sqlite3.Connection, rows: List[tuple]) -> List[int]:
+    """
+    大批量导入文章：先删除标题唯一索引，写入完成后再重建（调用方需已开启事务）
+    
+    批次内重复的标题只保留最后一篇，数据库中已存在的标题更新原有记录。
+    
+    Args:
+        conn: 数据库连接
+        rows: 文章数据行
         
-        # 插入文章数据
-        cursor.execute('''
-        INSERT INTO articles (title, content, source_url, published_date, model_used)
-        VALUES (?, ?, ?, ?, ?)
-        ''', (
+    Returns:
+        文章ID列表（与输入顺序一致）
+    """
+    # 按标题去重，保留最后一次出现的数据
+    latest = {row[0]: row for row in rows}
+    titles = list(latest)
+    
+    # 删除索引前利用索引查出已存在的标题
+    title_ids: Dict[str, int] = {}
+    for start in range(0, len(titles), _INSERT_BATCH_ROWS):
+        chunk = titles[start:start + _INSERT_BATCH_ROWS]
+        placeholders = ", ".join("?" * len(chunk))
+        for article_id, title in conn.execute(
+            f'SELECT id, title FROM articles WHERE title IN ({placeholders})', chunk
+        ):
+            title_ids[title] = article_id
+    
+    conn.execute('DROP INDEX IF EXISTS idx_articles_title_unique')
+    
+    conn.executemany(
+        'UPDATE articles SET content = ?, source_url = ?, published_date = ?, model_used = ?, created_at = ? '
+        'WHERE id = ?',
+        [(*latest[title][1:], article_id) for title, article_id in title_ids.items()]
+    )
+    
+    new_rows = [row for title, row in latest.items() if title not in title_ids]
+    if new_rows:
+        title_ids.update(zip((row[0] for row in new_rows), _insert_rows(conn, new_rows)))
+    
+    conn.execute('CREATE UNIQUE INDEX idx_articles_title_unique ON articles(title)')
+    
+    return [title_ids[row[0]] for row in rows]
+
+
+def save_articles_batch(articles: List[Dict[str, Any]], now: datetime = None,
+                        bulk_mode: bool = False) -> List[int]:
+    """
+    在一个事务中批量将文章保存到SQLite数据库，标题已存在的文章会被更新
+    
+    Args:
+        articles: 文章数据列表，每篇文章包含title, content, source_url, published_date, model_used(可选)
+        now: 本批文章的创建时间（UTC），如果为None则使用当前时间
+        bulk_mode: 大批量导入模式，文章数量超过BULK_INDEX_THRESHOLD时导入期间暂时删除标题索引
+        
+    Returns:
+        文章ID列表（与输入顺序一致），如果保存失败则返回空列表
+    """
+    if not articles:
+        return []
+    
+    # 同一批文章共用一个创建时间，格式与SQLite的CURRENT_TIMESTAMP一致（UTC）
+    if now is None:
+        now = datetime.now(timezone.utc)
+    created_at = now.strftime("%Y-%m-%d %H:%M:%S")
+    
+    rows = [
+        (
             article_data["title"],
             article_data["content"],
             article_data["source_url"],
             article_data["published_date"],
-            article_data.get("model_used", "unknown")
-        ))
-        
-        # 提交事务并获取文章ID
-        conn.commit()
-        article_id = cursor.lastrowid
+            article_data.get("model_used", "unknown"),
+            created_at
+        )
+        for article_data in articles
+    ]
+    
+    try:
+        conn = _get_connection()
         
-        # 关闭连接
-        conn.close()
+        if bulk_mode and len(rows) > BULK_INDEX_THRESHOLD and _has_unique_title():
+            # 大批量导入时逐行维护索引的开销较大，导入完成后一次性重建索引
+            with _transaction(conn):
+                article_ids = _bulk_upsert_rows(conn, rows)
+        elif _has_unique_title():
+            # 所有文章共用一个事务，只提交一次；标题冲突时直接更新，一条语句完成查重和写入
+            # 每行使用同一条SQL，直接命中连接的预编译语句缓存
+            with _transaction(conn):
+                article_ids = [conn.execute(_SQL_UPSERT_ARTICLE, row).fetchone()[0] for row in rows]
+        else:
+            # 所有文章共用一个事务，只提交一次；每条INSERT语句写入多行
+            with _transaction(conn):
+                article_ids = _insert_rows(conn, rows)
         
-        logger.info(f"文章已保存到数据库，ID: {article_id}")
-        return article_id
+        logger.info(f"已批量保存 {len(article_ids)} 篇文章到数据库")
+        return article_ids
     
     except Exception as e:
-        logger.error(f"保存到数据库时出错: {str(e)}")
+        logger.error(f"批量保存到数据库时出错: {str(e)}")
+        return []
+
+
+def save_article_to_db(article_data: Dict[str, Any]) -> Optional[int]:
+    """
+    将文章保存到SQLite数据库
+    
+    Args:
+        article_data: 文章数据，包含title, content, source_url, published_date, model_used(可选)
+        
+    Returns:
+        文章ID，如果保存失败则返回None
+    """
+    article_ids = save_articles_batch([article_data])
+    if not article_ids:
         return None
+    
+    article_id = article_ids[0]
+    logger.info(f"文章已保存到数据库，ID: {article_id}")
+    return article_id
+
+
+class ArticleWriter:
+    """
+    后台文章写入线程
+    
+    生成文章的线程或协程只需调用put()提交文章，由单独的写入线程攒批后并发保存文件，
+    并在一个事务中批量写入数据库，使磁盘写入与文章生成重叠进行。
+    """
+    
+    def __init__(self, timestamp: str = None, max_batch: int = 64, flush_interval: float = 0.5,
+                 single_transaction: bool = False):
+        """
+        初始化并启动写入线程
+        
+        Args:
+            timestamp: 文件名中的时间戳，如果为None则使用创建时的时间
+            max_batch: 每批最多保存的文章数量
+            flush_interval: 攒批的最长等待时间（秒）
+            single_transaction: 是否在关闭时将整个运行的文章在一个事务中写入数据库
+                                （整个运行只同步一次磁盘），文件仍在每批到达时保存；
+                                运行期间不持有写锁，不会阻塞其他写入者
+        """
+        self.timestamp = timestamp or make_file_timestamp()
+        self.single_transaction = single_transaction
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.results: List[tuple] = []
+        self._error: Optional[BaseException] = None
+        # single_transaction模式下等待关闭时写入数据库的(结果位置, 文章数据)列表
+        self._pending: List[tuple] = []
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="article-writer", daemon=True)
+        self._thread.start()
+    
+    def put(self, article_data: Dict[str, Any]) -> None:
+        """
+        提交一篇待保存的文章
+        
+        Args:
+            article_data: 文章数据，包含title, content, source_url, published_date, model_used(可选)
+        """
+        self._queue.put(article_data)
+    
+    def close(self) -> List[tuple]:
+        """
+        等待所有已提交的文章保存完成并停止写入线程
+        
+        Returns:
+            按提交顺序排列的(文章数据, (markdown文件路径, 文本文件路径)或异常, 数据库ID或None)列表
+            
+        Raises:
+            RuntimeError: 写入线程异常退出，部分已提交的文章未能保存
+        """
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            logger.error(f"文章写入线程异常退出，只保存了 {len(self.results)} 篇文章: {str(self._error)}")
+            raise RuntimeError(f"文章写入线程异常退出: {str(self._error)}") from self._error
+        return self.results
+    
+    def _run(self) -> None:
+        """写入线程主循环，记录导致线程退出的异常，由close()报告"""
+        try:
+            self._drain()
+            if self.single_transaction:
+                self._save_pending()
+        except BaseException as e:
+            self._error = e
+    
+    def _save_pending(self) -> None:
+        """在一个事务中将整个运行期间保存好文件的文章写入数据库，只在提交时短暂持有写锁"""
+        if not self._pending:
+            return
+        article_ids = save_articles_batch([article for _, article in self._pending])
+        if len(article_ids) != len(self._pending):
+            # 保存失败时save_articles_batch已记录错误，所有文章都没有数据库ID
+            article_ids = [None] * len(self._pending)
+        for (index, _), article_id in zip(self._pending, article_ids):
+            article, paths, _ = self.results[index]
+            self.results[index] = (article, paths, article_id)
+        logger.info(f"已在一个事务中写入 {len(self._pending)} 篇文章")
+        self._pending = []
+    
+    def _drain(self) -> None:
+        """攒满一批或等待超时后保存，收到结束标记时保存剩余文章并退出"""
+        stopping = False
+        while not stopping:
+            batch = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while item is not None:
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= self.max_batch or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if item is None:
+                stopping = True
+            if batch:
+                self._flush(batch)
+    
+    def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        并发保存一批文章的文件，再将保存成功的文章在一个事务中写入数据库
+        
+        single_transaction模式下只保存文件，数据库记录留到关闭时统一写入。
+        
+        Args:
+            batch: 文章数据列表
+        """
+        try:
+            saved_paths = asyncio.run(self._save_files(batch))
+        except Exception as e:
+            logger.error(f"保存文件时出错: {str(e)}")
+            saved_paths = [e] * len(batch)
+        
+        if self.single_transaction:
+            for article, paths in zip(batch, saved_paths):
+                if not isinstance(paths, Exception):
+                    self._pending.append((len(self.results), article))
+                self.results.append((article, paths, None))
+            return
+        
+        saved = [article for article, paths in zip(batch, saved_paths) if not isinstance(paths, Exception)]
+        article_ids = iter(save_articles_batch(saved) if saved else [])
+        
+        for article, paths in zip(batch, saved_paths):
+            article_id = None if isinstance(paths, Exception) else next(article_ids, None)
+            self.results.append((article, paths, article_id))
+    
+    async def _save_files(self, batch: List[Dict[str, Any]]) -> list:
+        """并发保存一批文章的Markdown和纯文本文件，失败的位置为异常对象"""
+        return await asyncio.gather(
+            *(save_article_to_markdown_async(article, timestamp=self.timestamp) for article in batch),
+            return_exceptions=True
+        )
 
 
 def get_article_from_db(article_id: int) -> Optional[Dict[str, Any]]:
@@ -218,21 +1015,16 @@ def get_article_from_db(article_id: int) -> Optional[Dict[str, Any]]:
         文章数据，如果未找到则返回None
     """
     try:
-        # 连接到数据库
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row  # 使结果可以通过列名访问
-        cursor = conn.cursor()
+        cursor = _get_connection().cursor()
         
         # 查询文章
         cursor.execute('SELECT * FROM articles WHERE id = ?', (article_id,))
         row = cursor.fetchone()
         
-        # 关闭连接
-        conn.close()
-        
         if row:
-            # 将行转换为字典
-            article = {key: row[key] for key in row.keys()}
+            # 按查询结果的列名将行转换为字典
+            columns = [column[0] for column in cursor.description]
+            article = dict(zip(columns, row))
             return article
         else:
             logger.warning(f"未找到ID为{article_id}的文章")
@@ -254,10 +1046,7 @@ def list_articles(limit: int = 10) -> list:
         文章列表，每个文章包含id, title, published_date, model_used
     """
     try:
-        # 连接到数据库
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _get_connection().cursor()
         
         # 查询最近的文章
         cursor.execute('''
@@ -269,11 +1058,9 @@ def list_articles(limit: int = 10) -> list:
         
         rows = cursor.fetchall()
         
-        # 关闭连接
-        conn.close()
-        
-        # 将行转换为字典列表
-        articles = [{key: row[key] for key in row.keys()} for row in rows]
+        # 按查询结果的列名将行转换为字典列表
+        columns = [column[0] for column in cursor.description]
+        articles = [dict(zip(columns, row)) for row in rows]
         return articles
     
     except Exception as e:
@@ -293,47 +1080,176 @@ def check_news_exists(title: str, source_url: str = None) -> bool:
         如果新闻已存在返回True，否则返回False
     """
     try:
-        # 确保database目录存在
-        os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-        
-        # 连接到数据库
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
+        cursor = _get_connection().cursor()
         
-        # 创建表（如果不存在）
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS articles (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            content TEXT NOT NULL,
-            source_url TEXT,
-            published_date TEXT,
-            model_used TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        # 标题或source_url任一完全匹配即视为已存在，两列都有索引，找到第一条即返回
+        # source_url为空时传入NULL，NULL不会与任何记录相等
+        cursor.execute(
+            'SELECT 1 FROM articles WHERE title = ? OR source_url = ? LIMIT 1',
+            (title, source_url or None)
         )
-        ''')
-        
-        # 首先检查标题是否完全匹配
-        cursor.execute('SELECT COUNT(*) FROM articles WHERE title = ?', (title,))
-        if cursor.fetchone()[0] > 0:
-            conn.close()
-            return True
-            
-        # 如果有source_url，也检查URL是否匹配
-        if source_url:
-            cursor.execute('SELECT COUNT(*) FROM articles WHERE source_url = ?', (source_url,))
-            if cursor.fetchone()[0] > 0:
-                conn.close()
-                return True
-        
-        conn.close()
-        return False
+        return cursor.fetchone() is not None
         
     except Exception as e:
         logger.error(f"检查新闻是否存在时出错: {str(e)}")
         return False
 
 
+def check_news_exists_batch(news_keys: List[tuple]) -> List[bool]:
+    """
+    批量检查多条新闻是否已经存在于数据库中
+    
+    每批新闻只执行一条IN查询，由标题和source_url索引查找，结果与逐条调用check_news_exists相同。
+    
+    Args:
+        news_keys: (新闻标题, 新闻源URL)元组列表，URL可以为空
+        
+    Returns:
+        与news_keys一一对应的列表，新闻已存在为True，否则为False
+    """
+    existing_titles = set()
+    existing_urls = set()
+    try:
+        cursor = _get_connection().cursor()
+        
+        for start in range(0, len(news_keys), _EXISTS_BATCH_ROWS):
+            batch = news_keys[start:start + _EXISTS_BATCH_ROWS]
+            titles = [title for title, _ in batch]
+            urls = [source_url or None for _, source_url in batch]
+            placeholders = ", ".join("?" * len(batch))
+            cursor.execute(
+                f'SELECT title, source_url FROM articles '
+                f'WHERE title IN ({placeholders}) OR source_url IN ({placeholders})',
+                titles + urls
+            )
+            for title, source_url in cursor.fetchall():
+                existing_titles.add(title)
+                existing_urls.add(source_url)
+        
+    except Exception as e:
+        logger.error(f"批量检查新闻是否存在时出错: {str(e)}")
+        return [False] * len(news_keys)
+    
+    existing_urls.discard(None)
+    return [title in existing_titles or (source_url or None) in existing_urls
+            for title, source_url in news_keys]
+
+
+def get_cached_title(key: str) -> Optional[str]:
+    """
+    从数据库中读取缓存的优化标题
+    
+    Args:
+        key: 缓存键（原标题和模型的哈希值）
+        
+    Returns:
+        缓存的优化标题，如果不存在则返回None
+    """
+    try:
+        cursor = _get_connection().cursor()
+        cursor.execute('SELECT optimized FROM title_cache WHERE hash = ?', (key,))
+        row = cursor.fetchone()
+        return row[0] if row else None
+        
+    except Exception as e:
+        logger.error(f"读取标题缓存时出错: {str(e)}")
+        return None
+
+
+def get_cached_titles(keys: List[str]) -> Dict[str, str]:
+    """
+    批量读取缓存的优化标题，每批缓存键只执行一条IN查询
+    
+    Args:
+        keys: 缓存键列表
+        
+    Returns:
+        以缓存键为键的优化标题字典，没有缓存的键不在结果中
+    """
+    cached: Dict[str, str] = {}
+    try:
+        cursor = _get_connection().cursor()
+        for start in range(0, len(keys), _TITLE_CACHE_BATCH_KEYS):
+            chunk = keys[start:start + _TITLE_CACHE_BATCH_KEYS]
+            cursor.execute(
+                f'SELECT hash, optimized FROM title_cache WHERE hash IN ({",".join("?" * len(chunk))})',
+                chunk
+            )
+            cached.update(cursor.fetchall())
+    except Exception as e:
+        logger.error(f"读取标题缓存时出错: {str(e)}")
+    return cached
+
+
+def save_cached_title(key: str, optimized: str) -> None:
+    """
+    将优化后的标题写入数据库缓存
+    
+    Args:
+        key: 缓存键（原标题和模型的哈希值）
+        optimized: 优化后的标题
+    """
+    save_cached_titles([(key, optimized)])
+
+
+def save_cached_titles(items: List[tuple]) -> None:
+    """
+    在一个事务中将多个优化后的标题写入数据库缓存
+    
+    Args:
+        items: (缓存键, 优化后的标题)元组列表
+    """
+    if not items:
+        return
+    try:
+        conn = _get_connection()
+        with _transaction(conn):
+            conn.executemany(
+                'INSERT OR REPLACE INTO title_cache (hash, optimized) VALUES (?, ?)',
+                items
+            )
+            
+    except Exception as e:
+        logger.error(f"写入标题缓存时出错: {str(e)}")
+
+
+
+async def get_cached_article_async(key: str) -> Optional[str]:
+    """
+    读取缓存的文章生成结果
+    
+    生成结果保存为缓存目录中的文本文件而不是数据库，读写时不会与数据库的写事务冲突。
+    
+    Args:
+        key: 缓存键（模型、风格要求和新闻内容的哈希值）
+        
+    Returns:
+        缓存的文章内容，如果不存在则返回None
+    """
+    try:
+        async with aiofiles.open(os.path.join(_article_cache_dir(), f"{key}.txt"), "r", encoding="utf-8") as f:
+            return await f.read()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error(f"读取文章缓存时出错: {str(e)}")
+        return None
+
+
+async def save_cached_article_async(key: str, content: str) -> None:
+    """
+    将文章生成结果写入缓存
+    
+    Args:
+        key: 缓存键（模型、风格要求和新闻内容的哈希值）
+        content: 生成的文章内容
+    """
+    try:
+        await _write_atomic_async(os.path.join(_article_cache_dir(), f"{key}.txt"), content)
+    except Exception as e:
+        logger.error(f"写入文章缓存时出错: {str(e)}")
+
+
 if __name__ == "__main__":
     # 配置日志
     logging.basicConfig(
@@ -7,109 +7,194 @@
 用于分析网页结构，寻找正确的文章选择器
 """
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import itertools
+import sys
+from typing import Iterator, List
 
-def analyze_webpage(url):
-    """分析网页结构，寻找可能的文章选择器"""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1"
-    }
-    
-    print(f"正在分析网页: {url}")
-    response = requests.get(url, headers=headers, timeout=10)
-    response.raise_for_status()
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+# 尝试导入brotli，aiohttp只有在安装了brotli时才能解码br压缩的响应
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+# 请求头
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br" if HAS_BROTLI else "gzip, deflate",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1"
+}
+
+# 同时进行的最大请求数量
+MAX_CONCURRENCY = 64
+
+# 空闲连接保持的秒数，同一站点的后续请求可以复用已建立的TCP/TLS连接
+KEEPALIVE_TIMEOUT = 30
+
+# 可能的文章选择器
+ARTICLE_SELECTORS = (
+    "article", 
+    "div.relative", 
+    "div.group", 
+    "div.flex", 
+    "div.duet--article--article-body-component",
+    "div.c-entry-box--compact",
+    "div.c-compact-river__entry",
+    "div.l-col__main",
+    "div.c-entry-box--compact--article",
+    "div.wh8b41h",
+    "div.a18g6gd",
+    "div.a18g6gd a",
+    "div.wh8b41h a",
+    "div.i0ukxu0",
+    "li.a18g6gd",
+    "div.a18g6gd div"
+)
+
+# 文章元素内的标题和链接选择器
+TITLE_SELECTORS = ("h1", "h2", "h3", ".title", ".headline")
+LINK_SELECTORS = ("a", "a.permalink", "a.title")
+
+# 可能的文章列表容器选择器
+LIST_SELECTORS = ("ul", "ol", "div.feed", "div.list", "div.grid", "div.articles", "section")
+
+
+def _select_descendants(node: LexborNode, selector: str) -> List[LexborNode]:
+    """查找节点的后代元素（不包含节点本身，与BeautifulSoup的select行为一致）"""
+    return [element for element in node.css(selector) if element.mem_id != node.mem_id]
+
+
+def _iter_tag(tree: LexborHTMLParser, tag: str, limit: int) -> Iterator[LexborNode]:
+    """按文档顺序惰性查找指定标签，找到limit个后即停止遍历"""
+    return itertools.islice((node for node in tree.root.traverse() if node.tag == tag), limit)
+
+
+def _class_names(node: LexborNode) -> str:
+    """返回节点的class属性，多个class之间用空格分隔"""
+    return " ".join((node.attributes.get("class") or "").split())
+
+
+def _parse_and_analyze(html: str, url: str) -> str:
+    """
+    解析网页并生成结构分析报告（纯同步的CPU密集操作，在工作线程中执行）
     
-    soup = BeautifulSoup(response.text, "html.parser")
+    Args:
+        html: 网页HTML内容
+        url: 网页URL
+        
+    Returns:
+        分析报告文本
+    """
+    lines: List[str] = []
+    out = lines.append
     
-    # 可能的文章选择器
-    selectors = [
-        "article", 
-        "div.relative", 
-        "div.group", 
-        "div.flex", 
-        "div.duet--article--article-body-component",
-        "div.c-entry-box--compact",
-        "div.c-compact-river__entry",
-        "div.l-col__main",
-        "div.c-entry-box--compact--article",
-        "div.wh8b41h",
-        "div.a18g6gd",
-        "div.a18g6gd a",
-        "div.wh8b41h a",
-        "div.i0ukxu0",
-        "li.a18g6gd",
-        "div.a18g6gd div"
-    ]
+    out(f"正在分析网页: {url}")
+    tree = LexborHTMLParser(html)
     
-    print("\n可能的文章选择器:")
-    for selector in selectors:
-        elements = soup.select(selector)
-        print(f"{selector}: {len(elements)} 个元素")
+    out("\n可能的文章选择器:")
+    for selector in ARTICLE_SELECTORS:
+        elements = tree.css(selector)
+        out(f"{selector}: {len(elements)} 个元素")
         
         if elements and len(elements) > 0:
-            print(f"  示例: {elements[0].get_text()[:100].strip()}...")
+            out(f"  示例: {elements[0].text()[:100].strip()}...")
             
             # 检查是否包含标题和链接
-            title_selectors = ["h1", "h2", "h3", ".title", ".headline"]
-            link_selectors = ["a", "a.permalink", "a.title"]
-            
-            for title_selector in title_selectors:
-                title_elements = elements[0].select(title_selector)
+            for title_selector in TITLE_SELECTORS:
+                title_elements = _select_descendants(elements[0], title_selector)
                 if title_elements:
-                    print(f"  - 找到标题元素 ({title_selector}): {title_elements[0].get_text().strip()}")
+                    out(f"  - 找到标题元素 ({title_selector}): {title_elements[0].text().strip()}")
                     break
             
-            for link_selector in link_selectors:
-                link_elements = elements[0].select(link_selector)
+            for link_selector in LINK_SELECTORS:
+                link_elements = _select_descendants(elements[0], link_selector)
                 if link_elements:
-                    print(f"  - 找到链接元素 ({link_selector}): {link_elements[0].get('href')}")
+                    out(f"  - 找到链接元素 ({link_selector}): {link_elements[0].attributes.get('href')}")
                     break
     
     # 查找所有h2标签，通常是文章标题
-    print("\n所有h2标签:")
-    h2_elements = soup.find_all("h2")
-    for i, h2 in enumerate(h2_elements[:5]):  # 只显示前5个
-        print(f"[{i+1}] {h2.get_text().strip()}")
+    out("\n所有h2标签:")
+    for i, h2 in enumerate(_iter_tag(tree, "h2", 5)):  # 只显示前5个
+        out(f"[{i+1}] {h2.text().strip()}")
         # 查找父元素
         parent = h2.parent
-        print(f"  父元素: {parent.name}.{' '.join(parent.get('class', []))}")
+        out(f"  父元素: {parent.tag}.{_class_names(parent)}")
         # 查找链接
-        links = h2.find_all("a")
+        links = h2.css("a")
         for link in links:
-            print(f"  链接: {link.get('href')}")
+            out(f"  链接: {link.attributes.get('href')}")
     
     # 查找所有a标签，可能是文章链接
-    print("\n所有a标签 (前10个):")
-    a_elements = soup.find_all("a")
-    for i, a in enumerate(a_elements[:10]):
-        if a.get_text().strip():
-            print(f"[{i+1}] {a.get_text().strip()[:50]}...")
-            print(f"  链接: {a.get('href')}")
-            print(f"  父元素: {a.parent.name}.{' '.join(a.parent.get('class', []))}")
+    out("\n所有a标签 (前10个):")
+    for i, a in enumerate(_iter_tag(tree, "a", 10)):
+        if a.text().strip():
+            out(f"[{i+1}] {a.text().strip()[:50]}...")
+            out(f"  链接: {a.attributes.get('href')}")
+            out(f"  父元素: {a.parent.tag}.{_class_names(a.parent)}")
     
     # 查找可能的文章列表容器
-    print("\n可能的文章列表容器:")
-    list_selectors = ["ul", "ol", "div.feed", "div.list", "div.grid", "div.articles", "section"]
-    for selector in list_selectors:
-        elements = soup.select(selector)
-        print(f"{selector}: {len(elements)} 个元素")
+    out("\n可能的文章列表容器:")
+    for selector in LIST_SELECTORS:
+        elements = tree.css(selector)
+        out(f"{selector}: {len(elements)} 个元素")
         
         if elements and len(elements) > 0:
             # 检查是否包含多个文章
             for i, element in enumerate(elements[:3]):  # 只检查前3个
-                links = element.find_all("a")
+                links = element.css("a")
                 if len(links) > 3:  # 如果包含多个链接，可能是文章列表
-                    print(f"  - 元素 {i+1} 包含 {len(links)} 个链接，可能是文章列表")
+                    out(f"  - 元素 {i+1} 包含 {len(links)} 个链接，可能是文章列表")
                     for j, link in enumerate(links[:3]):  # 只显示前3个链接
-                        print(f"    链接 {j+1}: {link.get_text().strip()[:30]}... -> {link.get('href')}")
+                        out(f"    链接 {j+1}: {link.text().strip()[:30]}... -> {link.attributes.get('href')}")
     
-    print("\n分析完成!")
+    out("\n分析完成!")
+    
+    return "\n".join(lines)
+
+
+async def analyze_webpage(url: str, session: aiohttp.ClientSession) -> None:
+    """分析网页结构，寻找可能的文章选择器"""
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+        response.raise_for_status()
+        html = await response.text()
+    
+    # 解析放到工作线程中执行，避免阻塞事件循环中其他网页的下载
+    report = await asyncio.to_thread(_parse_and_analyze, html, url)
+    print(report)
+
+
+async def main(urls: List[str], concurrency: int = MAX_CONCURRENCY) -> None:
+    """
+    并发分析多个网页
+    
+    Args:
+        urls: 要分析的网页URL列表
+        concurrency: 同时进行的最大请求数量
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def run(url: str, session: aiohttp.ClientSession) -> None:
+        async with semaphore:
+            try:
+                await analyze_webpage(url, session)
+            except Exception as e:
+                print(f"分析网页 {url} 时出错: {str(e)}")
+    
+    # 所有请求共用一个会话和连接池，连接在请求之间保持打开以便复用
+    connector = aiohttp.TCPConnector(limit_per_host=concurrency, keepalive_timeout=KEEPALIVE_TIMEOUT,
+                                     force_close=False, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(headers=HEADERS, connector=connector) as session:
+        await asyncio.gather(*(run(url, session) for url in urls))
+
 
 if __name__ == "__main__":
-    # 分析The Verge AI网页
-    analyze_webpage("https://www.theverge.com/ai-artificial-intelligence") 
\ No newline at end of file
+    # 默认分析The Verge AI网页，也可以通过命令行传入多个URL
+    urls = sys.argv[1:] or ["https://www.theverge.com/ai-artificial-intelligence"]
+    asyncio.run(main(urls)) 
\ No newline at end of file
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试文章生成模块
+
+使用模拟的OpenAI客户端测试客户端的创建和批量标题优化
+"""
+
+import sys
+import os
+import asyncio
+import json
+from types import SimpleNamespace
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from src.core import article_generator
+from src.storage import article_storage
+
+
+class FakeCompletions:
+    """模拟chat.completions接口，为每个编号的标题加上前缀后以JSON返回"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, model, messages, **kwargs):
+        self.calls.append(kwargs)
+        numbered = messages[1]["content"].split("原标题:\n", 1)[1].split("\n\n", 1)[0]
+        titles = ["重磅！" + line.split(". ", 1)[1] for line in numbered.splitlines()]
+        message = SimpleNamespace(content=json.dumps({"titles": titles}, ensure_ascii=False))
+        return SimpleNamespace(usage=None, choices=[SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def fake_client(tmp_path, monkeypatch):
+    """使用模拟客户端和临时数据库"""
+    article_storage._close_connection()
+    monkeypatch.setattr(article_storage, "DB_PATH", str(tmp_path / "articles.db"))
+    monkeypatch.setattr(article_generator, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(article_generator, "_TITLE_CACHE", {})
+    completions = FakeCompletions()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    monkeypatch.setattr(article_generator, "_get_client", lambda: client)
+    yield completions
+    article_storage._close_connection()
+
+
+def test_get_client(monkeypatch):
+    """测试同一事件循环内复用客户端，run_async结束时关闭客户端，换进程后重新创建"""
+    monkeypatch.setattr(article_generator, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(article_generator, "_client", None)
+
+    async def get_twice():
+        return article_generator._get_client(), article_generator._get_client()
+
+    first, second = article_generator.run_async(get_twice())
+    assert first is second
+    assert first.is_closed()
+    assert article_generator._client is None
+    assert article_generator.run_async(get_twice())[0] is not first
+
+    async def get_after_fork():
+        client = article_generator._get_client()
+        monkeypatch.setattr(os, "getpid", lambda: -1)
+        return client, article_generator._get_client()
+
+    before, after = asyncio.run(get_after_fork())
+    assert before is not after
+
+
+def test_optimize_titles_bulk(fake_client, monkeypatch):
+    """测试批量优化标题按顺序返回，重复和已缓存的标题不会再次请求"""
+    monkeypatch.setattr(article_generator, "TITLE_BULK_SIZE", 2)
+
+    assert article_generator.optimize_titles_bulk(["a", "b", "a", "c"]) == ["重磅！a", "重磅！b", "重磅！a", "重磅！c"]
+    assert len(fake_client.calls) == 2
+    assert fake_client.calls[0]["response_format"] == {"type": "json_object"}
+    assert article_storage.get_cached_title(article_generator._title_cache_key("b", article_generator.DEFAULT_MODEL)) == "重磅！b"
+
+    assert article_generator.optimize_titles_bulk(["c", "a"]) == ["重磅！c", "重磅！a"]
+    assert len(fake_client.calls) == 2
+
+
+def test_select_style_avoids_recent(monkeypatch):
+    """测试自动选择风格时避开最近使用的风格，并按修改后的历史长度保留记录"""
+    monkeypatch.setattr(article_generator, "RECENT_USED_STYLES", article_generator.deque(maxlen=3))
+    monkeypatch.setattr(article_generator, "_RECENT_STYLE_SET", set())
+    monkeypatch.setattr(article_generator, "MAX_STYLE_HISTORY", 3)
+
+    chosen = [article_generator._select_style() for _ in range(20)]
+    for i in range(1, len(chosen)):
+        assert chosen[i] not in chosen[max(0, i - 3):i]
+
+    monkeypatch.setattr(article_generator, "MAX_STYLE_HISTORY", 1)
+    assert article_generator._select_style(specific_style=2) == 1
+    assert list(article_generator.RECENT_USED_STYLES) == [1]
+    assert article_generator._select_style() != 1
+
+
+def test_article_max_tokens():
+    """测试输出长度上限不超过默认值，且提示加输出不超出上下文窗口"""
+    default = article_generator.ARTICLE_COMPLETION_PARAMS["max_tokens"]
+    margin = article_generator.CONTEXT_WINDOW_MARGIN
+
+    assert article_generator._article_max_tokens("gpt-4o", 1500) == default
+    assert article_generator._article_max_tokens("gpt-4", 7000) == 8192 - 7000 - margin
+    assert article_generator._article_max_tokens("gpt-4", 9000) == 1
+    assert article_generator._article_max_tokens("unknown-model", 1500) == default
+
+
+class FakeBatchClient:
+    """模拟批处理接口：第一个请求成功，第二个请求写入错误文件，任务最终过期"""
+
+    def __init__(self):
+        self.files = SimpleNamespace(create=self.create_file, content=self.file_content)
+        self.batches = SimpleNamespace(create=self.create_batch, retrieve=self.retrieve_batch)
+        self.lines = []
+
+    async def create_file(self, file, purpose):
+        self.lines = [json.loads(line) for line in file[1].decode("utf-8").splitlines()]
+        return SimpleNamespace(id="file-input")
+
+    async def create_batch(self, **kwargs):
+        return SimpleNamespace(id="batch-1", status="in_progress")
+
+    async def retrieve_batch(self, batch_id):
+        return SimpleNamespace(id=batch_id, status="expired", errors=None, output_file_id="file-output",
+                               error_file_id="file-error", request_counts=SimpleNamespace(completed=1))
+
+    async def file_content(self, file_id):
+        first, second = self.lines[0]["custom_id"], self.lines[1]["custom_id"]
+        if file_id == "file-output":
+            body = {"choices": [{"message": {"content": "文章内容"}}]}
+            line = {"custom_id": first, "response": {"status_code": 200, "body": body}, "error": None}
+        else:
+            body = {"error": {"code": "context_length_exceeded", "message": "提示过长"}}
+            line = {"custom_id": second, "response": {"status_code": 400, "body": body}, "error": None}
+        return SimpleNamespace(text=json.dumps(line, ensure_ascii=False))
+
+
+def test_generate_articles_batch_offline(tmp_path, monkeypatch, caplog):
+    """测试离线批处理读取结果文件和错误文件，并记录失败请求的原因"""
+    monkeypatch.setattr(article_storage, "ROOT_DIR", str(tmp_path))
+    monkeypatch.setattr(article_generator, "OPENAI_API_KEY", "sk-test")
+    client = FakeBatchClient()
+    monkeypatch.setattr(article_generator, "_get_client", lambda: client)
+    news_list = [{"title": f"新闻 {i}", "summary": "摘要", "link": "https://example.com/news",
+                  "published_date": "2025-06-01"} for i in range(3)]
+
+    results = []
+    articles = asyncio.run(article_generator.generate_articles_batch_offline(
+        news_list, poll_interval=0, result_callback=lambda news, content: results.append(content)
+    ))
+
+    assert articles == ["文章内容", None, None]
+    assert sorted(results, key=str) == sorted(articles, key=str)
+    assert "context_length_exceeded" in caplog.text
+    assert "expired" in caplog.text
+
+
+def test_article_cache_key():
+    """测试自动选择风格时缓存键与随机选中的风格无关，指定风格时区分风格"""
+    news = {"title": "新闻", "summary": "摘要", "link": "https://example.com/news", "published_date": "2025-06-01"}
+    auto_key = article_generator._article_cache_key("gpt-4o", news)
+
+    assert article_generator._article_cache_key("gpt-4o", dict(news)) == auto_key
+    assert article_generator._article_cache_key("gpt-4o", news, specific_style=99) == auto_key
+    assert article_generator._article_cache_key("gpt-4o", news, specific_style=2) != auto_key
+    assert article_generator._article_cache_key("gpt-4o-mini", news) != auto_key
+    assert article_generator._article_cache_key("gpt-4o", dict(news, summary="新摘要")) != auto_key
@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试文章存储模块
+
+使用临时数据库测试文章的批量保存、读取和查重功能
+"""
+
+import sys
+import os
+import asyncio
+import sqlite3
+import time
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from src.storage import article_storage
+
+
+def make_article(index):
+    """生成测试文章数据"""
+    return {
+        "title": f"测试文章 {index}",
+        "content": f"这是第 {index} 篇测试文章的内容...",
+        "source_url": f"https://example.com/news/{index}",
+        "published_date": "2023-05-20",
+        "model_used": "gpt-4o"
+    }
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """将数据库路径指向临时目录，并在测试结束后关闭连接"""
+    article_storage._close_connection()
+    monkeypatch.setattr(article_storage, "DB_PATH", str(tmp_path / "database" / "articles.db"))
+    yield
+    article_storage._close_connection()
+
+
+def test_save_articles_batch(temp_db):
+    """测试批量保存文章并按ID读取"""
+    articles = [make_article(i) for i in range(3)]
+    article_ids = article_storage.save_articles_batch(articles)
+
+    assert len(article_ids) == 3
+    for article_id, article in zip(article_ids, articles):
+        saved = article_storage.get_article_from_db(article_id)
+        assert saved["title"] == article["title"]
+        assert saved["source_url"] == article["source_url"]
+
+
+def test_save_articles_batch_created_at(temp_db):
+    """测试同一批文章使用相同的创建时间"""
+    now = datetime(2023, 5, 20, 12, 30, 45, tzinfo=timezone.utc)
+    article_ids = article_storage.save_articles_batch([make_article(i) for i in range(2)], now=now)
+
+    for article_id in article_ids:
+        assert article_storage.get_article_from_db(article_id)["created_at"] == "2023-05-20 12:30:45"
+
+
+def test_save_article_to_db(temp_db):
+    """测试保存单篇文章"""
+    article_id = article_storage.save_article_to_db(make_article(1))
+
+    assert article_id is not None
+    assert article_storage.get_article_from_db(article_id)["model_used"] == "gpt-4o"
+    assert len(article_storage.list_articles(5)) == 1
+
+
+def test_save_article_updates_existing_title(temp_db):
+    """测试保存同标题文章时更新原有记录"""
+    article = make_article(1)
+    first_id = article_storage.save_article_to_db(article)
+
+    article["content"] = "更新后的内容"
+    assert article_storage.save_article_to_db(article) == first_id
+    assert article_storage.get_article_from_db(first_id)["content"] == "更新后的内容"
+    assert len(article_storage.list_articles(5)) == 1
+
+
+def test_save_with_duplicate_titles_in_existing_db(tmp_path, monkeypatch):
+    """测试旧数据库中已有重复标题时仍可保存文章"""
+    db_path = tmp_path / "articles.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE articles (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, "
+                 "content TEXT NOT NULL, source_url TEXT, published_date TEXT, model_used TEXT, "
+                 "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)")
+    conn.executemany("INSERT INTO articles (title, content) VALUES (?, ?)", [("重复", "a"), ("重复", "b")])
+    conn.commit()
+    conn.close()
+
+    article_storage._close_connection()
+    monkeypatch.setattr(article_storage, "DB_PATH", str(db_path))
+    try:
+        assert article_storage.save_articles_batch([make_article(1), make_article(2)]) == [3, 4]
+    finally:
+        article_storage._close_connection()
+
+
+def test_save_from_multiple_threads(temp_db):
+    """测试多个线程各自使用独立的连接保存文章"""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        article_ids = list(executor.map(article_storage.save_article_to_db, [make_article(i) for i in range(8)]))
+
+    assert sorted(article_ids) == list(range(1, 9))
+    assert len(article_storage.list_articles(20)) == 8
+
+
+def test_check_news_exists(temp_db):
+    """测试按标题和链接查重"""
+    article_storage.save_article_to_db(make_article(1))
+
+    assert article_storage.check_news_exists("测试文章 1")
+    assert article_storage.check_news_exists("其他标题", "https://example.com/news/1")
+    assert not article_storage.check_news_exists("其他标题", "https://example.com/news/2")
+
+
+def test_check_news_exists_batch(temp_db, monkeypatch):
+    """测试分批查重的结果与逐条查重相同"""
+    monkeypatch.setattr(article_storage, "_EXISTS_BATCH_ROWS", 2)
+    article_storage.save_articles_batch([make_article(1), make_article(3)])
+
+    news_keys = [
+        ("测试文章 1", None),
+        ("其他标题", "https://example.com/news/1"),
+        ("其他标题", "https://example.com/news/2"),
+        ("其他标题", ""),
+        ("测试文章 3", "https://example.com/news/4"),
+    ]
+    assert article_storage.check_news_exists_batch(news_keys) == [True, True, False, False, True]
+    assert article_storage.check_news_exists_batch([]) == []
+
+
+def test_format_filename():
+    """测试标题转换为安全的文件名"""
+    assert article_storage.format_filename("GPT-4o震撼发布：AI多模态能力迎来质的飞跃！") == "gpt-4o震撼发布ai多模态能力迎来质的飞跃"
+    assert article_storage.format_filename("OpenAI's  new   model [beta]") == "openais_new_model_beta"
+    assert article_storage.format_filename("__.hidden\x07 file") == "hidden_file"
+    assert article_storage.format_filename("【】《》？！") == "article"
+    assert len(article_storage.format_filename("A" * 100)) == 50
+
+
+def test_clean_text_content():
+    """测试去除Markdown格式符号"""
+    text = "## 引言\n\n这是**重点**和*斜体*\n\n---\n\n\n\n### 小标题\n正文"
+    assert article_storage.clean_text_content(text) == "引言\n\n这是重点和斜体\n\n小标题\n正文"
+
+
+def test_title_cache(temp_db):
+    """测试标题优化缓存的读写"""
+    assert article_storage.get_cached_title("key") is None
+
+    article_storage.save_cached_title("key", "重磅！优化后的标题")
+    assert article_storage.get_cached_title("key") == "重磅！优化后的标题"
+
+
+def test_article_cache(tmp_path, monkeypatch):
+    """测试文章生成结果缓存的读写"""
+    monkeypatch.setattr(article_storage, "ROOT_DIR", str(tmp_path))
+    assert asyncio.run(article_storage.get_cached_article_async("key")) is None
+
+    asyncio.run(article_storage.save_cached_article_async("key", "文章内容\n第二段"))
+    assert asyncio.run(article_storage.get_cached_article_async("key")) == "文章内容\n第二段"
+
+
+def test_save_article_to_markdown_async(tmp_path, monkeypatch):
+    """测试异步保存的文件内容与同步版本一致"""
+    monkeypatch.setattr(article_storage, "ROOT_DIR", str(tmp_path))
+    article = make_article(1)
+
+    md_path, txt_path = asyncio.run(article_storage.save_article_to_markdown_async(article))
+    with open(md_path, encoding="utf-8") as f:
+        async_md = f.read()
+    with open(txt_path, encoding="utf-8") as f:
+        async_txt = f.read()
+    os.remove(md_path)
+    os.remove(txt_path)
+
+    md_path, txt_path = article_storage.save_article_to_markdown(article)
+    with open(md_path, encoding="utf-8") as f:
+        assert f.read() == async_md
+    with open(txt_path, encoding="utf-8") as f:
+        assert f.read() == async_txt
+
+
+def test_save_article_to_markdown_name_collision(tmp_path, monkeypatch):
+    """测试同一时间戳下同名文章不会互相覆盖"""
+    monkeypatch.setattr(article_storage, "ROOT_DIR", str(tmp_path))
+    article = make_article(1)
+
+    first = article_storage.save_article_to_markdown(article, timestamp="20230520_120000")
+    second = article_storage.save_article_to_markdown(article, timestamp="20230520_120000")
+
+    assert first[0].endswith("20230520_120000_测试文章_1.md")
+    assert second[0].endswith("20230520_120000_测试文章_1_1.md")
+    assert second[1].endswith("20230520_120000_测试文章_1_1.txt")
+    assert len(os.listdir(tmp_path / "data" / "articles")) == 4
+
+    # 只有纯文本文件名被占用时也换下一个序号，已发布的文件都有完整内容且不留临时文件
+    (tmp_path / "data" / "articles" / "20230520_120000_测试文章_1_2.txt").write_text("", encoding="utf-8")
+    third = asyncio.run(article_storage.save_article_to_markdown_async(article, timestamp="20230520_120000"))
+    assert third[0].endswith("20230520_120000_测试文章_1_3.md")
+    assert sorted(os.listdir(tmp_path / "data" / "articles"))[-2:] == [os.path.basename(path) for path in third]
+    assert len(os.listdir(tmp_path / "data" / "articles")) == 7
+    for path in first + second + third:
+        assert os.path.getsize(path) > 0
+
+
+def test_save_article_to_markdown_from_file(tmp_path, monkeypatch):
+    """测试从文件读取正文保存的结果与直接保存一致"""
+    monkeypatch.setattr(article_storage, "ROOT_DIR", str(tmp_path))
+    article = make_article(1)
+    content_path = tmp_path / "content.md"
+    content_path.write_text(article["content"], encoding="utf-8")
+
+    from_file = article_storage.save_article_to_markdown_from_file(article, str(content_path), timestamp="20230520_120000")
+    direct = article_storage.save_article_to_markdown(article, timestamp="20230520_120000")
+
+    for file_path, expected_path in zip(from_file, direct):
+        with open(file_path, encoding="utf-8") as f, open(expected_path, encoding="utf-8") as expected:
+            assert f.read() == expected.read()
+
+
+def test_save_articles_batch_bulk_mode(temp_db, monkeypatch):
+    """测试大批量导入模式下的去重、更新和索引重建"""
+    monkeypatch.setattr(article_storage, "BULK_INDEX_THRESHOLD", 2)
+    existing_id = article_storage.save_article_to_db(make_article(0))
+
+    articles = [make_article(i) for i in range(4)]
+    articles.append(dict(make_article(1), content="重复标题的最新内容"))
+    article_ids = article_storage.save_articles_batch(articles, bulk_mode=True)
+
+    assert article_ids[0] == existing_id
+    assert article_ids[1] == article_ids[4]
+    assert len(set(article_ids)) == 4
+    assert article_storage.get_article_from_db(article_ids[1])["content"] == "重复标题的最新内容"
+
+    # 唯一索引已重建，再次保存同标题文章时更新原记录
+    assert article_storage.save_article_to_db(make_article(2)) == article_ids[2]
+
+
+def test_article_writer(temp_db, tmp_path, monkeypatch):
+    """测试后台写入线程保存文件和数据库"""
+    monkeypatch.setattr(article_storage, "ROOT_DIR", str(tmp_path))
+    writer = article_storage.ArticleWriter(timestamp="20230520_120000", max_batch=2, flush_interval=0.05)
+    for i in range(5):
+        writer.put(make_article(i))
+    results = writer.close()
+
+    assert [article["title"] for article, _, _ in results] == [f"测试文章 {i}" for i in range(5)]
+    for article, (md_path, txt_path), article_id in results:
+        assert os.path.exists(md_path) and os.path.exists(txt_path)
+        assert article_storage.get_article_from_db(article_id)["title"] == article["title"]
+
+
+def test_article_writer_single_transaction(temp_db, tmp_path, monkeypatch):
+    """测试写入线程在一个事务中保存所有文章，关闭时统一提交"""
+    monkeypatch.setattr(article_storage, "ROOT_DIR", str(tmp_path))
+    writer = article_storage.ArticleWriter(max_batch=2, flush_interval=0.05, single_transaction=True)
+    for i in range(5):
+        writer.put(make_article(i))
+    results = writer.close()
+
+    assert all(article_id is not None for _, _, article_id in results)
+    assert len(article_storage.list_articles(10)) == 5
+
+
+def test_article_writer_does_not_hold_write_lock(temp_db, tmp_path, monkeypatch):
+    """测试单事务模式在运行期间不持有写锁，其他写入者可以正常写入，关闭时统一写入数据库"""
+    monkeypatch.setattr(article_storage, "ROOT_DIR", str(tmp_path))
+    monkeypatch.setattr(article_storage, "DB_CONNECTION_PRAGMAS",
+                        article_storage.DB_CONNECTION_PRAGMAS + "PRAGMA busy_timeout=50;\n")
+    article_storage.list_articles(1)
+
+    writer = article_storage.ArticleWriter(flush_interval=0.05, single_transaction=True)
+    for i in range(3):
+        writer.put(make_article(i))
+    time.sleep(0.3)
+
+    other = sqlite3.connect(article_storage.DB_PATH, isolation_level=None, timeout=0.05)
+    other.execute("BEGIN IMMEDIATE")
+    other.execute("INSERT INTO title_cache (hash, optimized) VALUES ('key', '标题')")
+    other.execute("COMMIT")
+    other.close()
+    assert len(article_storage.list_articles(10)) == 0
+
+    results = writer.close()
+    assert all(os.path.exists(md_path) for _, (md_path, _), _ in results)
+    assert all(article_id is not None for _, _, article_id in results)
+    assert len(article_storage.list_articles(10)) == 3
+
+
+def test_article_writer_reports_dead_thread(temp_db, tmp_path, monkeypatch):
+    """测试写入线程异常退出时close()抛出异常，而不是返回空列表"""
+    monkeypatch.setattr(article_storage, "ROOT_DIR", str(tmp_path))
+
+    def fail(self, batch):
+        raise OSError("磁盘已满")
+
+    monkeypatch.setattr(article_storage.ArticleWriter, "_flush", fail)
+    writer = article_storage.ArticleWriter(flush_interval=0.05)
+    writer.put(make_article(1))
+    with pytest.raises(RuntimeError):
+        writer.close()
+
+
+def test_article_cache_concurrent_saves(tmp_path, monkeypatch):
+    """测试同一进程内并发保存同一缓存键时不会互相破坏，也不会留下临时文件"""
+    monkeypatch.setattr(article_storage, "ROOT_DIR", str(tmp_path))
+    contents = [f"文章内容 {i}\n" * 2000 for i in range(8)]
+
+    async def save_all():
+        await asyncio.gather(*(article_storage.save_cached_article_async("key", content) for content in contents))
+        return await article_storage.get_cached_article_async("key")
+
+    assert asyncio.run(save_all()) in contents
+    assert os.listdir(tmp_path / "data" / "cache" / "articles") == ["key.txt"]
+
+
+def test_prune_article_cache(tmp_path, monkeypatch):
+    """测试清理过期和超出数量上限的文章缓存"""
+    monkeypatch.setattr(article_storage, "ARTICLE_CACHE_MAX_FILES", 2)
+    now = time.time()
+    for i, age_days in enumerate([0, 1, 2, 40]):
+        path = tmp_path / f"{i}.txt"
+        path.write_text("内容", encoding="utf-8")
+        os.utime(path, (now - age_days * 86400, now - age_days * 86400))
+
+    article_storage._prune_article_cache(str(tmp_path))
+    assert sorted(os.listdir(tmp_path)) == ["0.txt", "1.txt"]
+
+
+def test_get_cached_titles(temp_db, monkeypatch):
+    """测试分批读取多个标题缓存"""
+    monkeypatch.setattr(article_storage, "_TITLE_CACHE_BATCH_KEYS", 2)
+    article_storage.save_cached_titles([("a", "标题A"), ("b", "标题B"), ("c", "标题C")])
+
+    assert article_storage.get_cached_titles(["a", "x", "c", "b"]) == {"a": "标题A", "b": "标题B", "c": "标题C"}
+    assert article_storage.get_cached_titles([]) == {}
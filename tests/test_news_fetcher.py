@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试新闻获取模块
+
+测试不依赖网络的解析函数
+"""
+
+import sys
+import os
+import time
+import asyncio
+from datetime import datetime
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core import news_fetcher
+
+
+def test_parse_date():
+    """测试常见的RSS日期格式"""
+    assert news_fetcher.parse_date("2025-06-09T08:00:00Z") == "2025-06-09"
+    assert news_fetcher.parse_date("2025-06-09T23:30:00-05:00") == "2025-06-09"
+    assert news_fetcher.parse_date("Tue, 10 Jun 2025 12:00:00 GMT") == "2025-06-10"
+    assert news_fetcher.parse_date("June 3, 2025") == "2025-06-03"
+
+
+def test_parse_date_fallback():
+    """测试无法解析的日期使用当前日期，且失败结果不会缓存成固定日期"""
+    assert news_fetcher.parse_date("not a date") == datetime.now().strftime("%Y-%m-%d")
+    assert news_fetcher._parse_date_cached("not a date") is None
+
+
+def test_parse_date_fast_path_matches_dateutil():
+    """测试正则快速匹配的结果与dateutil一致"""
+    samples = [
+        "2025-06-09",
+        "2025-06-09 08:00:00",
+        "2025-12-31T23:59:59.123+08:00",
+        "Mon, 02 Jun 2025 07:00:00 +0000",
+        "2 Jun 2025 07:00:00 GMT",
+        "Wed, 1 January 2025 00:00:00 -0500",
+    ]
+    for sample in samples:
+        expected = news_fetcher.date_parser.parse(sample).strftime("%Y-%m-%d")
+        assert news_fetcher.parse_date(sample) == expected
+
+
+def test_parse_date_fast_path_rejects_impossible_dates():
+    """测试快速匹配不接受不存在的日期，交给dateutil解析失败后返回None"""
+    assert news_fetcher._parse_date_cached("2025-02-31") is None
+    assert news_fetcher._parse_date_cached("31 Feb 2025 07:00:00 GMT") is None
+    assert news_fetcher._parse_date_cached("2024-02-29") == "2024-02-29"
+
+
+def test_host_rate_limiter():
+    """测试超过突发数量的请求按速率排队等待"""
+    limiter = news_fetcher.HostRateLimiter(rate=20, burst=2)
+
+    async def acquire_all():
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+        return time.monotonic() - start
+
+    # 前2个请求立即通过，后2个按每秒20个的速率等待
+    assert 0.08 <= asyncio.run(acquire_all()) < 0.5
+
+
+def test_retry_after_seconds():
+    """测试解析Retry-After响应头"""
+    assert news_fetcher._retry_after_seconds("120") == 120
+    assert news_fetcher._retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert news_fetcher._retry_after_seconds("soon") is None
+    assert news_fetcher._retry_after_seconds(None) is None
+
+
+RSS_SAMPLE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel><title>Channel</title><link>https://example.com</link>
+<item><title>AT&amp;T and AI</title><link>https://example.com/1</link>
+<description><![CDATA[<p>Hello <b>world</b></p>]]></description><pubDate>Tue, 10 Jun 2025 12:00:00 GMT</pubDate></item>
+<item><title>Content only</title><guid isPermaLink="true">https://example.com/2</guid>
+<content:encoded><![CDATA[<div>Encoded body</div>]]></content:encoded><dc:date>2025-06-08T10:00:00Z</dc:date></item>
+</channel></rss>"""
+
+ATOM_SAMPLE = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title>
+<entry><title>Atom entry</title><link rel="related" href="https://example.com/r"/><link href="https://example.com/a"/>
+<summary type="html">&lt;p&gt;Summary&lt;/p&gt;</summary><published>2025-06-01T00:00:00Z</published></entry>
+</feed>"""
+
+
+def test_fast_parse_feed_matches_feedparser():
+    """测试流式解析RSS和Atom得到的新闻与feedparser一致"""
+    source = {"name": "测试源", "category": "test"}
+    for body in (RSS_SAMPLE, ATOM_SAMPLE):
+        fast = news_fetcher._fast_parse_feed(body)
+        assert fast is not None
+        expected = news_fetcher._parse_rss_entries(news_fetcher.feedparser.parse(body), source)
+        assert news_fetcher._parse_rss_entries(fast, source) == expected
+
+
+def test_fast_parse_feed_fallback():
+    """测试不合法的XML交给feedparser处理"""
+    body = b'<rss version="2.0"><channel><item><title>A&nbsp;B</title><link>https://example.com/1</link></item></channel></rss>'
+    assert news_fetcher._fast_parse_feed(body) is None
+    assert news_fetcher._parse_feed(body).entries[0].link == "https://example.com/1"
+
+
+def test_strip_html():
+    """测试去除摘要中的HTML标签"""
+    assert news_fetcher._strip_html("<p>Big <b>news</b> &amp; more</p>") == "Big news & more"
+    assert news_fetcher._strip_html("<div><p>One</p><p>Two</p></div>") == "One Two"
+    assert news_fetcher._strip_html("<script>track();</script>正文") == "正文"
+    assert news_fetcher._strip_html("&lt;AI&gt; news") == "<AI> news"
+    # 正文中未转义的尖括号交给HTML解析器处理
+    assert news_fetcher._strip_html("a < b and c > d") == "a < b and c > d"
+
+
+def test_normalize_link():
+    """测试去掉跟踪参数后的链接相同"""
+    normalize = news_fetcher._normalize_link
+    assert normalize("https://Example.com/a?utm_source=rss&id=1#top") == normalize("https://example.com/a?id=1")
+    assert normalize("https://example.com/a?utm_medium=feed") == "https://example.com/a"
+    assert normalize("https://example.com/a?id=1") != normalize("https://example.com/a?id=2")
+
+
+def test_parse_rss_entries_undated():
+    """测试记录没有发布日期、使用当天日期的新闻位置"""
+    body = (b'<rss version="2.0"><channel>'
+            b'<item><title>A</title><link>https://example.com/1</link><pubDate>Tue, 10 Jun 2025 12:00:00 GMT</pubDate></item>'
+            b'<item><title>B</title><link>https://example.com/2</link></item>'
+            b'</channel></rss>')
+    undated = []
+    news = news_fetcher._parse_rss_entries(news_fetcher._fast_parse_feed(body), {"name": "测试源", "category": "test"}, undated)
+
+    assert [item["published_date"] for item in news] == ["2025-06-10", datetime.now().strftime("%Y-%m-%d")]
+    assert undated == [1]
+
+
+def test_fetch_from_rss_not_modified(monkeypatch):
+    """测试内容未变化时使用缓存的新闻，没有发布日期的新闻重新使用当天日期"""
+    url = "https://example.com/feed"
+    cached_news = [{"title": "A", "link": "https://example.com/1", "published_date": "2025-06-10"},
+                   {"title": "B", "link": "https://example.com/2", "published_date": "2025-06-01"}]
+    monkeypatch.setattr(news_fetcher, "_feed_cache", {url: {"etag": "x", "modified": None,
+                                                           "news": cached_news, "undated": [1]}})
+
+    async def get_feed(session, feed_url, source):
+        return news_fetcher.feedparser.FeedParserDict(status=304, href=feed_url, entries=[], bozo=False)
+
+    monkeypatch.setattr(news_fetcher, "_get_feed", get_feed)
+    news = asyncio.run(news_fetcher.fetch_from_rss_async(None, {"name": "测试源", "url": url}))
+
+    assert [item["published_date"] for item in news] == ["2025-06-10", datetime.now().strftime("%Y-%m-%d")]
+    assert cached_news[1]["published_date"] == "2025-06-01"
+
+
+def test_save_feed_cache(tmp_path, monkeypatch):
+    """测试RSS缓存通过临时文件原子地写入，不留下临时文件"""
+    cache_path = tmp_path / "cache" / "feed_meta.json"
+    monkeypatch.setattr(news_fetcher, "FEED_CACHE_PATH", str(cache_path))
+    monkeypatch.setattr(news_fetcher, "_feed_cache", {"https://example.com/feed": {"etag": "x", "news": []}})
+    cache_path.parent.mkdir()
+    cache_path.write_bytes(b"old")
+
+    news_fetcher._save_feed_cache()
+
+    assert news_fetcher.json_loads(cache_path.read_bytes()) == {"https://example.com/feed": {"etag": "x", "news": []}}
+    assert os.listdir(cache_path.parent) == ["feed_meta.json"]
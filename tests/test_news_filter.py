@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试新闻筛选模块
+
+测试去重结果与逐对计算相似度的结果一致
+"""
+
+import sys
+import os
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from datetime import datetime
+
+import numpy as np
+
+from src.core import news_filter
+
+
+def make_news(index, title, summary):
+    """生成测试新闻数据"""
+    return {
+        "title": title,
+        "summary": summary,
+        "link": f"https://example.com/news/{index}",
+        "published_date": "2025-06-01",
+        "source": "测试源",
+        "category": "tech_news"
+    }
+
+
+TEST_NEWS = [
+    make_news(0, "OpenAI releases a new multimodal model", "OpenAI released a multimodal model with vision and audio."),
+    make_news(1, "OpenAI releases new multimodal model", "OpenAI released a multimodal model with vision and audio today."),
+    make_news(2, "OpenAI releases a new multimodal model", "A completely different summary about pricing."),
+    make_news(3, "Google DeepMind unveils robotics model", "DeepMind unveiled a robotics foundation model."),
+    make_news(4, "Nvidia announces faster inference chip", "Nvidia announced a chip for LLM inference."),
+    make_news(5, "Nvidia announces faster inference chips", "Nvidia announced chips for LLM inference."),
+    make_news(6, "", ""),
+]
+
+
+def test_pairwise_similarity_matches_calculate_similarity():
+    """测试批量计算的相似度与逐对拟合TF-IDF的结果相同"""
+    texts = [news["title"] for news in TEST_NEWS] + [news["summary"] for news in TEST_NEWS]
+    counts = news_filter._count_terms(texts)
+    for i in range(len(texts)):
+        for j in range(len(texts)):
+            if i != j:
+                expected = news_filter.calculate_similarity(texts[i], texts[j])
+                result = news_filter._pairwise_similarity(counts, np.array([i]), np.array([j]))[0]
+                assert abs(result - expected) < 1e-9
+
+
+def test_remove_duplicates():
+    """测试标题和摘要都相似或标题完全相同的新闻被去除"""
+    unique = news_filter.remove_duplicates(TEST_NEWS)
+    assert [news["link"][-1] for news in unique] == ["0", "3", "4", "5", "6"]
+
+
+def test_scan_news_ai():
+    """测试关键词扫描结果保存在新闻中并用于评分"""
+    news = make_news(7, "OpenAI and DeepMind release LLM tools", "An LLM update.")
+    assert news_filter.scan_news_ai(news)
+    assert news["_title_ai"] == 3
+    assert news["_summary_ai"] == 1
+    assert not news_filter.scan_news_ai(make_news(8, "Apple releases a new MacBook", "New laptops."))
+
+
+def test_filter_news_removes_internal_fields(monkeypatch):
+    """测试筛选过程中添加的内部字段不会留在返回结果和输入新闻中"""
+    monkeypatch.setattr(news_filter, "check_news_exists_batch", lambda pairs: [False] * len(pairs))
+    news_list = [dict(news) for news in TEST_NEWS]
+
+    filtered = news_filter.filter_news(news_list)
+    assert filtered
+    for news in filtered + news_list:
+        assert not any(key.startswith("_") for key in news)
+
+
+def test_scan_ai_matches_pattern():
+    """测试关键词扫描结果与AI_PATTERN.findall相同"""
+    texts = [news["title"] + " " + news["summary"] for news in TEST_NEWS] + [
+        "OpenAI发布GPT-4o，生成式AI和Generative AI",
+        "The analyst said HTML and URL parsing are not ai topics, but LLM-based RAG is.",
+        "stable diffusion, DALL-E, fine-tuning and Prompt Engineering",
+    ]
+    for text in texts:
+        assert news_filter.scan_ai(text) == news_filter.AI_PATTERN.findall(text)
+        assert news_filter.count_ai(text) == len(news_filter.AI_PATTERN.findall(text))
+
+
+def test_calculate_news_scores():
+    """测试按来源、发布日期和关键词数量批量计算得分"""
+    today = datetime.now().strftime("%Y-%m-%d")
+    news_list = [
+        dict(make_news(9, "OpenAI GPT LLM Claude", "AI"), category="ai_company", published_date=today),
+        dict(make_news(10, "Apple releases a new MacBook", "New laptops."), category="other", published_date="2000-01-01"),
+        dict(make_news(11, "OpenAI releases a model", ""), published_date="not a date"),
+    ]
+    scores = news_filter.calculate_news_scores(news_list)
+    assert scores.tolist() == [100.0, 20.0, 65.0]
+    assert news_filter.calculate_news_score(news_list[2]) == 65.0